@@ -0,0 +1,142 @@
+"""project health score
+
+Revision ID: 3f8d2a6c9e51
+Revises: b7e2d5a1c084
+Create Date: 2026-10-18 17:42:13.204518
+
+"""
+from datetime import date
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3f8d2a6c9e51'
+down_revision = 'b7e2d5a1c084'
+branch_labels = None
+depends_on = None
+
+# Scoring rules as of this revision; later changes to the app do not alter the backfill
+CLOSED_STATUSES = ('closed', 'resolved', 'mitigated', 'completed', 'done', 'met', 'cancelled')
+SEVERE_LEVELS = ('high', 'critical')
+RECENT_SPRINTS = 3
+
+
+def _open(status):
+    return (status or '').lower() not in CLOSED_STATUSES
+
+
+def _severe(*levels):
+    return (next((level for level in levels if level is not None), '') or '').lower() in SEVERE_LEVELS
+
+
+def _mean(values):
+    values = [value for value in values if value is not None]
+    return sum(values) / len(values) if values else None
+
+
+def _backfill():
+    # Score every existing project from its sprints, risks, milestones and escalations
+    connection = op.get_bind()
+    today = date.today()
+    projects = sa.table('projects', sa.column('id', sa.Integer), sa.column('health_score', sa.Float),
+                        sa.column('health_rating', sa.String))
+    sprints = sa.table('sprints', sa.column('project_id', sa.Integer), sa.column('sprint_number', sa.Integer),
+                       sa.column('on_time_delivery', sa.Float), sa.column('planned_story_points', sa.Integer),
+                       sa.column('completed_story_points', sa.Integer))
+    risks = sa.table('risks', sa.column('project_id', sa.Integer), sa.column('status', sa.String),
+                     sa.column('risk_level', sa.String), sa.column('impact', sa.String))
+    milestones = sa.table('milestones', sa.column('project_id', sa.Integer), sa.column('status', sa.String),
+                          sa.column('date', sa.Date), sa.column('completion_date', sa.Date))
+    escalations = sa.table('escalations', sa.column('project_id', sa.Integer), sa.column('status', sa.String),
+                           sa.column('severity', sa.String), sa.column('priority', sa.String))
+
+    recent = {}
+    for project_id, on_time, planned, completed in connection.execute(sa.select(
+        sprints.c.project_id, sprints.c.on_time_delivery, sprints.c.planned_story_points, sprints.c.completed_story_points
+    ).order_by(sprints.c.project_id, sprints.c.sprint_number.desc())):
+        listed = recent.setdefault(project_id, [])
+        if len(listed) < RECENT_SPRINTS:
+            listed.append((on_time, completed / planned if planned and completed is not None else None))
+    penalties = {}
+    for project_id, listed in recent.items():
+        on_time, completion = _mean([row[0] for row in listed]), _mean([row[1] for row in listed])
+        penalty = 0.0
+        if on_time is not None:
+            penalty += max(0.0, 100 - on_time) * 0.3
+        if completion is not None:
+            penalty += max(0.0, 1 - completion) * 30
+        penalties[project_id] = penalty
+
+    def add(project_id, penalty):
+        penalties[project_id] = penalties.get(project_id, 0.0) + penalty
+
+    def tally(rows):
+        counts = {}
+        for project_id, severe in rows:
+            severe_count, other_count = counts.get(project_id, (0, 0))
+            counts[project_id] = (severe_count + severe, other_count + (not severe))
+        return counts
+
+    for project_id, (severe, other) in tally(
+        (project_id, _severe(level, impact))
+        for project_id, status, level, impact in connection.execute(
+            sa.select(risks.c.project_id, risks.c.status, risks.c.risk_level, risks.c.impact))
+        if project_id is not None and _open(status)
+    ).items():
+        add(project_id, min(severe * 10 + other * 4, 30))
+    overdue = {}
+    for project_id, status, due, completed in connection.execute(sa.select(
+        milestones.c.project_id, milestones.c.status, milestones.c.date, milestones.c.completion_date
+    )):
+        if project_id is not None and _open(status) and completed is None and due is not None and due < today:
+            overdue[project_id] = overdue.get(project_id, 0) + 1
+    for project_id, count in overdue.items():
+        add(project_id, min(count * 8, 24))
+    for project_id, (severe, other) in tally(
+        (project_id, _severe(severity, priority))
+        for project_id, status, severity, priority in connection.execute(
+            sa.select(escalations.c.project_id, escalations.c.status, escalations.c.severity, escalations.c.priority))
+        if project_id is not None and _open(status)
+    ).items():
+        add(project_id, min(severe * 12 + other * 5, 36))
+
+    project_ids = set(connection.execute(sa.select(projects.c.id)).scalars())
+    rows = []
+    for project_id, penalty in penalties.items():
+        if project_id not in project_ids or not penalty:
+            continue
+        score = round(max(0.0, 100 - penalty), 1)
+        rating = 'Green' if score >= 75 else 'Amber' if score >= 50 else 'Red'
+        rows.append({'project_id': project_id, 'score': score, 'rating': rating})
+    # Projects with no signals keep the server defaults, 100 and Green
+    if rows:
+        connection.execute(
+            projects.update().where(projects.c.id == sa.bindparam('project_id')).values(
+                health_score=sa.bindparam('score'), health_rating=sa.bindparam('rating')
+            ),
+            rows
+        )
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('health_score', sa.Float(), server_default='100', nullable=False))
+        batch_op.add_column(sa.Column('health_rating', sa.String(), server_default='Green', nullable=False))
+        batch_op.create_index('ix_projects_health_rating_id', ['health_rating', 'id'], unique=False)
+        batch_op.create_index('ix_projects_health_score_id', ['health_score', 'id'], unique=False)
+
+    # ### end Alembic commands ###
+    _backfill()
+
+
+def downgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        batch_op.drop_index('ix_projects_health_score_id')
+        batch_op.drop_index('ix_projects_health_rating_id')
+        batch_op.drop_column('health_rating')
+        batch_op.drop_column('health_score')
+
+    # ### end Alembic commands ###
@@ -0,0 +1,125 @@
+"""resource skill index
+
+Revision ID: 8e5a0d3b7c12
+Revises: 6c1e4b9d2f07
+Create Date: 2026-10-18 19:08:31.552190
+
+"""
+import json
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e5a0d3b7c12'
+down_revision = '6c1e4b9d2f07'
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def _split(value):
+    return value.split(',')
+
+
+def _json_or_split(value):
+    # primary_skills holds a JSON array, a JSON scalar or a comma separated list
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return value.split(',')
+    return [str(item) for item in parsed] if isinstance(parsed, list) else [str(parsed)]
+
+
+# Skill columns as of this revision -> parser of their raw text
+SKILL_COLUMNS = {
+    'skills': _split,
+    'primary_skills': _json_or_split,
+    'secondary_skills': _split,
+    'skillset': _split,
+}
+
+
+def _backfill():
+    # Index the skill columns of every existing resource, BATCH_SIZE resources at a time
+    connection = op.get_bind()
+    resources = sa.table('resources', sa.column('id', sa.Integer), *[sa.column(kind, sa.String) for kind in SKILL_COLUMNS])
+    skills = sa.table('skills', sa.column('id', sa.Integer), sa.column('name', sa.String), sa.column('key', sa.String))
+    links = sa.table('resource_skills', sa.column('resource_id', sa.Integer), sa.column('skill_id', sa.Integer),
+                     sa.column('kind', sa.String))
+    ids = {}
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(resources.c.id, *[resources.c[kind] for kind in SKILL_COLUMNS])
+            .where(resources.c.id > last_id).order_by(resources.c.id).limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        listed = []
+        for resource_id, *values in rows:
+            for (kind, parse), raw in zip(SKILL_COLUMNS.items(), values):
+                names = {}
+                for name in parse(raw) if raw else ():
+                    name = name.strip()
+                    if name:
+                        names.setdefault(name.lower(), name)
+                listed += [(resource_id, kind, key, name) for key, name in names.items()]
+        new = {}
+        for _, _, key, name in listed:
+            if key not in ids:
+                new.setdefault(key, name)
+        if new:
+            connection.execute(skills.insert(), [{'name': name, 'key': key} for key, name in new.items()])
+            ids.update(connection.execute(sa.select(skills.c.key, skills.c.id).where(skills.c.key.in_(list(new)))).all())
+        if listed:
+            connection.execute(links.insert(), [{'resource_id': resource_id, 'kind': kind, 'skill_id': ids[key]}
+                                                for resource_id, kind, key, _ in listed])
+        last_id = rows[-1][0]
+
+
+def upgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('skills',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('key', sa.String(), nullable=False),
+    sa.Column('row_updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key')
+    )
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_skills_row_updated_at'), ['row_updated_at'], unique=False)
+
+    op.create_table('resource_skills',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('resource_id', sa.Integer(), nullable=False),
+    sa.Column('skill_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(), nullable=False),
+    sa.Column('row_updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=True),
+    sa.ForeignKeyConstraint(['resource_id'], ['resources.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('resource_id', 'kind', 'skill_id', name='uq_resource_skills_resource_id_kind_skill_id')
+    )
+    with op.batch_alter_table('resource_skills', schema=None) as batch_op:
+        batch_op.create_index('ix_resource_skills_skill_id_kind_resource_id', ['skill_id', 'kind', 'resource_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_resource_skills_row_updated_at'), ['row_updated_at'], unique=False)
+
+    # ### end Alembic commands ###
+    _backfill()
+
+
+def downgrade():
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('resource_skills', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_resource_skills_row_updated_at'))
+        batch_op.drop_index('ix_resource_skills_skill_id_kind_resource_id')
+
+    op.drop_table('resource_skills')
+    with op.batch_alter_table('skills', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_skills_row_updated_at'))
+
+    op.drop_table('skills')
+    # ### end Alembic commands ###
@@ -0,0 +1,70 @@
+"""project json documents
+
+Revision ID: e1a9f4c27d63
+Revises: c4e7a1d93b25
+Create Date: 2026-10-18 14:12:36.482051
+
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e1a9f4c27d63'
+down_revision = 'c4e7a1d93b25'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ('kpis', 'velocity_trend', 'teams', 'engineering_metrics')
+JSON_DOCUMENT = sa.JSON(none_as_null=True).with_variant(postgresql.JSONB(none_as_null=True), 'postgresql')
+
+
+def _decode(text):
+    # Stored text that is not JSON ("Upward", "92% On-Time") becomes a JSON string
+    if text is None or not text.strip():
+        return None
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def _encode(value):
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+
+def _convert(source_type, target_type, convert):
+    # Copy each column through a new column of the target type, then swap it in
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        for column in COLUMNS:
+            batch_op.add_column(sa.Column(f'{column}_new', target_type, nullable=True))
+
+    projects = sa.table('projects', sa.column('id', sa.Integer),
+                        *[sa.column(column, source_type) for column in COLUMNS],
+                        *[sa.column(f'{column}_new', target_type) for column in COLUMNS])
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(projects.c.id, *[projects.c[column] for column in COLUMNS])).all()
+    for project_id, *values in rows:
+        connection.execute(
+            projects.update().where(projects.c.id == project_id).values(
+                {f'{column}_new': convert(value) for column, value in zip(COLUMNS, values)}
+            )
+        )
+
+    with op.batch_alter_table('projects', schema=None) as batch_op:
+        for column in COLUMNS:
+            batch_op.drop_column(column)
+            batch_op.alter_column(f'{column}_new', new_column_name=column)
+
+
+def upgrade():
+    _convert(sa.String(), JSON_DOCUMENT, _decode)
+
+
+def downgrade():
+    _convert(JSON_DOCUMENT, sa.String(), _encode)
@@ -0,0 +1,127 @@
+# Benchmark for GET /dashboard at different headcounts.
+#
+# Seeds a scratch database with N synthetic resources, then reports median
+# latency and peak Python memory (tracemalloc) for the endpoint, next to the
+# cost of hydrating every Resource row as an ORM object (what the dashboard did
+# before the aggregations moved into SQL).
+#
+# The scratch database is dropped and recreated for every size, so never point
+# BENCH_DATABASE_URL at a real database.
+#
+#   python scripts/benchmark_dashboard.py                 # 1k, 10k, 100k on SQLite
+#   BENCH_DATABASE_URL=postgresql://.../bench python scripts/benchmark_dashboard.py 1000 10000
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+BENCH_DATABASE_URL = os.environ.get('BENCH_DATABASE_URL', 'sqlite:///dashboard_bench.db')
+# Keep the default application engine away from the real database as well.
+os.environ['DATABASE_URL'] = BENCH_DATABASE_URL
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from flask import Flask
+from sqlalchemy import create_engine, insert
+from src.infrastructure.db import SessionLocal
+from src.presentation.extensions import db
+from src.presentation.dashboard_service import dashboard_bp
+from src.application.dashboard_sections import dashboard_cache
+from src.domain.models import Resource, Project
+from src.domain.models.sprint import Sprint  # noqa: F401 (resolves Project.sprints)
+
+SIZES = [int(n) for n in sys.argv[1:]] or [1000, 10000, 100000]
+RUNS = 5
+
+
+def resource_rows(n):
+    rnd = random.Random(n)
+    for i in range(n):
+        intern = rnd.random() < 0.1
+        yield {
+            'employee_id': f'BENCH{i:07d}',
+            'full_name': f'Resource {i}',
+            'designation': rnd.choice(['Engineer', 'Senior Engineer', 'QA', 'Lead', 'Architect']),
+            'department': rnd.choice(['Engineering', 'QA', 'DevOps', 'Data']),
+            'seniority_level': rnd.choice(['Junior', 'Mid', 'Senior', 'Lead']),
+            'location': rnd.choice(['Bangalore', 'Pune', 'Hyderabad', 'Chennai', 'Delhi', 'Mumbai']),
+            'joining_date': date(2020, 1, 1) + timedelta(days=rnd.randint(0, 2000)),
+            'billable_status': (not intern) and rnd.random() < 0.7,
+            'is_intern': intern,
+            'status': 'Active',
+            'monthly_cost': float(rnd.randint(2000, 12000)),
+            'skills': ','.join(rnd.sample(['Python', 'Java', 'React', 'SQL', 'AWS', 'Go'], 2)),
+            'client': rnd.choice(['ClientA', 'ClientB', 'ClientC']),
+            'current_engagement': rnd.choice(['ClientA', 'ClientB', 'Internal']),
+            'bench_reason': rnd.choice(['Awaiting project', 'Skill gap', None]),
+            'bench_aging_bucket': rnd.choice(['< 30', '30-59', '60-89', '>= 90', None]),
+            'bench_days': rnd.randint(0, 120),
+            'bench_start_date': date(2024, 1, 1) + timedelta(days=rnd.randint(0, 365)),
+            'utilization_rate': float(rnd.randint(40, 100)),
+            'productivity_score': rnd.random() * 5,
+            'release_date': date.today() + timedelta(days=rnd.randint(-60, 60)),
+        }
+
+
+def seed(engine, n):
+    db.metadata.drop_all(engine)
+    db.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Project), [{'name': f'Project {i}', 'status': 'Active'} for i in range(50)])
+        batch = []
+        for row in resource_rows(n):
+            batch.append(row)
+            if len(batch) == 5000:
+                conn.execute(insert(Resource), batch)
+                batch = []
+        if batch:
+            conn.execute(insert(Resource), batch)
+
+
+def measure(fn):
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return statistics.median(timings) * 1000, peak / (1024 * 1024)
+
+
+def hydrate_all():
+    session = SessionLocal()
+    try:
+        session.query(Resource).all()
+    finally:
+        session.close()
+
+
+def main():
+    engine = create_engine(BENCH_DATABASE_URL)
+    SessionLocal.configure(bind=engine)
+    app = Flask(__name__)
+    app.register_blueprint(dashboard_bp)
+    client = app.test_client()
+
+    def fetch_dashboard():
+        # Measure the uncached build; a warm cache would only time the lookup
+        dashboard_cache.clear()
+        response = client.get('/dashboard')
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+    print(f"{'resources':>10} {'dashboard ms':>14} {'dashboard MiB':>14} {'hydrate ms':>12} {'hydrate MiB':>12}")
+    for n in SIZES:
+        seed(engine, n)
+        dash_ms, dash_mib = measure(fetch_dashboard)
+        hydrate_ms, hydrate_mib = measure(hydrate_all)
+        print(f"{n:>10} {dash_ms:>14.1f} {dash_mib:>14.1f} {hydrate_ms:>12.1f} {hydrate_mib:>12.1f}")
+    db.metadata.drop_all(engine)
+
+
+if __name__ == '__main__':
+    main()
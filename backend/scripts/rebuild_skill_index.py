@@ -0,0 +1,28 @@
+# Rebuild the resource_skills index from the resources' skill columns.
+#
+# The index is kept current by ORM events on Resource; run this after writing
+# skills, primary_skills, secondary_skills or skillset outside the ORM (SQL
+# imports, manual fixes).
+#
+#   python scripts/rebuild_skill_index.py
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.infrastructure.db import SessionLocal
+from src.application.skill_index import rebuild_skill_index
+
+
+def main():
+    session = SessionLocal()
+    try:
+        count = rebuild_skill_index(session.connection())
+        session.commit()
+    finally:
+        session.close()
+    print(f"Indexed the skills of {count} resources.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# Recompute the stored project health scores.
+#
+# Scores are kept current by ORM events and sprint ingestion, but a milestone
+# becomes overdue when its date passes, with no write to trigger that. Run this
+# once a day, shortly after midnight, so health_score/health_rating (and the
+# /projects?sort=health_score order) reflect milestones that went overdue:
+#
+#   5 0 * * * cd /path/to/backend && python scripts/refresh_project_health.py
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.infrastructure.db import SessionLocal
+from src.application.project_health import refresh_project_health
+
+
+def main():
+    session = SessionLocal()
+    try:
+        count = refresh_project_health(session.connection())
+        session.commit()
+    finally:
+        session.close()
+    print(f"Updated the health of {count} projects.")
+
+
+if __name__ == "__main__":
+    main()
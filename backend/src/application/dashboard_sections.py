@@ -0,0 +1,415 @@
+import os
+from datetime import datetime
+from collections import defaultdict, namedtuple
+from functools import cached_property
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from src.application import resource_analytics as analytics
+from src.application.financials import financial_rollup
+from src.application.project_health import RATINGS as HEALTH_RATINGS
+from src.application.resource_lists import RESOURCE_LISTS
+from src.application.skill_index import skill_counts
+from src.application.resource_aggregation import (
+    Grouping, aggregate_resources, mean, month_key, week_key
+)
+from src.domain.models import Resource, Project, Intern
+from src.domain.models.escalation import Escalation
+from src.domain.models.kpi import KPI
+from src.infrastructure.cache import LRUCache, table_versions, track_table_versions
+from src.infrastructure.metrics import Histogram, measure
+
+# Resource breakdowns used by the breakdowns, bench, billable and interns
+# sections; evaluated together by aggregate_resources.
+RESOURCE_GROUPINGS = (
+    Grouping('seniority', key='seniority_level'),
+    Grouping('department', key='department'),
+    Grouping('designation', key='designation'),
+    Grouping('location', key='location'),
+    Grouping('engagement', key='current_engagement'),
+    Grouping('joining_month', key='joining_date', key_func=month_key, window='joining_date'),
+    Grouping('bench_reason', key='bench_reason', where='non_billable', sums=('cost',)),
+    Grouping('bench_bucket', key='bench_aging_bucket', where='non_billable', sums=('cost',)),
+    Grouping('bench_week', key='bench_start_date', where='non_billable', key_func=week_key, window='bench_start_date'),
+    Grouping('bench_location', key='location', where='non_billable', sums=('cost',)),
+    Grouping('billable_month', key='joining_date', where='billable', key_func=month_key, sums=('utilization', 'productivity'),
+             window='joining_date'),
+    Grouping('billable_client', key='client', where='billable'),
+    Grouping('intern_month', key='internship_start_date', where='intern', key_func=month_key, window='internship_start_date'),
+    Grouping('intern_location', key='location', where='intern'),
+)
+
+# Rows of each embedded resource list returned inline by /dashboard
+DASHBOARD_LIST_LIMIT = int(os.getenv('DASHBOARD_LIST_LIMIT', '25'))
+
+ACTIVE_PROJECT_STATUSES = ['On Track', 'At Risk', 'Critical', 'Delayed', 'active', 'Active']
+
+DEFAULT_BENCH_AGING = [
+    {"bucket": "< 30", "count": 5, "riskLevel": "low"},
+    {"bucket": "30-59", "count": 3, "riskLevel": "medium"},
+    {"bucket": "60-89", "count": 2, "riskLevel": "high"},
+    {"bucket": ">= 90", "count": 1, "riskLevel": "critical"},
+]
+
+
+class DashboardContext:
+    """Per-request state shared between dashboard sections.
+
+    Queries needed by more than one section are evaluated on first use and then
+    reused, so a request only pays for the sections it asks for. `date_range`
+    restricts the dated series (joining, bench start, internship start and
+    release dates); headcount totals and breakdowns stay over all resources.
+    """
+
+    def __init__(self, db: Session, date_range=None):
+        self.db = db
+        self.date_range = date_range
+
+    @cached_property
+    def summary(self):
+        return analytics.headcount_summary(self.db)
+
+    @cached_property
+    def aging_rows(self):
+        return analytics.bench_aging_rows(self.db)
+
+    @cached_property
+    def aggregates(self):
+        # Every resource breakdown comes from one projected query and one pass,
+        # plus one query per windowed date column when a range is requested
+        return aggregate_resources(self.db, *RESOURCE_GROUPINGS, date_range=self.date_range)
+
+
+def projects_section(ctx: DashboardContext):
+    projects = ctx.db.query(Project).all()
+    # Fetch the KPIs of every listed project in one query and group them by project
+    kpis_by_project = defaultdict(list)
+    project_ids = [project.id for project in projects]
+    if project_ids:
+        kpi_rows = (
+            ctx.db.query(KPI.project_id, KPI.name, KPI.title, KPI.value)
+            .filter(KPI.project_id.in_(project_ids))
+            .order_by(KPI.id)
+        )
+        for project_id, name, title, value in kpi_rows:
+            kpis_by_project[project_id].append({'name': name, 'title': title, 'value': value})
+    project_cards = []
+    for project in projects:
+        # Safely handle None for numeric fields
+        on_time_percentage = getattr(project, 'on_time_percentage', None)
+        if on_time_percentage is None:
+            on_time_percentage = 0
+        progress = getattr(project, 'progress', None)
+        if progress is None:
+            progress = 0
+        team_size = getattr(project, 'team_size', None)
+        if team_size is None:
+            team_size = 0
+        project_cards.append({
+            'id': project.id,
+            'name': project.name,
+            'description': project.description,
+            'customer': project.customer,
+            'status': project.status,
+            'healthStatus': getattr(project, 'health_status', 'Unknown'),
+            'healthScore': project.health_score,
+            'healthRating': project.health_rating,
+            'onTimePercentage': on_time_percentage,
+            'progress': progress,
+            'teamSize': team_size,
+            'kpis': kpis_by_project[project.id]
+        })
+    return {
+        'projectCards': project_cards,
+        'active_projects': [p for p in project_cards if p['status'] in ACTIVE_PROJECT_STATUSES],
+    }
+
+
+def dashboard_kpis_section(ctx: DashboardContext):
+    total, active, critical, on_track, *by_rating = ctx.db.query(
+        func.count(),
+        func.count().filter(Project.status.in_(ACTIVE_PROJECT_STATUSES)),
+        func.count().filter(Project.status == 'Critical'),
+        func.count().filter(Project.status == 'On Track'),
+        *[func.count().filter(Project.health_rating == rating) for rating, _ in HEALTH_RATINGS],
+    ).select_from(Project).one()
+    return {
+        'dashboard_kpis': {
+            'totalProjects': total,
+            'activeProjects': active,
+            'criticalProjects': critical,
+            'onTrackProjects': on_track,
+            'healthRatings': {rating: count for (rating, _), count in zip(HEALTH_RATINGS, by_rating)},
+        }
+    }
+
+
+def resources_section(ctx: DashboardContext):
+    summary = ctx.summary
+    total_resources = summary['total']
+    non_billable = summary['non_billable']
+    total_interns = summary['interns']
+    interns_assigned = summary['interns_assigned']
+    return {
+        'total_resources': total_resources,
+        'active_resources': summary['active'],
+        'non_billable_resources_count': non_billable,
+        'billable_resources_count': summary['billable'],
+        'utilization_rate': round((summary['active'] / total_resources) * 100, 1) if total_resources else 0,
+        'non_billable_cost_drain': summary['non_billable_cost'],
+        'avg_bench_days': round(summary['non_billable_bench_days'] / non_billable, 1) if non_billable else 0,
+        'reallocation_opportunities': summary['reallocation_opportunities'],
+        'total_interns': total_interns,
+        'interns_assigned': interns_assigned,
+        'interns_unassigned': total_interns - interns_assigned,
+        'intern_conversion_rate': round((interns_assigned / total_interns) * 100, 1) if total_interns else 0,
+    }
+
+
+def counts(groups):
+    """[(key, count)] of an aggregate_resources result, ordered by key."""
+    return [(key, entry[0]) for key, entry in sorted(groups.items())]
+
+
+def by_month_label(groups):
+    """Month-keyed groups in chronological order, relabelled '%b %Y'."""
+    return [(analytics.month_label(*month), entry) for month, entry in sorted(groups.items())]
+
+
+def first_page(ctx: DashboardContext, name):
+    """First page of a RESOURCE_LISTS list plus a `<name>Page` entry for fetching the rest."""
+    page = RESOURCE_LISTS[name].page(ctx.db, limit=DASHBOARD_LIST_LIMIT, date_range=ctx.date_range)
+    query = ctx.date_range.query_string() if ctx.date_range else ''
+    return {
+        name: page['items'],
+        f'{name}Page': {
+            'total': page['total'],
+            'nextCursor': page['nextCursor'],
+            'href': f'/dashboard/lists/{name}' + (f'?{query}' if query else ''),
+        },
+    }
+
+
+def breakdowns_section(ctx: DashboardContext):
+    agg = ctx.aggregates
+    return {
+        'skillData': skill_counts(ctx.db),
+        'seniorityData': [{'seniority': k, 'count': v} for k, v in counts(agg['seniority'])],
+        'agingData': ctx.aging_rows,
+        'departmentData': analytics.percentages(counts(agg['department'])),
+        'designationData': [{'name': k, 'count': v} for k, v in counts(agg['designation'])],
+        'locationData': analytics.percentages(counts(agg['location'])),
+        'engagementData': [{'engagement': k, 'count': v} for k, v in counts(agg['engagement'])],
+        'monthly_growth_data': [{'month': month, 'count': entry[0]} for month, entry in by_month_label(agg['joining_month'])],
+    }
+
+
+def bench_section(ctx: DashboardContext):
+    agg = ctx.aggregates
+    bucket_costs = {bucket: entry[1] for bucket, entry in agg['bench_bucket'].items()}
+    return {
+        'bench_reason_data': [
+            {'reason': reason, 'count': count, 'cost': cost}
+            for reason, (count, cost) in sorted(agg['bench_reason'].items())
+        ],
+        'bench_aging_data': [
+            {
+                'bucket': item.get('bucket'),
+                'count': item.get('count'),
+                'cost': bucket_costs.get(item.get('bucket'), 0),
+                'riskLevel': item.get('riskLevel')
+            }
+            for item in (ctx.aging_rows or DEFAULT_BENCH_AGING)
+        ],
+        'weekly_movement_data': [
+            {'week': week, 'moved': count, 'added': count}
+            for week, count in counts(agg['bench_week'])
+        ],
+        'non_billable_location_distribution': [
+            {'location': location, 'count': count, 'cost': cost}
+            for location, (count, cost) in sorted(agg['bench_location'].items())
+        ],
+        **first_page(ctx, 'non_billable_resources_list'),
+    }
+
+
+def billable_section(ctx: DashboardContext):
+    agg = ctx.aggregates
+    # Utilization and productivity trends (monthly averages for billable resources)
+    trend = by_month_label(agg['billable_month'])
+    return {
+        **first_page(ctx, 'billable_resources'),
+        'utilization_trend': [
+            {'week': month, 'utilization': round(mean(entry, 1), 1)} for month, entry in trend
+        ],
+        'client_allocation': [
+            {'client': client, 'resources': count} for client, count in counts(agg['billable_client'])
+        ],
+        'productivity_trend': [
+            {'month': month, 'productivity': round(mean(entry, 2), 1), 'allocation': round(mean(entry, 2), 1)}
+            for month, entry in trend
+        ],
+    }
+
+
+def interns_section(ctx: DashboardContext):
+    agg = ctx.aggregates
+    total_interns = ctx.summary['interns']
+    interns_assigned = ctx.summary['interns_assigned']
+    intern_details = first_page(ctx, 'intern_details_list')
+    return {
+        **first_page(ctx, 'internsData'),
+        # Resource has no learning/productive hour columns, so the averages are zero
+        'avg_learning_hours': 0.0 if total_interns else 0,
+        'avg_productive_hours': 0.0 if total_interns else 0,
+        'intern_conversion_funnel': [
+            {'name': 'Total', 'value': total_interns, 'fill': '#8884d8'},
+            {'name': 'Assigned', 'value': interns_assigned, 'fill': '#82ca9d'},
+            {'name': 'Unassigned', 'value': total_interns - interns_assigned, 'fill': '#ffc658'}
+        ],
+        'intern_monthly_conversion': [
+            {'month': month, 'conversionRate': entry[0]} for month, entry in by_month_label(agg['intern_month'])
+        ],
+        # Charted for the interns on the inline page of intern_details_list
+        'intern_learning_vs_productive': [
+            {'intern': item['name'], 'learning': item['learningHours'], 'productive': item['productiveHours']}
+            for item in intern_details['intern_details_list']
+        ],
+        'intern_location_distribution': [
+            {'location': location, 'count': count} for location, count in counts(agg['intern_location'])
+        ],
+        **intern_details,
+    }
+
+
+def releases_section(ctx: DashboardContext):
+    return first_page(ctx, 'upcomingReleases')
+
+
+def financials_section(ctx: DashboardContext):
+    return financial_rollup(ctx.db, ctx.date_range)
+
+
+# Section name -> builder. Each builder returns a block of top-level /dashboard
+# keys and only runs when its section is requested.
+SECTIONS = {
+    'projects': projects_section,
+    'dashboard_kpis': dashboard_kpis_section,
+    'resources': resources_section,
+    'breakdowns': breakdowns_section,
+    'bench': bench_section,
+    'billable': billable_section,
+    'interns': interns_section,
+    'releases': releases_section,
+    'financials': financials_section,
+}
+
+
+def parse_sections(raw):
+    """Section names from a comma-separated `sections=` value (all when empty).
+
+    Raises ValueError for unknown names.
+    """
+    if not raw:
+        return list(SECTIONS)
+    names = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in names if name not in SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown dashboard sections: {', '.join(unknown)}. Valid sections: {', '.join(SECTIONS)}")
+    return list(dict.fromkeys(names))
+
+
+# Tables each section reads; a cached section is reused until one of them changes.
+SECTION_TABLES = {
+    'projects': (Project.__tablename__, KPI.__tablename__),
+    'dashboard_kpis': (Project.__tablename__,),
+    'resources': (Resource.__tablename__,),
+    'breakdowns': (Resource.__tablename__,),
+    'bench': (Resource.__tablename__,),
+    'billable': (Resource.__tablename__,),
+    'interns': (Resource.__tablename__,),
+    'releases': (Resource.__tablename__,),
+    'financials': (Resource.__tablename__,),
+}
+
+track_table_versions(Resource, Project, KPI, Intern, Escalation)
+
+dashboard_cache = LRUCache(
+    maxsize=int(os.getenv('DASHBOARD_CACHE_SIZE', '64')),
+    ttl=float(os.getenv('DASHBOARD_CACHE_TTL', '300'))
+)
+
+
+SectionTiming = namedtuple('SectionTiming', 'name wall db queries cached')
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+section_seconds = Histogram(
+    'dashboard_section_seconds', 'Wall time spent building a dashboard section', ('section', 'cache'), SECONDS_BUCKETS
+)
+section_db_seconds = Histogram(
+    'dashboard_section_db_seconds', 'Database time spent building a dashboard section', ('section', 'cache'), SECONDS_BUCKETS
+)
+section_queries = Histogram(
+    'dashboard_section_queries', 'SQL statements executed building a dashboard section', ('section', 'cache'),
+    (0, 1, 2, 5, 10, 20, 50, 100)
+)
+
+
+def section_key(name, date_range=None):
+    """Cache key for a section: its name and date range plus the versions of the tables it reads.
+
+    upcomingReleases depends on today's date, so the date is part of every key.
+    """
+    return (
+        name, datetime.now().date(), date_range.key if date_range else None,
+        table_versions.snapshot(SECTION_TABLES[name])
+    )
+
+
+def _build_section(ctx, name, cache):
+    """(block, served from cache) for one section."""
+    if cache is None:
+        return SECTIONS[name](ctx), False
+    # The key is taken before building, so a write that lands mid-build
+    # leaves the block under the old versions.
+    key = section_key(name, ctx.date_range)
+    block = cache.get(key)
+    if block is not None:
+        return block, True
+    block = SECTIONS[name](ctx)
+    cache.set(key, block)
+    return block, False
+
+
+def build_sections(db: Session, sections, cache=dashboard_cache, timings=None, date_range=None):
+    """{section name: block} for the requested sections.
+
+    Every section is measured into the process-wide section histograms; when a
+    `timings` list is given a SectionTiming is appended to it per section.
+    Queries shared through DashboardContext count towards the first section
+    that needs them.
+    """
+    ctx = DashboardContext(db, date_range)
+    blocks = {}
+    for name in sections:
+        with measure() as m:
+            blocks[name], cached = _build_section(ctx, name, cache)
+        cache_label = 'hit' if cached else 'miss'
+        section_seconds.observe(m.wall, name, cache_label)
+        section_db_seconds.observe(m.db, name, cache_label)
+        section_queries.observe(m.queries, name, cache_label)
+        if timings is not None:
+            timings.append(SectionTiming(name, m.wall, m.db, m.queries, cached))
+    return blocks
+
+
+def sections_for_tables(tables):
+    """Sections that read any of the given tables."""
+    tables = set(tables)
+    return [name for name, section_tables in SECTION_TABLES.items() if tables.intersection(section_tables)]
+
+
+def build_dashboard(db: Session, sections, cache=dashboard_cache, timings=None, date_range=None):
+    payload = {}
+    for block in build_sections(db, sections, cache, timings, date_range).values():
+        payload.update(block)
+    return payload
@@ -0,0 +1,175 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from src.application.dashboard_sections import build_sections, sections_for_tables
+from src.infrastructure.cache import table_versions
+
+
+def format_event(event_id, event, data):
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class DashboardStream:
+    """Fan-out of dashboard section changes to Server-Sent Events clients.
+
+    A single publisher thread rebuilds the sections affected by a committed
+    write once per date window that connected clients are watching, and
+    appends the result to a bounded event history. Connected clients only read
+    from that history, so the server-side work grows with the number of
+    changes and distinct windows rather than the number of clients. Event ids
+    carry a per-process boot token; a client reconnecting with a Last-Event-ID
+    that is still in the history (and whose window was built meanwhile) gets
+    the events it missed, anything else gets a fresh snapshot. A connected
+    client that falls behind the history also gets a snapshot.
+    """
+
+    def __init__(self, session_factory, history=256, debounce=0.5, heartbeat=15):
+        self._session_factory = session_factory
+        self._history = deque(maxlen=history)
+        self._debounce = debounce
+        self.heartbeat = heartbeat
+        self._boot = uuid.uuid4().hex[:8]
+        self._seq = 0
+        self._pending = set()
+        # Window key -> (DateRange or None, Counter of the sections its clients watch)
+        self._windows = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        table_versions.add_listener(self._tables_changed)
+
+    def _event_id(self, seq):
+        return f"{self._boot}-{seq}"
+
+    def _tables_changed(self, tables):
+        with self._cond:
+            if self._thread is None:
+                return
+            self._pending.update(tables)
+            self._cond.notify_all()
+
+    def _ensure_started(self):
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._publish_loop, name='dashboard-stream', daemon=True)
+                self._thread.start()
+
+    def _publish_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            # Let a burst of writes settle into one event
+            time.sleep(self._debounce)
+            with self._cond:
+                tables, self._pending = self._pending, set()
+            self._publish(tables)
+
+    def _publish(self, tables):
+        """Build the sections the changed tables affect for each watched window and record them."""
+        with self._cond:
+            windows = {key: (date_range, set(+watched)) for key, (date_range, watched) in self._windows.items()}
+        changed = sections_for_tables(tables)
+        if not changed:
+            return
+        built = {}
+        session = self._session_factory()
+        try:
+            for key, (date_range, watched) in windows.items():
+                sections = [name for name in changed if name in watched]
+                if sections:
+                    built[key] = build_sections(session, sections, date_range=date_range)
+        except Exception:
+            logging.exception("Dashboard stream failed to rebuild sections %s", changed)
+            return
+        finally:
+            session.close()
+        # Recorded even when nothing was built, so late resumes of unwatched windows get a snapshot
+        with self._cond:
+            self._seq += 1
+            self._history.append((self._seq, set(changed), built))
+            self._cond.notify_all()
+
+    def _oldest_resumable(self):
+        """Lowest sequence number a client can resume after without a snapshot."""
+        return (self._history[0][0] if self._history else self._seq + 1) - 1
+
+    def _watch(self, window, date_range, sections):
+        self._windows.setdefault(window, (date_range, Counter()))[1].update(sections)
+
+    def _unwatch(self, window, sections):
+        watched = self._windows[window][1]
+        watched.subtract(sections)
+        if not +watched:
+            del self._windows[window]
+
+    def _resume_point(self, last_event_id, window, wanted):
+        """Sequence number to resume after, or None when a snapshot is needed."""
+        if not last_event_id:
+            return None
+        boot, _, seq = last_event_id.partition('-')
+        if boot != self._boot or not seq.isdigit():
+            return None
+        seq = int(seq)
+        if seq > self._seq or seq < self._oldest_resumable():
+            return None
+        # Changes made while no client watched this window were never built for it
+        for entry_seq, changed, built in self._history:
+            if entry_seq > seq and not (changed & wanted) <= built.get(window, {}).keys():
+                return None
+        return seq
+
+    def events(self, sections, last_event_id=None, date_range=None):
+        """Generator of SSE frames for a client interested in `sections` over `date_range`."""
+        self._ensure_started()
+        wanted = set(sections)
+        window = date_range.key if date_range else None
+        with self._cond:
+            self._watch(window, date_range, sections)
+            cursor = self._resume_point(last_event_id, window, wanted)
+            snapshot_seq = self._seq
+        try:
+            yield f"retry: {self.heartbeat * 1000}\n\n"
+            if cursor is None:
+                cursor = snapshot_seq
+                yield self._snapshot(cursor, sections, date_range)
+            while True:
+                with self._cond:
+                    if self._seq <= cursor:
+                        self._cond.wait(timeout=self.heartbeat)
+                    # A slow client whose position left the history has missed events for good
+                    behind = cursor < self._oldest_resumable()
+                    if behind:
+                        cursor = self._seq
+                    missed = [] if behind else [(seq, built) for seq, _, built in self._history if seq > cursor]
+                if behind:
+                    yield self._snapshot(cursor, sections, date_range)
+                    continue
+                if not missed:
+                    yield ": heartbeat\n\n"
+                    continue
+                for seq, built in missed:
+                    cursor = seq
+                    changed = {name: block for name, block in built.get(window, {}).items() if name in wanted}
+                    if changed:
+                        yield format_event(self._event_id(seq), 'sections', self._payload(changed))
+        finally:
+            with self._cond:
+                self._unwatch(window, sections)
+
+    def _snapshot(self, seq, sections, date_range):
+        session = self._session_factory()
+        try:
+            blocks = build_sections(session, sections, date_range=date_range)
+        finally:
+            session.close()
+        return format_event(self._event_id(seq), 'snapshot', self._payload(blocks))
+
+    @staticmethod
+    def _payload(blocks):
+        data = {}
+        for block in blocks.values():
+            data.update(block)
+        return {'sections': list(blocks), 'data': data}
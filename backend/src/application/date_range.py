@@ -0,0 +1,68 @@
+from datetime import date, timedelta
+
+# Upper bound for days= windows
+MAX_WINDOW_DAYS = 3660
+
+
+class DateRange:
+    """Inclusive [start, end] window on a date column; either bound may be open."""
+
+    def __init__(self, start=None, end=None):
+        if start and end and start > end:
+            raise ValueError('start must not be after end')
+        self.start = start
+        self.end = end
+
+    @property
+    def key(self):
+        return (self.start, self.end)
+
+    def criteria(self, column):
+        """SQL predicates restricting `column` to the window."""
+        predicates = []
+        if self.start:
+            predicates.append(column >= self.start)
+        if self.end:
+            predicates.append(column <= self.end)
+        return predicates
+
+    def query_string(self):
+        params = [f'{name}={value.isoformat()}' for name, value in (('start', self.start), ('end', self.end)) if value]
+        return '&'.join(params)
+
+
+def _parse_date(name, raw):
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        raise ValueError(f'{name} must be an ISO date (YYYY-MM-DD)')
+
+
+def parse_date_range(args):
+    """DateRange from start=/end= request arguments, or None when neither is given."""
+    start, end = args.get('start'), args.get('end')
+    if not start and not end:
+        return None
+    return DateRange(
+        _parse_date('start', start) if start else None,
+        _parse_date('end', end) if end else None
+    )
+
+
+def upcoming(days=None, today=None):
+    """DateRange from today through `days` days ahead; open-ended when days is None."""
+    today = today or date.today()
+    return DateRange(today, today + timedelta(days=days) if days is not None else None)
+
+
+def parse_days(raw, default=None, name='days', maximum=MAX_WINDOW_DAYS):
+    """Window size in days from a request argument; `default` when absent."""
+    if raw in (None, ''):
+        return default
+    try:
+        days = int(raw)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer')
+    if not 0 <= days <= maximum:
+        raise ValueError(f'{name} must be between 0 and {maximum}')
+    return days
@@ -0,0 +1,65 @@
+import os
+from sqlalchemy import Date, func, case, and_
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.functions import GenericFunction
+from src.domain.models import Resource
+from src.application.resource_analytics import BILLABLE, NON_BILLABLE, INTERN, BENCH, COST
+from src.infrastructure.cache import LRUCache, table_versions, track_table_versions
+
+
+class month_start(GenericFunction):
+    """First day of the month of a date column, as a DATE."""
+    type = Date()
+    inherit_cache = True
+
+
+@compiles(month_start)
+def _month_start_postgresql(element, compiler, **kw):
+    return "CAST(date_trunc('month', %s) AS DATE)" % compiler.process(element.clauses, **kw)
+
+
+@compiles(month_start, 'sqlite')
+def _month_start_sqlite(element, compiler, **kw):
+    return "date(%s, 'start of month')" % compiler.process(element.clauses, **kw)
+
+
+track_table_versions(Resource)
+
+financials_cache = LRUCache(maxsize=16, ttl=float(os.getenv('FINANCIALS_CACHE_TTL', '300')))
+
+
+def _cost_sums(*predicates):
+    return [func.coalesce(func.sum(COST), 0)] + [
+        func.coalesce(func.sum(case((predicate, COST), else_=0)), 0) for predicate in predicates
+    ]
+
+
+def _totals(total, billable, bench, intern):
+    return {'total': total, 'billable': billable, 'nonBillable': bench, 'intern': intern}
+
+
+def compute_financial_rollup(db: Session, date_range=None):
+    """Monthly and year-to-date resource costs, bucketed by joining month in SQL.
+
+    A date_range limits the monthly series to resources joining inside it; the
+    year-to-date totals always cover every resource.
+    """
+    split = (BILLABLE, BENCH, and_(NON_BILLABLE, INTERN))
+    month = month_start(Resource.joining_date).label('month')
+    window = date_range.criteria(Resource.joining_date) if date_range else []
+    monthly = [
+        {'month': start.strftime('%b %Y'), 'monthStart': start.isoformat(), **_totals(*sums)}
+        for start, *sums in db.query(month, *_cost_sums(*split))
+        .filter(Resource.joining_date.isnot(None), COST != 0, *window)
+        .group_by(month)
+        .order_by(month)
+    ]
+    ytd = _totals(*db.query(*_cost_sums(*split)).one())
+    return {'monthlyFinancials': monthly, 'ytdTotals': ytd}
+
+
+def financial_rollup(db: Session, date_range=None):
+    """Cached compute_financial_rollup; recomputed after any committed resource write."""
+    key = ('financials', date_range.key if date_range else None, table_versions.get(Resource.__tablename__))
+    return financials_cache.get_or_set(key, lambda: compute_financial_rollup(db, date_range))
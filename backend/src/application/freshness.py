@@ -0,0 +1,19 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+
+def collection_state(db: Session, sources):
+    """(last modified, state) for the rows matched by each (model, *criteria) source.
+
+    One round trip of scalar subqueries per source, max(row_updated_at) and
+    count(*), both answered from the row_updated_at index for whole tables; no
+    ORM objects are loaded. The count makes deletes visible, which the
+    timestamp alone would miss. Last modified is None when no row matched.
+    """
+    columns = []
+    for model, *criteria in sources:
+        columns.append(select(func.max(model.row_updated_at)).where(*criteria).scalar_subquery())
+        columns.append(select(func.count()).select_from(model).where(*criteria).scalar_subquery())
+    state = tuple(db.execute(select(*columns)).one())
+    stamps = [stamp for stamp in state[::2] if stamp is not None]
+    return (max(stamps) if stamps else None), state
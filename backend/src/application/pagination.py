@@ -0,0 +1,59 @@
+import base64
+import json
+from sqlalchemy import and_, or_
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+
+def encode_cursor(values):
+    """Opaque cursor for the keyset values of the last row of a page."""
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """Keyset values encoded by encode_cursor; None when no cursor was given."""
+    if not token:
+        return None
+    try:
+        return json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+
+
+def parse_limit(raw, default=DEFAULT_LIMIT, name='limit', maximum=MAX_LIMIT):
+    if raw in (None, ''):
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer')
+    if limit < 1:
+        raise ValueError(f'{name} must be positive')
+    return min(limit, maximum)
+
+
+def parse_fields(raw, available):
+    """List of field names from a comma-separated fields= value, or None for the default set."""
+    if not raw:
+        return None
+    fields = [name.strip() for name in raw.split(',') if name.strip()]
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return fields
+
+
+def keyset_after(column, value, id_column, last_id, descending=False):
+    """Rows after (value, last_id) in ORDER BY column, id_column order.
+
+    NULLs of `column` sort last ascending and first descending, i.e. the
+    order of an index on (column, id_column) walked either way.
+    """
+    if descending:
+        if value is None:
+            return or_(column.isnot(None), and_(column.is_(None), id_column < last_id))
+        return or_(column < value, and_(column == value, id_column < last_id))
+    if value is None:
+        return and_(column.is_(None), id_column > last_id)
+    return or_(column > value, and_(column == value, id_column > last_id), column.is_(None))
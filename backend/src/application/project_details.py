@@ -0,0 +1,107 @@
+from collections import defaultdict
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from src.domain.models import Project, Resource, Milestone, Risk, KPI, ProjectAssignment
+from src.domain.models.sprint import Sprint  # noqa: F401 - registers Project.sprints' target
+
+
+def engineering_metrics(parsed):
+    """{'development', 'qa'} from a project's already-loaded engineering_metrics."""
+    if not isinstance(parsed, dict):
+        return {'development': {}, 'qa': {}}
+    return {'development': parsed.get('development', {}), 'qa': parsed.get('qa', {})}
+
+
+def project_engineering_metrics(db: Session, project_id):
+    """{'development', 'qa'} for one project, extracted from the document in SQL."""
+    row = db.query(
+        Project.engineering_metrics['development'], Project.engineering_metrics['qa']
+    ).filter(Project.id == project_id).first()
+    development, qa = row if row else (None, None)
+    return {'development': development or {}, 'qa': qa or {}}
+
+
+MAX_BATCH = 100
+
+
+def parse_project_ids(raw):
+    """Distinct project ids from a comma-separated ids= value."""
+    try:
+        ids = [int(part) for part in (raw or '').split(',') if part.strip()]
+    except ValueError:
+        raise ValueError('ids must be a comma-separated list of project ids')
+    if not ids:
+        raise ValueError('ids is required')
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > MAX_BATCH:
+        raise ValueError(f'At most {MAX_BATCH} project ids per request')
+    return ids
+
+
+def project_teams(db: Session, project_ids):
+    """{project id: [team member]} for many projects in one query on the assignment index.
+
+    Members are resource documents with their allocation on that project;
+    projects without assignments are left out.
+    """
+    teams = defaultdict(list)
+    rows = db.query(ProjectAssignment, Resource).join(
+        Resource, Resource.id == ProjectAssignment.resource_id
+    ).filter(ProjectAssignment.project_id.in_(project_ids)).order_by(ProjectAssignment.project_id, Resource.id)
+    for assignment, resource in rows:
+        member = resource.to_dict()
+        member['allocationPercentage'] = assignment.allocation_percentage
+        member['assignmentStartDate'] = assignment.start_date.isoformat() if assignment.start_date else None
+        member['assignmentEndDate'] = assignment.end_date.isoformat() if assignment.end_date else None
+        teams[assignment.project_id].append(member)
+    return dict(teams)
+
+
+def team_sources(project_ids):
+    """The (model, *criteria) rows project_teams reads, for conditional GETs."""
+    assigned = select(ProjectAssignment.resource_id).where(ProjectAssignment.project_id.in_(project_ids))
+    return [
+        (ProjectAssignment, ProjectAssignment.project_id.in_(project_ids)),
+        (Resource, Resource.id.in_(assigned)),
+    ]
+
+
+def project_details(db: Session, project_ids):
+    """{project id: details document} for the given ids; unknown ids are left out.
+
+    Round trips are fixed regardless of how many projects are requested: one
+    query for the projects, one selectin query each for milestones, risks, KPIs
+    and sprints, and one for team members; rows are grouped per project in memory.
+    """
+    projects = db.query(Project).options(
+        selectinload(Project.milestones),
+        selectinload(Project.risks),
+        selectinload(Project.kpi_records),
+        selectinload(Project.sprints),
+    ).filter(Project.id.in_(project_ids)).all()
+    if not projects:
+        return {}
+    teams = project_teams(db, [project.id for project in projects])
+    details = {}
+    for project in projects:
+        data = project.to_dict()
+        data['milestones'] = [m.to_dict() for m in project.milestones]
+        data['risks'] = [r.to_dict() for r in project.risks]
+        data['kpiRecords'] = [k.to_dict() for k in project.kpi_records]
+        data['teamMembers'] = teams.get(project.id, [])
+        data['engineeringMetrics'] = engineering_metrics(data['engineering_metrics'])
+        data['sprints'] = [s.to_dict() for s in sorted(project.sprints, key=lambda s: s.id)]
+        details[project.id] = data
+    return details
+
+
+def detail_sources(project_ids):
+    """The (model, *criteria) rows a details document is built from, for conditional GETs."""
+    return [
+        (Project, Project.id.in_(project_ids)),
+        (Milestone, Milestone.project_id.in_(project_ids)),
+        (Risk, Risk.project_id.in_(project_ids)),
+        (KPI, KPI.project_id.in_(project_ids)),
+        (Sprint, Sprint.project_id.in_(project_ids)),
+        *team_sources(project_ids),
+    ]
@@ -0,0 +1,160 @@
+from datetime import date
+from sqlalchemy import Float, bindparam, case, cast, event, func, inspect, select
+from sqlalchemy.orm import Session
+from src.domain.models import Project, Risk, Milestone, Escalation
+from src.domain.models.sprint import Sprint
+from src.domain.models.base import utcnow
+from src.infrastructure.cache import mark_tables_changed
+
+# Statuses meaning a risk, milestone or escalation no longer weighs on the project
+CLOSED_STATUSES = ('closed', 'resolved', 'mitigated', 'completed', 'done', 'met', 'cancelled')
+SEVERE_LEVELS = ('high', 'critical')
+# Sprints that count towards delivery: the most recent few of each project
+RECENT_SPRINTS = 3
+
+# Score starts at 100; each signal takes off points up to its cap
+PENALTIES = {
+    'late_delivery': 0.3,         # per point of average on-time delivery below 100%
+    'unfinished_scope': 30,       # times the share of planned story points not completed
+    'severe_risk': 10, 'risk': 4, 'risk_cap': 30,
+    'overdue_milestone': 8, 'milestone_cap': 24,
+    'severe_escalation': 12, 'escalation': 5, 'escalation_cap': 36,
+}
+# Lowest score for each rating, best first
+RATINGS = (('Green', 75), ('Amber', 50), ('Red', 0))
+
+
+def _open(status):
+    return func.lower(func.coalesce(status, '')).notin_(CLOSED_STATUSES)
+
+
+def _severe(*levels):
+    return func.lower(func.coalesce(*levels, '')).in_(SEVERE_LEVELS)
+
+
+def _grouped(connection, model, project_ids, *columns, where=()):
+    query = select(model.project_id, *columns).where(*where).group_by(model.project_id)
+    if project_ids is not None:
+        query = query.where(model.project_id.in_(project_ids))
+    return {project_id: values for project_id, *values in connection.execute(query)}
+
+
+def rating_for(score):
+    return next(rating for rating, floor in RATINGS if score >= floor)
+
+
+def compute_project_health(connection, project_ids=None, today=None):
+    """{project id: (score, rating)} for the given projects (all when None).
+
+    One grouped query per input table: recent sprint delivery, open risks,
+    overdue milestones and open escalations. Projects with no signals score 100.
+    Milestones become overdue with the passing of time rather than a write,
+    so stored scores are also refreshed daily by scripts/refresh_project_health.py.
+    """
+    today = today or date.today()
+    projects = select(Project.id)
+    if project_ids is not None:
+        projects = projects.where(Project.id.in_(project_ids))
+    ids = connection.execute(projects).scalars().all()
+    if not ids:
+        return {}
+
+    ranked = select(
+        Sprint.project_id,
+        Sprint.on_time_delivery,
+        (cast(Sprint.completed_story_points, Float) / func.nullif(cast(Sprint.planned_story_points, Float), 0, type_=Float)).label('completion'),
+        func.row_number().over(partition_by=Sprint.project_id, order_by=Sprint.sprint_number.desc()).label('recency'),
+    ).where(Sprint.project_id.in_(ids)).subquery()
+    delivery = {project_id: (on_time, completion) for project_id, on_time, completion in connection.execute(
+        select(ranked.c.project_id, func.avg(ranked.c.on_time_delivery), func.avg(ranked.c.completion))
+        .where(ranked.c.recency <= RECENT_SPRINTS).group_by(ranked.c.project_id)
+    )}
+    risks = _grouped(connection, Risk, ids,
+                     func.count().filter(_severe(Risk.risk_level, Risk.impact)), func.count(),
+                     where=[_open(Risk.status)])
+    milestones = _grouped(connection, Milestone, ids, func.count(),
+                          where=[_open(Milestone.status), Milestone.completion_date.is_(None), Milestone.date < today])
+    escalations = _grouped(connection, Escalation, ids,
+                           func.count().filter(_severe(Escalation.severity, Escalation.priority)), func.count(),
+                           where=[_open(Escalation.status)])
+
+    health = {}
+    for project_id in ids:
+        penalty = 0.0
+        on_time, completion = delivery.get(project_id, (None, None))
+        if on_time is not None:
+            penalty += max(0.0, 100 - on_time) * PENALTIES['late_delivery']
+        if completion is not None:
+            penalty += max(0.0, 1 - completion) * PENALTIES['unfinished_scope']
+        severe, total = risks.get(project_id, (0, 0))
+        penalty += min(severe * PENALTIES['severe_risk'] + (total - severe) * PENALTIES['risk'], PENALTIES['risk_cap'])
+        overdue, = milestones.get(project_id, (0,))
+        penalty += min(overdue * PENALTIES['overdue_milestone'], PENALTIES['milestone_cap'])
+        severe, total = escalations.get(project_id, (0, 0))
+        penalty += min(severe * PENALTIES['severe_escalation'] + (total - severe) * PENALTIES['escalation'],
+                       PENALTIES['escalation_cap'])
+        score = round(max(0.0, 100 - penalty), 1)
+        health[project_id] = (score, rating_for(score))
+    return health
+
+
+def refresh_project_health(connection, project_ids=None, today=None):
+    """Recompute health_score/health_rating and store those that changed; returns how many changed.
+
+    Changed rows also get a new row_updated_at, so ETags over projects move.
+    """
+    health = compute_project_health(connection, project_ids, today)
+    if not health:
+        return 0
+    projects = Project.__table__
+    stored = select(projects.c.id, projects.c.health_score, projects.c.health_rating)
+    if project_ids is not None:
+        stored = stored.where(projects.c.id.in_(list(health)))
+    stored = {project_id: (score, rating) for project_id, score, rating in connection.execute(stored)}
+    changed = [{'project_id': project_id, 'score': score, 'rating': rating, 'now': utcnow()}
+               for project_id, (score, rating) in health.items() if stored.get(project_id) != (score, rating)]
+    if changed:
+        connection.execute(
+            projects.update().where(projects.c.id == bindparam('project_id')).values(
+                health_score=bindparam('score'), health_rating=bindparam('rating'), row_updated_at=bindparam('now')
+            ),
+            changed
+        )
+    return len(changed)
+
+
+def _mark_project_dirty(mapper, connection, target):
+    session = inspect(target).session
+    if session is None:
+        return
+    dirty = session.info.setdefault('health_dirty', set())
+    if isinstance(target, Project):
+        dirty.add(target.id)
+        return
+    history = inspect(target).attrs.project_id.history
+    dirty.update(project_id for project_id in (*history.added, *history.deleted, *history.unchanged)
+                 if project_id is not None)
+    if target.project_id is not None:
+        dirty.add(target.project_id)
+
+
+@event.listens_for(Session, 'after_flush')
+def _refresh_dirty_projects(session, flush_context):
+    dirty = session.info.pop('health_dirty', None)
+    if dirty:
+        # Same transaction as the change, so the stored score never lags a commit
+        if refresh_project_health(session.connection(), sorted(dirty)):
+            mark_tables_changed(session, Project.__tablename__)
+
+
+def track_project_health(*models):
+    """Recompute the health of the projects touched by ORM writes to these models."""
+    for model in models:
+        for name in ('after_insert', 'after_update', 'after_delete'):
+            if not event.contains(model, name, _mark_project_dirty):
+                event.listen(model, name, _mark_project_dirty)
+
+
+track_project_health(Sprint, Risk, Milestone, Escalation)
+# A new project gets its score in the transaction that creates it
+event.listen(Project, 'after_insert', _mark_project_dirty)
@@ -0,0 +1,69 @@
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Session
+from src.domain.models import Project
+from src.application.pagination import encode_cursor, decode_cursor
+
+# Query parameter -> column; each accepts one value or a comma-separated list
+FILTERS = {
+    'status': Project.status,
+    'health_status': Project.health_status,
+    'client': Project.client,
+    'priority': Project.priority,
+    'health_rating': Project.health_rating,
+}
+
+# sort= values besides the default id order; prefix with '-' for descending
+SORTS = {
+    'health_score': Project.health_score,
+}
+
+PROJECT_FIELDS = [column.name for column in Project.__table__.columns]
+# The JSON documents are only loaded and decoded when asked for through fields=
+DEFAULT_FIELDS = [name for name in PROJECT_FIELDS if name not in Project.JSON_FIELDS]
+
+
+def parse_filters(args):
+    """SQL criteria for the FILTERS present in the request arguments."""
+    criteria = []
+    for name, column in FILTERS.items():
+        raw = args.get(name)
+        if not raw:
+            continue
+        values = [value.strip() for value in raw.split(',') if value.strip()]
+        criteria.append(column == values[0] if len(values) == 1 else column.in_(values))
+    return criteria
+
+
+def parse_sort(raw):
+    """(column, descending) from a sort= value, or None for id order."""
+    if not raw or raw == 'id':
+        return None
+    name = raw.lstrip('-')
+    if name not in SORTS:
+        raise ValueError(f"Unknown sort: {name}. Valid sorts: id, {', '.join(SORTS)}")
+    return SORTS[name], raw.startswith('-')
+
+
+def list_projects(db: Session, cursor=None, limit=50, fields=None, criteria=(), sort=None):
+    """{'projects', 'nextCursor', 'total'}: one keyset page of projects.
+
+    Projects come in id order, or by a SORTS column with id breaking ties
+    (both descending for a descending sort), so every order walks an index.
+    """
+    fields = fields or DEFAULT_FIELDS
+    keys = [Project.id] if sort is None else [sort[0], Project.id]
+    descending = sort is not None and sort[1]
+    names = list(dict.fromkeys([*[key.name for key in keys], *fields]))
+    query = db.query(*[Project.__table__.c[name] for name in names]).filter(*criteria)
+    query = query.order_by(*[key.desc() if descending else key for key in keys])
+    after = decode_cursor(cursor)
+    if after is not None:
+        if not isinstance(after, list) or len(after) != len(keys):
+            raise ValueError('Invalid cursor')
+        query = query.filter(tuple_(*keys) < tuple_(*after) if descending else tuple_(*keys) > tuple_(*after))
+    rows = [dict(zip(names, row)) for row in query.limit(limit + 1).all()]
+    return {
+        'projects': [{name: values[name] for name in fields} for values in rows[:limit]],
+        'nextCursor': encode_cursor([rows[limit - 1][key.name] for key in keys]) if len(rows) > limit else None,
+        'total': db.query(func.count(Project.id)).filter(*criteria).scalar(),
+    }
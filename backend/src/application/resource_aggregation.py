@@ -0,0 +1,137 @@
+from collections import Counter, defaultdict
+from itertools import compress
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from src.domain.models import Resource
+from src.application.resource_analytics import BILLABLE, NON_BILLABLE, INTERN, BENCH, COST, UTILIZATION
+
+# Columns the engine can load, by name. Derived columns are computed by the
+# database in the same projection, so every grouping sees identical flags.
+COLUMNS = {
+    'billable': BILLABLE,
+    'non_billable': NON_BILLABLE,
+    'intern': INTERN,
+    'bench': BENCH,
+    'cost': COST,
+    'utilization': UTILIZATION,
+    'productivity': func.coalesce(Resource.productivity_score, 0),
+    'seniority_level': Resource.seniority_level,
+    'department': Resource.department,
+    'designation': Resource.designation,
+    'location': Resource.location,
+    'current_engagement': Resource.current_engagement,
+    'client': Resource.client,
+    'bench_reason': Resource.bench_reason,
+    'bench_aging_bucket': Resource.bench_aging_bucket,
+    'joining_date': Resource.joining_date,
+    'bench_start_date': Resource.bench_start_date,
+    'internship_start_date': Resource.internship_start_date,
+}
+
+
+def month_key(value):
+    return (value.year, value.month)
+
+
+def week_key(value):
+    return value.strftime('%U %Y')
+
+
+class Grouping:
+    """One group-by computed by aggregate_resources.
+
+    key       column to group on; None aggregates every matching row into one group
+    where     boolean column a row must satisfy
+    sums      columns summed per group (None counts as 0)
+    key_func  transform applied to the key value, e.g. month_key
+    window    date column a requested DateRange restricts, e.g. joining_date
+
+    Rows whose key is None or '' are skipped, like the truthiness checks the
+    dashboard always applied.
+    """
+
+    def __init__(self, name, key=None, where=None, sums=(), key_func=None, window=None):
+        self.name = name
+        self.key = key
+        self.where = where
+        self.sums = tuple(sums)
+        self.key_func = key_func
+        self.window = window
+
+    @property
+    def columns(self):
+        return [c for c in (self.key, self.where) if c] + list(self.sums)
+
+
+def aggregate_resources(db: Session, *groupings, criteria=(), date_range=None):
+    """Evaluate all groupings over one projected query of the resources table.
+
+    Only the columns the groupings reference are selected and no Resource
+    objects are hydrated. The rows are transposed into column lists once; each
+    grouping then runs over whole columns (Counter/compress), applying key_func
+    once per distinct value. Returns {grouping name: {key: [count, *sums]}};
+    for groupings without a key the single group is stored under None.
+
+    With a date_range, groupings that declare a window column are evaluated in
+    a separate query per column with the range as SQL predicates, so a narrow
+    window reads only the matching rows through that column's index.
+    """
+    if date_range is None:
+        return _aggregate_query(db, groupings, criteria)
+    by_window = {}
+    for g in groupings:
+        by_window.setdefault(g.window, []).append(g)
+    results = {}
+    for window, windowed in by_window.items():
+        extra = date_range.criteria(COLUMNS[window]) if window else []
+        results.update(_aggregate_query(db, windowed, (*criteria, *extra)))
+    return {g.name: results[g.name] for g in groupings}
+
+
+def _aggregate_query(db, groupings, criteria):
+    names = list(dict.fromkeys(c for g in groupings for c in g.columns))
+    rows = db.execute(select(*[COLUMNS[name].label(name) for name in names]).where(*criteria)).all() if names else []
+    columns = dict(zip(names, zip(*rows))) if rows else {name: () for name in names}
+    return {g.name: _aggregate(g, columns, len(rows)) for g in groupings}
+
+
+def _key_column(grouping, columns):
+    keys = columns[grouping.key]
+    if grouping.key_func is None:
+        return keys
+    # Shared by every grouping over the same transformed key, e.g. joining month
+    derived = (grouping.key, grouping.key_func)
+    if derived not in columns:
+        mapping = {value: grouping.key_func(value) for value in set(keys) if value is not None and value != ''}
+        columns[derived] = [mapping.get(value) for value in keys]
+    return columns[derived]
+
+
+def _aggregate(grouping, columns, row_count):
+    mask = columns[grouping.where] if grouping.where else None
+    sums = [columns[c] for c in grouping.sums]
+    if grouping.key is None:
+        selected = [compress(column, mask) if mask is not None else column for column in sums]
+        count = sum(map(bool, mask)) if mask is not None else row_count
+        return {None: [count] + [sum(filter(None, column)) for column in selected]} if count else {}
+    keys = _key_column(grouping, columns)
+    if mask is not None:
+        keys = list(compress(keys, mask))
+        sums = [list(compress(column, mask)) for column in sums]
+    counter = Counter(keys)
+    counter.pop(None, None)
+    counter.pop('', None)
+    groups = {key: [count] for key, count in counter.items()}
+    for column in sums:
+        totals = defaultdict(int)
+        for key, value in zip(keys, column):
+            if value:
+                totals[key] += value
+        for key, entry in groups.items():
+            entry.append(totals.get(key, 0))
+    return groups
+
+
+def mean(entry, position):
+    """Average of the sum at `position` of a [count, *sums] entry."""
+    return entry[position] / entry[0] if entry[0] else 0
@@ -0,0 +1,72 @@
+from datetime import date
+from sqlalchemy import func, case, and_
+from sqlalchemy.orm import Session
+from src.domain.models import Resource
+
+# Row predicates shared by the dashboard breakdowns. They mirror the truthiness
+# checks the dashboard used to run on hydrated Resource objects.
+BILLABLE = Resource.billable_status.is_(True)
+NON_BILLABLE = Resource.billable_status.isnot(True)
+INTERN = Resource.is_intern.is_(True)
+BENCH = and_(NON_BILLABLE, Resource.is_intern.isnot(True))
+COST = func.coalesce(Resource.monthly_cost, 0)
+UTILIZATION = func.coalesce(
+    func.nullif(Resource.utilization_rate, 0),
+    func.nullif(Resource.utilization_percentage, 0),
+    0
+)
+
+
+def present(column):
+    """SQL equivalent of a Python truthiness check on a string column."""
+    return and_(column.isnot(None), column != '')
+
+
+def month_label(year, month):
+    return date(int(year), int(month), 1).strftime('%b %Y')
+
+
+def percentages(counts):
+    total = sum(count for _, count in counts)
+    return [
+        {
+            'name': name,
+            'count': count,
+            'percentage': round((count / total) * 100) if total else 0
+        }
+        for name, count in counts
+    ]
+
+
+def headcount_summary(db: Session):
+    row = db.query(
+        func.count(),
+        func.count().filter(func.lower(Resource.status) == 'active'),
+        func.count().filter(NON_BILLABLE),
+        func.count().filter(BILLABLE),
+        func.count().filter(INTERN),
+        func.count().filter(INTERN, present(Resource.assigned_project)),
+        func.sum(case((NON_BILLABLE, COST), else_=0)),
+        func.sum(case((NON_BILLABLE, func.coalesce(Resource.bench_days, 0)), else_=0)),
+        func.count().filter(NON_BILLABLE, Resource.reallocation_opportunity.is_(True)),
+    ).one()
+    return {
+        'total': row[0],
+        'active': row[1],
+        'non_billable': row[2],
+        'billable': row[3],
+        'interns': row[4],
+        'interns_assigned': row[5],
+        'non_billable_cost': row[6] or 0,
+        'non_billable_bench_days': row[7] or 0,
+        'reallocation_opportunities': row[8],
+    }
+
+
+def bench_aging_rows(db: Session):
+    return [
+        {'bucket': bucket, 'count': days if days is not None else 0, 'riskLevel': risk or ''}
+        for bucket, days, risk in db.query(
+            Resource.bench_aging_bucket, Resource.bench_days, Resource.bench_risk_level
+        ).filter(present(Resource.bench_aging_bucket)).order_by(Resource.id)
+    ]
@@ -0,0 +1,245 @@
+from datetime import date
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+from src.domain.models import Resource
+from src.domain.models.resource import RESOURCE_FIELD_MAP
+from src.application.resource_analytics import BILLABLE, NON_BILLABLE, INTERN, BENCH
+from src.application.pagination import encode_cursor, decode_cursor, keyset_after
+from src.application.skill_index import with_skills
+
+
+class Field:
+    """An output field computed from zero or more Resource columns."""
+
+    def __init__(self, *columns, convert=None):
+        self.columns = columns
+        self.convert = convert or (lambda value: value)
+
+
+# Every key of Resource.to_dict(), computed from the columns it reads
+RESOURCE_FIELDS = {column.name: Field(getattr(Resource, column.key)) for column in Resource.__table__.columns}
+RESOURCE_FIELDS.update({
+    RESOURCE_FIELD_MAP.names[name]: Field(getattr(Resource, name), convert=format)
+    for name, format in RESOURCE_FIELD_MAP.formatters.items()
+})
+RESOURCE_FIELDS['employeeId'] = Field(Resource.employee_id, Resource.id, convert=lambda employee_id, id: employee_id or id)
+
+BILLABLE_FIELDS = {
+    'full_name': Field(Resource.full_name),
+    'designation': Field(Resource.designation),
+    'client': Field(Resource.client),
+    'utilization_rate': Field(Resource.utilization_rate, Resource.utilization_percentage, convert=lambda rate, percentage: rate or percentage),
+    'billing_rate': Field(Resource.billing_rate),
+    'productivity': Field(Resource.productivity_score),
+}
+
+NON_BILLABLE_FIELDS = {
+    'name': Field(Resource.full_name),
+    'designation': Field(Resource.designation),
+    'reason': Field(Resource.bench_reason),
+    'benchDays': Field(Resource.bench_days),
+    'location': Field(Resource.location),
+    'monthlyCost': Field(Resource.monthly_cost),
+    'suggestion': Field(Resource.suggestion),
+}
+
+# Resource has no learning/productive hour columns, so those report zero.
+INTERN_DETAIL_FIELDS = {
+    'name': Field(Resource.full_name),
+    'designation': Field(Resource.designation),
+    'project': Field(Resource.assigned_project),
+    'mentor': Field(Resource.mentor_name),
+    'status': Field(Resource.status),
+    'department': Field(Resource.department),
+    'learningHours': Field(convert=lambda: 0),
+    'productiveHours': Field(convert=lambda: 0),
+    'feedback': Field(Resource.performance_feedback),
+    'conversionPotential': Field(convert=lambda: None),
+}
+
+
+def _columns(selected, *extra):
+    """Column key -> column for Resource.id, `extra` and every column the selected fields read."""
+    return {column.key: column for column in (Resource.id, *extra, *(c for f in selected.values() for c in f.columns))}
+
+
+def _items(selected, columns, rows):
+    items = []
+    for row in rows:
+        values = dict(zip(columns, row))
+        items.append({
+            name: field.convert(*(values[column.key] for column in field.columns))
+            for name, field in selected.items()
+        })
+    return items
+
+
+class ResourceList:
+    """A filtered list of resources served in id order, one keyset page at a time.
+
+    `criteria` is called per request so date-relative filters use the current day.
+    `default_fields` is the projection used when the caller does not pass fields.
+    `window` is the date column a requested DateRange restricts.
+    """
+
+    def __init__(self, criteria, fields, default_fields=None, window=None):
+        self.criteria = criteria
+        self.fields = fields
+        self.default_fields = list(default_fields or fields)
+        self.window = window
+
+    def page(self, db: Session, cursor=None, limit=50, fields=None, date_range=None):
+        """{'items', 'nextCursor', 'total'} for the page after `cursor`."""
+        selected = {name: self.fields[name] for name in (fields or self.default_fields)}
+        columns = _columns(selected)
+        criteria = [self.criteria()]
+        if date_range is not None and self.window is not None:
+            criteria += date_range.criteria(self.window)
+        query = db.query(*columns.values()).filter(*criteria).order_by(Resource.id)
+        after = decode_cursor(cursor)
+        if after is not None:
+            if not isinstance(after, list) or len(after) != 1:
+                raise ValueError('Invalid cursor')
+            query = query.filter(Resource.id > after[0])
+        rows = query.limit(limit + 1).all()
+        return {
+            'items': _items(selected, columns, rows[:limit]),
+            'nextCursor': encode_cursor([rows[limit - 1].id]) if len(rows) > limit else None,
+            'total': db.query(func.count(Resource.id)).filter(*criteria).scalar(),
+        }
+
+
+# /dashboard list key -> ResourceList; served in full by /dashboard/lists/<name>
+RESOURCE_LISTS = {
+    'internsData': ResourceList(
+        lambda: INTERN, RESOURCE_FIELDS,
+        default_fields=['id', 'employeeId', 'fullName', 'designation', 'department', 'location', 'status',
+                        'assigned_project', 'mentor_name', 'internship_start_date', 'internship_end_date']
+    ),
+    'upcomingReleases': ResourceList(
+        lambda: Resource.release_date > date.today(), RESOURCE_FIELDS,
+        default_fields=['id', 'employeeId', 'fullName', 'designation', 'status', 'release_date',
+                        'projectName', 'skills', 'primarySkills', 'utilization_rate'],
+        window=Resource.release_date
+    ),
+    'billable_resources': ResourceList(lambda: BILLABLE, BILLABLE_FIELDS),
+    'non_billable_resources_list': ResourceList(lambda: NON_BILLABLE, NON_BILLABLE_FIELDS),
+    'intern_details_list': ResourceList(lambda: INTERN, INTERN_DETAIL_FIELDS),
+}
+
+
+# /api/resources query parameter -> column; each accepts one value or a comma-separated list
+RESOURCE_FILTERS = {
+    'department': Resource.department,
+    'location': Resource.location,
+    'seniority': Resource.seniority_level,
+}
+
+
+def _flag(column):
+    # (true, false) predicates written as comparisons an index on (column, id) can
+    # serve; they match `column IS TRUE` and `column IS NOT TRUE`
+    return column == True, or_(column == False, column.is_(None))  # noqa: E712
+
+
+# /api/resources query parameter -> (criterion for true, criterion for false)
+RESOURCE_FLAGS = {
+    'billable': _flag(Resource.billable_status),
+    'intern': _flag(Resource.is_intern),
+    'bench': _flag(Resource.current_bench_status),
+}
+TRUE_VALUES = ('true', '1', 'yes')
+FALSE_VALUES = ('false', '0', 'no')
+
+# sort= values besides the default id order -> (column, cursor value parser);
+# prefix with '-' for descending
+RESOURCE_SORTS = {
+    'fullName': (Resource.full_name, str),
+    'joiningDate': (Resource.joining_date, date.fromisoformat),
+    'benchDays': (Resource.bench_days, int),
+}
+
+# Resource.to_dict() keys listed by /api/resources unless fields= is given
+LIST_FIELDS = [name for name in RESOURCE_FIELDS if name != 'status']
+
+
+def parse_resource_filters(args):
+    """SQL criteria for the RESOURCE_FILTERS, RESOURCE_FLAGS and skill= present in the request arguments."""
+    criteria = []
+    for name, column in RESOURCE_FILTERS.items():
+        raw = args.get(name)
+        if not raw:
+            continue
+        values = [value.strip() for value in raw.split(',') if value.strip()]
+        criteria.append(column == values[0] if len(values) == 1 else column.in_(values))
+    skills = [value.strip() for value in (args.get('skill') or '').split(',') if value.strip()]
+    if skills:
+        # Resources listing any of the skills in any skill column, via the skill index
+        criteria.append(with_skills(skills))
+    for name, (when_true, when_false) in RESOURCE_FLAGS.items():
+        raw = (args.get(name) or '').strip().lower()
+        if not raw:
+            continue
+        if raw not in TRUE_VALUES + FALSE_VALUES:
+            raise ValueError(f'{name} must be true or false')
+        criteria.append(when_true if raw in TRUE_VALUES else when_false)
+    return criteria
+
+
+def parse_resource_sort(raw):
+    """(sort name, descending) from a sort= value, or None for id order."""
+    if not raw or raw == 'id':
+        return None
+    name = raw.lstrip('-')
+    if name not in RESOURCE_SORTS:
+        raise ValueError(f"Unknown sort: {name}. Valid sorts: id, {', '.join(RESOURCE_SORTS)}")
+    return name, raw.startswith('-')
+
+
+def resource_totals(db: Session, criteria=()):
+    """Headcounts of the resources matching criteria, from one COUNT ... FILTER query."""
+    total, billable, non_billable, bench, interns = db.query(
+        func.count(),
+        func.count().filter(BILLABLE),
+        func.count().filter(NON_BILLABLE),
+        func.count().filter(BENCH),
+        func.count().filter(INTERN),
+    ).select_from(Resource).filter(*criteria).one()
+    return {'total': total, 'billable': billable, 'non_billable': non_billable, 'bench': bench, 'interns': interns}
+
+
+def search_resources(db: Session, cursor=None, limit=50, fields=None, criteria=(), sort=None):
+    """{'items', 'nextCursor'}: one keyset page of the resources matching criteria.
+
+    Resources come in id order, or by a RESOURCE_SORTS column with id breaking
+    ties (NULLs last, the whole order reversed for a descending sort).
+    """
+    selected = {name: RESOURCE_FIELDS[name] for name in (fields or LIST_FIELDS)}
+    key, parse = RESOURCE_SORTS[sort[0]] if sort else (None, None)
+    descending = bool(sort and sort[1])
+    columns = _columns(selected, *([key] if key is not None else []))
+    query = db.query(*columns.values()).filter(*criteria)
+    if key is None:
+        query = query.order_by(Resource.id)
+    elif descending:
+        query = query.order_by(key.desc().nulls_first(), Resource.id.desc())
+    else:
+        query = query.order_by(key.asc().nulls_last(), Resource.id)
+    after = decode_cursor(cursor)
+    if after is not None:
+        if not isinstance(after, list) or len(after) != (1 if key is None else 2):
+            raise ValueError('Invalid cursor')
+        if key is None:
+            query = query.filter(Resource.id > after[0])
+        else:
+            try:
+                value = None if after[0] is None else parse(after[0])
+            except (TypeError, ValueError):
+                raise ValueError('Invalid cursor')
+            query = query.filter(keyset_after(key, value, Resource.id, after[1], descending))
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        last = dict(zip(columns, rows[limit - 1]))
+        next_cursor = encode_cursor([last['id']] if key is None else [last[key.key], last['id']])
+    return {'items': _items(selected, columns, rows[:limit]), 'nextCursor': next_cursor}
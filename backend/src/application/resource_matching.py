@@ -0,0 +1,204 @@
+from datetime import date, timedelta
+from sqlalchemy import Float, and_, bindparam, case, cast, func, literal, or_, select
+from sqlalchemy.orm import Session
+from src.domain.models import Project, ProjectAssignment, Resource, ResourceSkill, Skill
+from src.domain.models.base import utcnow
+from src.domain.models.skill import skill_key
+from src.infrastructure.cache import mark_tables_changed
+
+DEFAULT_TOP = 10
+MAX_TOP = 100
+
+# Share of the score from each component; every component is between 0 and 1
+WEIGHTS = {'skills': 0.55, 'seniority': 0.2, 'availability': 0.15, 'benchAging': 0.1}
+# A requested skill counts with the weight of the best column the resource lists it in
+KIND_WEIGHTS = {'primary_skills': 1.0, 'skills': 0.8, 'secondary_skills': 0.5, 'skillset': 0.3}
+# First matching word of a lower-cased seniority_level -> rank; 'mid-senior' before 'senior'
+SENIORITY_RANKS = (
+    ('principal', 5), ('architect', 5), ('lead', 4), ('mid-senior', 2.5),
+    ('senior', 3), ('mid', 2), ('junior', 1), ('intern', 0),
+)
+# Ranks apart at which the seniority component reaches 0
+SENIORITY_SPAN = 3
+# Billable resources whose engagement ends within this many days count as half available
+ROLLING_OFF_DAYS = 30
+# Bench days at which bench aging reaches its full weight
+BENCH_AGING_CAP = 90
+
+
+def seniority_rank(value):
+    value = (value or '').lower()
+    return next((rank for word, rank in SENIORITY_RANKS if word in value), None)
+
+
+def _seniority_rank_sql(column):
+    level = func.lower(column)
+    return case(*[(level.like(f'%{word}%'), rank) for word, rank in SENIORITY_RANKS], else_=None)
+
+
+def parse_skill_list(raw):
+    """Skill names from a list or a comma-separated string."""
+    if isinstance(raw, str):
+        raw = raw.split(',')
+    if not isinstance(raw, (list, tuple)):
+        raise ValueError('skills must be a list or a comma-separated string')
+    return [str(name).strip() for name in raw if str(name).strip()]
+
+
+def match_resources(db: Session, skills=(), seniority=None, project_id=None, top=DEFAULT_TOP, today=None):
+    """The `top` best candidates for a role, best first, with their score components.
+
+    Candidates are the resources listing at least one requested skill, found
+    through the skill index (every resource when no skill is requested).
+    People who have left, or who are already on project_id, are excluded.
+    The score is computed by the database over the whole candidate set and
+    only the top rows are returned:
+
+      skills       requested skills held, weighted by KIND_WEIGHTS
+      seniority    1 at the requested level, 0 at SENIORITY_SPAN levels away
+      availability 1 off billing, 0.5 rolling off within ROLLING_OFF_DAYS, else 0
+      benchAging   bench days up to BENCH_AGING_CAP, for resources off billing
+    """
+    today = today or date.today()
+    keys = list(dict.fromkeys(skill_key(name) for name in skills))
+    wanted_rank = seniority_rank(seniority) if seniority else None
+    if seniority and wanted_rank is None:
+        raise ValueError(f'Unknown seniority: {seniority}')
+
+    if keys:
+        weight = case(*[(ResourceSkill.kind == kind, value) for kind, value in KIND_WEIGHTS.items()], else_=0.0)
+        held = (
+            select(ResourceSkill.resource_id, ResourceSkill.skill_id, func.max(weight).label('weight'))
+            .join(Skill, Skill.id == ResourceSkill.skill_id)
+            .where(Skill.key.in_(keys))
+            .group_by(ResourceSkill.resource_id, ResourceSkill.skill_id)
+            .subquery()
+        )
+        per_resource = (
+            select(held.c.resource_id, (cast(func.sum(held.c.weight), Float) / len(keys)).label('score'))
+            .group_by(held.c.resource_id)
+            .subquery()
+        )
+        skill_score = per_resource.c.score
+    else:
+        skill_score = literal(0.0, Float)
+
+    if wanted_rank is None:
+        seniority_score = literal(0.0, Float)
+    else:
+        # Resources with no recognisable level score 0
+        distance = func.abs(_seniority_rank_sql(Resource.seniority_level) - wanted_rank)
+        seniority_score = func.coalesce(
+            case((distance >= SENIORITY_SPAN, 0.0), else_=1.0 - cast(distance, Float) / SENIORITY_SPAN), 0.0
+        )
+    off_billing = Resource.billable_status.isnot(True)
+    availability = case(
+        (off_billing, 1.0),
+        (Resource.engagement_end_date <= today + timedelta(days=ROLLING_OFF_DAYS), 0.5),
+        else_=0.0,
+    )
+    bench_days = func.coalesce(Resource.bench_days, Resource.aging_in_non_billable, 0)
+    bench_aging = case(
+        (off_billing, case((bench_days >= BENCH_AGING_CAP, 1.0), else_=cast(bench_days, Float) / BENCH_AGING_CAP)),
+        else_=0.0,
+    )
+    components = {'skills': skill_score, 'seniority': seniority_score,
+                  'availability': availability, 'benchAging': bench_aging}
+    score = sum(WEIGHTS[name] * component for name, component in components.items())
+
+    query = select(
+        Resource.id, Resource.employee_id, Resource.full_name, Resource.designation, Resource.seniority_level,
+        *[cast(component, Float).label(name) for name, component in components.items()],
+        cast(score, Float).label('score'),
+    )
+    if keys:
+        query = query.join(per_resource, per_resource.c.resource_id == Resource.id)
+    query = query.where(or_(Resource.last_working_day.is_(None), Resource.last_working_day >= today))
+    if project_id is not None:
+        query = query.where(~select(ProjectAssignment.id).where(and_(
+            ProjectAssignment.project_id == project_id, ProjectAssignment.resource_id == Resource.id
+        )).exists())
+    rows = db.execute(query.order_by(score.desc(), Resource.id).limit(top)).mappings().all()
+
+    matched = {}
+    if keys and rows:
+        for resource_id, name in db.execute(
+            select(ResourceSkill.resource_id, Skill.name).distinct()
+            .join(Skill, Skill.id == ResourceSkill.skill_id)
+            .where(Skill.key.in_(keys), ResourceSkill.resource_id.in_([row['id'] for row in rows]))
+            .order_by(ResourceSkill.resource_id, Skill.name)
+        ):
+            matched.setdefault(resource_id, []).append(name)
+    return [{
+        'id': row['id'],
+        'employeeId': row['employee_id'],
+        'fullName': row['full_name'],
+        'designation': row['designation'],
+        'seniorityLevel': row['seniority_level'],
+        'score': round(row['score'], 4),
+        'components': {name: round(row[name], 4) for name in components},
+        'matchedSkills': matched.get(row['id'], []),
+    } for row in rows]
+
+
+def resolve_resources(db: Session, references):
+    """Resource ids for references given as employee ids or numeric resource ids; raises ValueError for unknown ones."""
+    references = [str(reference).strip() for reference in references if str(reference).strip()]
+    numeric = [int(reference) for reference in references if reference.isdigit()]
+    found = db.execute(select(Resource.id, Resource.employee_id).where(
+        or_(Resource.employee_id.in_(references), Resource.id.in_(numeric))
+    )).all()
+    by_employee = {employee_id: resource_id for resource_id, employee_id in found}
+    by_id = {resource_id for resource_id, _ in found}
+    ids, unknown = [], []
+    for reference in references:
+        resource_id = by_employee.get(reference)
+        if resource_id is None and reference.isdigit() and int(reference) in by_id:
+            resource_id = int(reference)
+        if resource_id is None:
+            unknown.append(reference)
+        elif resource_id not in ids:
+            ids.append(resource_id)
+    if unknown:
+        raise ValueError(f"Unknown resources: {', '.join(unknown)}")
+    return ids
+
+
+def allocate_resources(db: Session, project_id, resource_ids, start_date=None, allocation_percentage=100.0):
+    """Assign the selected resources to a project with a few bulk statements and commit.
+
+    Existing assignments of these resources to the project are updated, the
+    others inserted. Assignments to other projects are kept. The legacy
+    current_engagement column is left alone: it holds a human-readable
+    engagement name, and project_assignments is the record of allocation.
+    Returns the number of resources allocated.
+    """
+    if db.get(Project, project_id) is None:
+        raise ValueError(f'Unknown project: {project_id}')
+    if not resource_ids:
+        return 0
+    now = utcnow()
+    assignments = ProjectAssignment.__table__
+    existing = set(db.execute(select(assignments.c.resource_id).where(
+        assignments.c.project_id == project_id, assignments.c.resource_id.in_(resource_ids)
+    )).scalars())
+    values = {'allocation_percentage': allocation_percentage, 'row_updated_at': now}
+    if start_date is not None:
+        values['start_date'] = start_date
+    if existing:
+        db.execute(assignments.update().where(
+            assignments.c.project_id == project_id, assignments.c.resource_id == bindparam('resource')
+        ).values(**{name: bindparam(f'new_{name}') for name in values}),
+            [{'resource': resource_id, **{f'new_{name}': value for name, value in values.items()}}
+             for resource_id in existing])
+    new = [resource_id for resource_id in resource_ids if resource_id not in existing]
+    if new:
+        db.execute(assignments.insert(), [
+            {'project_id': project_id, 'resource_id': resource_id, 'allocation_percentage': allocation_percentage,
+             'start_date': start_date, 'row_updated_at': now}
+            for resource_id in new
+        ])
+    # The Core statements bypass the ORM events that bump cached table versions
+    mark_tables_changed(db, assignments.name)
+    db.commit()
+    return len(resource_ids)
@@ -0,0 +1,50 @@
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from src.domain.models import Resource, ResourceSkill, Skill
+
+# Default windows, in days from today, of the endpoints that list them
+RESIGNATION_DAYS = 60
+RELEASE_DAYS = 62
+
+
+def resignations(db: Session, date_range):
+    """Resources whose last working day falls in date_range, soonest first.
+
+    A range scan of the partial (last_working_day, id) index: the cost
+    follows the number of leavers in the window, not the headcount.
+    """
+    return (
+        db.query(Resource)
+        .filter(*date_range.criteria(Resource.last_working_day))
+        .order_by(Resource.last_working_day, Resource.id)
+        .all()
+    )
+
+
+def engagement_releases(db: Session, date_range):
+    """[{'resourceId', 'name', 'releaseDate', 'currentProject', 'skills'}] for engagements ending in date_range.
+
+    One range scan of the partial (engagement_end_date, id) index, plus one
+    skill index lookup for the matched resources.
+    """
+    rows = db.execute(
+        select(Resource.id, Resource.full_name, Resource.engagement_end_date, Resource.current_engagement)
+        .where(*date_range.criteria(Resource.engagement_end_date))
+        .order_by(Resource.engagement_end_date, Resource.id)
+    ).all()
+    skills = {}
+    if rows:
+        for resource_id, name in db.execute(
+            select(ResourceSkill.resource_id, Skill.name)
+            .join(Skill, Skill.id == ResourceSkill.skill_id)
+            .where(ResourceSkill.kind == 'skills', ResourceSkill.resource_id.in_([row.id for row in rows]))
+            .order_by(ResourceSkill.resource_id, ResourceSkill.id)
+        ):
+            skills.setdefault(resource_id, []).append(name)
+    return [{
+        'resourceId': row.id,
+        'name': row.full_name,
+        'releaseDate': row.engagement_end_date.isoformat(),
+        'currentProject': row.current_engagement,
+        'skills': skills.get(row.id, []),
+    } for row in rows]
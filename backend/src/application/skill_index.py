@@ -0,0 +1,69 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from src.domain.models import Resource, Skill, ResourceSkill
+from src.domain.models.skill import SKILL_COLUMNS, index_resource_skills, skill_key
+
+BATCH_SIZE = 1000
+
+
+def rebuild_skill_index(connection, batch_size=BATCH_SIZE):
+    """Rebuild resource_skills from the resources' skill columns; returns the number of resources read.
+
+    Resources are read in id order, batch_size at a time, so memory stays
+    bounded at any headcount. Skills no resource lists any more are kept.
+    """
+    connection.execute(ResourceSkill.__table__.delete())
+    resources = Resource.__table__
+    columns = [resources.c[kind] for kind in SKILL_COLUMNS]
+    last_id, total = 0, 0
+    while True:
+        rows = connection.execute(
+            select(resources.c.id, *columns).where(resources.c.id > last_id).order_by(resources.c.id).limit(batch_size)
+        ).all()
+        if not rows:
+            return total
+        index_resource_skills(connection, {
+            (resource_id, kind): raw
+            for resource_id, *values in rows
+            for kind, raw in zip(SKILL_COLUMNS, values) if raw
+        })
+        last_id, total = rows[-1][0], total + len(rows)
+
+
+def parse_kinds(raw, default=('skills',)):
+    """Skill columns named by a comma-separated kind= value."""
+    if not raw:
+        return list(default)
+    kinds = [kind.strip() for kind in raw.split(',') if kind.strip()]
+    unknown = [kind for kind in kinds if kind not in SKILL_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown skill kinds: {', '.join(unknown)}. Valid kinds: {', '.join(SKILL_COLUMNS)}")
+    return kinds
+
+
+def skill_counts(db: Session, kinds=('skills',), criteria=()):
+    """[{'skill', 'count'}]: resources listing each skill in any of the kinds, most common first.
+
+    criteria are Resource predicates; without them only the skill index is read.
+    """
+    query = (
+        db.query(Skill.name, func.count(func.distinct(ResourceSkill.resource_id)).label('count'))
+        .join(ResourceSkill, ResourceSkill.skill_id == Skill.id)
+        .filter(ResourceSkill.kind.in_(kinds))
+    )
+    if criteria:
+        query = query.join(Resource, Resource.id == ResourceSkill.resource_id).filter(*criteria)
+    rows = query.group_by(Skill.id, Skill.name).order_by(func.count(func.distinct(ResourceSkill.resource_id)).desc(), Skill.name)
+    return [{'skill': name, 'count': count} for name, count in rows]
+
+
+def with_skills(names, kinds=None):
+    """Resource criterion: lists any of the skill names (case-insensitive) in one of the kinds."""
+    holders = (
+        select(ResourceSkill.resource_id)
+        .join(Skill, Skill.id == ResourceSkill.skill_id)
+        .where(Skill.key.in_([skill_key(name) for name in names]))
+    )
+    if kinds:
+        holders = holders.where(ResourceSkill.kind.in_(kinds))
+    return Resource.id.in_(holders)
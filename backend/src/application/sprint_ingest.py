@@ -0,0 +1,154 @@
+import csv
+import io
+import json
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from src.domain.models import Project
+from src.domain.models.base import utcnow
+from src.domain.models.fields import parse_date, parse_float, parse_integer
+from src.domain.models.sprint import Sprint
+from src.application.project_health import refresh_project_health
+from src.infrastructure.cache import mark_tables_changed
+
+CHUNK_SIZE = 500
+
+
+# Accepted field (camelCase as in POST /projects/<id>/sprints, or the column name) -> (column, parser)
+FIELDS = {}
+for _column, _name, _parse in (
+    ('project_id', 'projectId', parse_integer),
+    ('sprint_number', 'sprintNumber', parse_integer),
+    ('name', 'name', str),
+    ('start_date', 'startDate', parse_date),
+    ('end_date', 'endDate', parse_date),
+    ('velocity', 'velocity', parse_float),
+    ('predictability', 'predictability', parse_float),
+    ('defect_leakage', 'defectLeakage', parse_float),
+    ('on_time_delivery', 'onTimeDelivery', parse_float),
+    ('planned_story_points', 'plannedStoryPoints', parse_integer),
+    ('completed_story_points', 'completedStoryPoints', parse_integer),
+    ('test_cases_executed', 'testCasesExecuted', parse_integer),
+    ('test_cases_passed', 'testCasesPassed', parse_integer),
+    ('created_at', 'createdAt', parse_date),
+    ('updated_at', 'updatedAt', parse_date),
+):
+    FIELDS[_name] = FIELDS[_column] = (_column, _parse)
+COLUMNS = list(dict.fromkeys(column for column, _ in FIELDS.values()))
+COUNTS = ('planned_story_points', 'completed_story_points', 'test_cases_executed', 'test_cases_passed')
+
+
+def read_csv(stream):
+    """Rows of a CSV body with a header line, read incrementally."""
+    for record in csv.DictReader(io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')):
+        yield {key: value for key, value in record.items() if key is not None}
+
+
+def read_ndjson(stream):
+    """Rows of a newline-delimited JSON body, read incrementally; blank lines are skipped."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            yield ValueError('Invalid JSON')
+            continue
+        yield record if isinstance(record, dict) else ValueError('Each line must be a JSON object')
+
+
+def validate_row(record, project_id=None):
+    """(column values, errors, ignored field names) for one input record."""
+    values, errors, ignored, invalid = {}, [], set(), set()
+    for key, raw in record.items():
+        if key not in FIELDS:
+            ignored.add(key)
+            continue
+        column, parse = FIELDS[key]
+        if raw is None or (isinstance(raw, str) and not raw.strip()):
+            continue
+        try:
+            values[column] = parse(raw.strip() if isinstance(raw, str) else raw)
+        except (TypeError, ValueError):
+            errors.append(f'{key}: invalid value {raw!r}')
+            invalid.add(column)
+    if project_id is not None and values.setdefault('project_id', project_id) != project_id:
+        errors.append(f'projectId: does not match project {project_id}')
+    for column, name in (('project_id', 'projectId'), ('sprint_number', 'sprintNumber')):
+        if column not in values and column not in invalid:
+            errors.append(f'{name}: required')
+    if values.get('sprint_number', 1) < 1:
+        errors.append('sprintNumber: must be positive')
+    for column in COUNTS:
+        if values.get(column, 0) < 0:
+            errors.append(f'{column}: must not be negative')
+    start, end = values.get('start_date'), values.get('end_date')
+    if start and end and start > end:
+        errors.append('endDate: before startDate')
+    passed, executed = values.get('test_cases_passed'), values.get('test_cases_executed')
+    if passed is not None and executed is not None and passed > executed:
+        errors.append('testCasesPassed: more than testCasesExecuted')
+    return values, errors, ignored
+
+
+def _upsert_statement(dialect):
+    insert = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}.get(dialect.name)
+    if insert is None:
+        raise NotImplementedError(f'Bulk sprint upsert is not supported on {dialect.name}')
+    statement = insert(Sprint.__table__)
+    replaced = {column: statement.excluded[column] for column in COLUMNS if column not in ('project_id', 'sprint_number')}
+    replaced['row_updated_at'] = utcnow()
+    return statement.on_conflict_do_update(index_elements=['project_id', 'sprint_number'], set_=replaced)
+
+
+def _flush(db: Session, chunk, report):
+    """Upsert one chunk of validated (line, values) rows and commit it."""
+    known = {project_id for (project_id,) in db.query(Project.id).filter(
+        Project.id.in_({values['project_id'] for _, values in chunk})
+    )}
+    rows = {}
+    for line, values in chunk:
+        if values['project_id'] not in known:
+            report['errors'].append({'row': line, 'errors': [f"projectId: unknown project {values['project_id']}"]})
+            continue
+        # The last occurrence of a sprint in a chunk wins, as it would across chunks
+        rows[(values['project_id'], values['sprint_number'])] = {column: values.get(column) for column in COLUMNS}
+    if rows:
+        db.execute(_upsert_statement(db.get_bind().dialect), list(rows.values()))
+        # The Core upsert bypasses the ORM events that keep project health current
+        refresh_project_health(db.connection(), {project_id for project_id, _ in rows})
+        mark_tables_changed(db, Project.__tablename__)
+        db.commit()
+        report['upserted'] += len(rows)
+
+
+def ingest_sprints(db: Session, records, project_id=None, chunk_size=CHUNK_SIZE):
+    """Validate and upsert sprint records on (project_id, sprint_number), chunk by chunk.
+
+    Each chunk is validated, then written with one multi-row INSERT ... ON
+    CONFLICT DO UPDATE and committed, so memory stays bounded and earlier
+    chunks are kept if a later one fails. An upsert replaces every sprint
+    field; fields missing from the row become NULL. Rows are numbered from 1,
+    excluding a CSV header line. Invalid rows are reported and skipped.
+    """
+    report = {'received': 0, 'upserted': 0, 'errors': [], 'ignoredFields': set()}
+    chunk = []
+    for line, record in enumerate(records, start=1):
+        report['received'] += 1
+        if isinstance(record, Exception):
+            report['errors'].append({'row': line, 'errors': [str(record)]})
+            continue
+        values, errors, ignored = validate_row(record, project_id)
+        report['ignoredFields'] |= ignored
+        if errors:
+            report['errors'].append({'row': line, 'errors': errors})
+            continue
+        chunk.append((line, values))
+        if len(chunk) >= chunk_size:
+            _flush(db, chunk, report)
+            chunk = []
+    if chunk:
+        _flush(db, chunk, report)
+    report['errors'].sort(key=lambda error: error['row'])
+    report['ignoredFields'] = sorted(report['ignoredFields'])
+    return report
@@ -0,0 +1,130 @@
+from sqlalchemy import Float, case, cast, func, select
+from sqlalchemy.orm import Session
+from src.domain.models import Project
+from src.domain.models.sprint import Sprint
+
+DEFAULT_WINDOW = 3
+MAX_WINDOW = 20
+
+# Per-sprint metrics smoothed with a trailing average and fitted with a trend line
+TRENDED = {
+    'velocity': Sprint.velocity,
+    'predictability': Sprint.predictability,
+    'defectLeakage': Sprint.defect_leakage,
+}
+
+
+def _ratio(numerator, denominator):
+    return cast(numerator, Float) / func.nullif(cast(denominator, Float), 0, type_=Float)
+
+
+def _slope(y, x, over):
+    """Least-squares slope of y against x across the window, ignoring rows where y is NULL."""
+    x = cast(case((y.isnot(None), x)), Float)
+    n = func.count(y).over(**over)
+    sum_x = func.sum(x).over(**over)
+    sum_y = func.sum(y).over(**over)
+    sum_xy = func.sum(x * y).over(**over)
+    sum_xx = func.sum(x * x).over(**over)
+    return (n * sum_xy - sum_x * sum_y) / func.nullif(n * sum_xx - sum_x * sum_x, 0, type_=Float)
+
+
+def sprint_stats(db: Session, project_id, last=None, window=DEFAULT_WINDOW):
+    """Rolling averages, ratios and trend slopes for a project's sprints, in sprint order.
+
+    The rolling averages cover the current and window - 1 preceding sprints
+    and are computed over all of the project's sprints before last= keeps
+    the most recent ones, so the first returned sprint is smoothed with its
+    real predecessors. Trend slopes (change per sprint) cover the returned
+    sprints only. Everything is computed by window functions in one query
+    served by the (project_id, sprint_number) index.
+    """
+    ordered = {'order_by': Sprint.sprint_number}
+    trailing = {**ordered, 'rows': (-(window - 1), 0)}
+    inner = select(
+        Sprint.sprint_number,
+        Sprint.name,
+        Sprint.start_date,
+        Sprint.end_date,
+        *[column.label(name) for name, column in TRENDED.items()],
+        *[func.avg(column).over(**trailing).label(f'{name}_rolling') for name, column in TRENDED.items()],
+        _ratio(Sprint.completed_story_points, Sprint.planned_story_points).label('completion_ratio'),
+        _ratio(Sprint.test_cases_passed, Sprint.test_cases_executed).label('test_pass_rate'),
+        func.row_number().over(order_by=Sprint.sprint_number.desc()).label('recency'),
+    ).where(Sprint.project_id == project_id).subquery()
+
+    stats = select(
+        inner,
+        *[_slope(inner.c[name], inner.c.sprint_number, {}).label(f'{name}_slope') for name in TRENDED],
+    ).order_by(inner.c.sprint_number)
+    if last:
+        stats = stats.where(inner.c.recency <= last)
+    rows = db.execute(stats).mappings().all()
+
+    sprints = [{
+        'sprintNumber': row['sprint_number'],
+        'name': row['name'],
+        'startDate': row['start_date'].isoformat() if row['start_date'] else None,
+        'endDate': row['end_date'].isoformat() if row['end_date'] else None,
+        **{name: row[name] for name in TRENDED},
+        **{f'{name}Rolling': row[f'{name}_rolling'] for name in TRENDED},
+        'completionRatio': row['completion_ratio'],
+        'testPassRate': row['test_pass_rate'],
+    } for row in rows]
+    trend = {name: rows[0][f'{name}_slope'] if rows else None for name in TRENDED}
+    return {'projectId': project_id, 'window': window, 'sprints': sprints, 'trend': trend}
+
+
+def portfolio_sprint_rollup(db: Session, window=DEFAULT_WINDOW, criteria=()):
+    """Per project: latest sprint velocity and averages over its last `window` sprints.
+
+    One query: a window function ranks each project's sprints from the most
+    recent, and the projects (optionally filtered by criteria) are grouped
+    over the ranked rows within the window. Projects without sprints are
+    listed with empty metrics.
+    """
+    ranked = select(
+        Sprint.project_id,
+        Sprint.sprint_number,
+        Sprint.velocity,
+        Sprint.predictability,
+        Sprint.defect_leakage,
+        Sprint.on_time_delivery,
+        func.row_number().over(
+            partition_by=Sprint.project_id, order_by=Sprint.sprint_number.desc()
+        ).label('recency'),
+    ).subquery()
+    latest = ranked.c.recency == 1
+    rows = db.execute(
+        select(
+            Project.id,
+            Project.name,
+            Project.status,
+            func.count(ranked.c.sprint_number).label('sprint_count'),
+            func.max(case((latest, ranked.c.sprint_number))).label('latest_sprint_number'),
+            func.max(case((latest, ranked.c.velocity))).label('latest_velocity'),
+            func.avg(ranked.c.velocity).label('avg_velocity'),
+            func.avg(ranked.c.predictability).label('avg_predictability'),
+            func.avg(ranked.c.defect_leakage).label('avg_defect_leakage'),
+            func.avg(ranked.c.on_time_delivery).label('avg_on_time_delivery'),
+        )
+        .outerjoin(ranked, (ranked.c.project_id == Project.id) & (ranked.c.recency <= window))
+        .where(*criteria)
+        .group_by(Project.id, Project.name, Project.status)
+        .order_by(Project.id)
+    ).mappings()
+    return {
+        'window': window,
+        'projects': [{
+            'projectId': row['id'],
+            'name': row['name'],
+            'status': row['status'],
+            'sprintCount': row['sprint_count'],
+            'latestSprintNumber': row['latest_sprint_number'],
+            'latestVelocity': row['latest_velocity'],
+            'avgVelocity': row['avg_velocity'],
+            'avgPredictability': row['avg_predictability'],
+            'avgDefectLeakage': row['avg_defect_leakage'],
+            'avgOnTimeDelivery': row['avg_on_time_delivery'],
+        } for row in rows],
+    }
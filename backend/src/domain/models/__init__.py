@@ -6,6 +6,8 @@ from .milestone import Milestone
 from .risk import Risk
 from .kpi import KPI
 from .finance import Finance
+from .assignment import ProjectAssignment
+from .skill import Skill, ResourceSkill
 
 __all__ = [
     "Resource",
@@ -15,5 +17,8 @@ __all__ = [
     "Milestone",
     "Risk",
     "KPI",
-    "Finance"
+    "Finance",
+    "ProjectAssignment",
+    "Skill",
+    "ResourceSkill"
 ]
\ No newline at end of file
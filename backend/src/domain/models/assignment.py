@@ -0,0 +1,87 @@
+from sqlalchemy import event, func, inspect, select
+from src.presentation.extensions import db
+from src.domain.models.base import RowTracked
+from src.domain.models.project import Project
+from src.domain.models.resource import Resource
+
+from sqlalchemy.orm import relationship
+
+class ProjectAssignment(RowTracked, db.Model):
+    """A resource staffed on a project, with its allocation and dates."""
+    __tablename__ = 'project_assignments'
+    id = db.Column(db.Integer, primary_key=True)
+    project_id = db.Column(db.Integer, db.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False)
+    resource_id = db.Column(db.Integer, db.ForeignKey('resources.id', ondelete='CASCADE'), nullable=False, index=True)
+    allocation_percentage = db.Column(db.Float, nullable=False, default=100.0, server_default='100')
+    start_date = db.Column(db.Date)
+    end_date = db.Column(db.Date)
+
+    project = relationship('Project', back_populates='assignments')
+    resource = relationship('Resource', back_populates='assignments')
+
+    __table_args__ = (
+        # Team lookup for one or many projects is a range scan of this index
+        db.UniqueConstraint('project_id', 'resource_id', name='uq_project_assignments_project_id_resource_id'),
+    )
+
+    def to_dict(self):
+        return {
+            'projectId': self.project_id,
+            'resourceId': self.resource_id,
+            'allocationPercentage': self.allocation_percentage,
+            'startDate': self.start_date.isoformat() if self.start_date else None,
+            'endDate': self.end_date.isoformat() if self.end_date else None,
+        }
+
+
+# Resources still name their project in these free-text fields; the first one
+# that resolves to a project (by id, then by name) is kept as an assignment
+LEGACY_FIELDS = ('project_name', 'current_engagement')
+
+
+def project_for_reference(connection, reference):
+    """Id of the project a legacy project_name/current_engagement value refers to, if any."""
+    reference = (reference or '').strip()
+    if not reference:
+        return None
+    projects = Project.__table__
+    if reference.isdigit():
+        found = connection.execute(select(projects.c.id).where(projects.c.id == int(reference))).scalar()
+        if found is not None:
+            return found
+    return connection.execute(
+        select(projects.c.id).where(func.lower(projects.c.name) == reference.lower()).order_by(projects.c.id).limit(1)
+    ).scalar()
+
+
+def _legacy_project(connection, references):
+    for reference in references:
+        project_id = project_for_reference(connection, reference)
+        if project_id is not None:
+            return project_id
+    return None
+
+
+@event.listens_for(Resource, 'after_insert')
+@event.listens_for(Resource, 'after_update')
+def _sync_legacy_assignment(mapper, connection, resource):
+    """Move the resource's assignment when project_name/current_engagement change through the ORM."""
+    state = inspect(resource)
+    histories = [state.attrs[name].history for name in LEGACY_FIELDS]
+    if not any(history.has_changes() for history in histories):
+        return
+    # Values before the flush; both are empty on insert
+    old = _legacy_project(connection, [(history.deleted or history.unchanged or [None])[0] for history in histories])
+    new = _legacy_project(connection, [getattr(resource, name) for name in LEGACY_FIELDS])
+    assignments = ProjectAssignment.__table__
+    if old is not None and old != new:
+        connection.execute(assignments.delete().where(
+            (assignments.c.resource_id == resource.id) & (assignments.c.project_id == old)
+        ))
+    if new is not None and connection.execute(select(assignments.c.id).where(
+        (assignments.c.resource_id == resource.id) & (assignments.c.project_id == new)
+    )).first() is None:
+        connection.execute(assignments.insert().values(
+            project_id=new, resource_id=resource.id,
+            start_date=resource.engagement_start_date, end_date=resource.engagement_end_date,
+        ))
@@ -0,0 +1,49 @@
+import json
+from datetime import datetime, timezone
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.types import JSON, TypeDecorator
+from src.presentation.extensions import db
+
+
+def utcnow():
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class RowTracked:
+    """Stamps row_updated_at on every ORM insert and update.
+
+    Kept apart from client-supplied dates (Sprint.updated_at) so it only ever
+    records when the row itself last changed; conditional GETs derive their
+    validators from max(row_updated_at) and the row count.
+    """
+    row_updated_at = db.Column(db.DateTime, default=utcnow, onupdate=utcnow,
+                               server_default=db.func.now(), index=True)
+
+
+class JSONDocument(TypeDecorator):
+    """JSON document column: JSONB on PostgreSQL, JSON text elsewhere.
+
+    Every load decodes into a value of its own (PostgreSQL does it in the
+    driver); the session's identity map keeps it for the row version. Strings
+    holding a JSON object or array, as written before the column was JSON,
+    are stored decoded.
+    Path access such as Project.engineering_metrics['qa'] is evaluated in SQL.
+    """
+    impl = JSON
+    cache_ok = True
+
+    def __init__(self):
+        super().__init__(none_as_null=True)
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == 'postgresql':
+            return dialect.type_descriptor(JSONB(none_as_null=True))
+        return dialect.type_descriptor(JSON(none_as_null=True))
+
+    def process_bind_param(self, value, dialect):
+        if isinstance(value, str) and value.lstrip()[:1] in ('{', '['):
+            try:
+                return json.loads(value)
+            except ValueError:
+                pass
+        return value
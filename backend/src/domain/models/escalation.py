@@ -1,6 +1,7 @@
 from ...presentation.extensions import db
+from .base import RowTracked
 
-class Escalation(db.Model):
+class Escalation(RowTracked, db.Model):
     __tablename__ = 'escalations'
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String, nullable=False)
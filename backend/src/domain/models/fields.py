@@ -0,0 +1,172 @@
+import json
+from datetime import date, datetime
+from sqlalchemy import types
+
+# Boolean request values besides true/false themselves
+TRUE_STRINGS = ('true', '1', 'yes')
+FALSE_STRINGS = ('false', '0', 'no')
+
+
+def camel_case(name):
+    head, *rest = name.split('_')
+    return head + ''.join(part[:1].upper() + part[1:] for part in rest)
+
+
+def parse_string(value):
+    if isinstance(value, (list, tuple)):
+        # Multi-valued text columns (skills) are stored comma separated
+        return ','.join(str(item).strip() for item in value if str(item).strip())
+    if isinstance(value, (dict, bool)):
+        raise ValueError
+    return str(value)
+
+
+def parse_integer(value):
+    if isinstance(value, bool):
+        raise ValueError
+    number = float(value)
+    if not number.is_integer():
+        raise ValueError
+    return int(number)
+
+
+def parse_float(value):
+    if isinstance(value, bool):
+        raise ValueError
+    return float(value)
+
+
+def parse_boolean(value):
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in TRUE_STRINGS:
+        return True
+    if text in FALSE_STRINGS:
+        return False
+    raise ValueError
+
+
+def parse_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    # Accepts 'YYYY-MM-DD' and full ISO timestamps such as JavaScript's toISOString()
+    return date.fromisoformat(str(value)[:10])
+
+
+def parse_datetime(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+
+
+# Column type -> request value parser; checked in order, so subclasses come first
+PARSERS = (
+    (types.Boolean, parse_boolean),
+    (types.DateTime, parse_datetime),
+    (types.Date, parse_date),
+    (types.Integer, parse_integer),
+    (types.Float, parse_float),
+    (types.Numeric, parse_float),
+    (types.String, parse_string),
+)
+
+
+def _parser(column):
+    column_type = column.type
+    if isinstance(column_type, types.TypeDecorator):
+        return lambda value: value
+    return next((parse for base, parse in PARSERS if isinstance(column_type, base)), lambda value: value)
+
+
+def _formatter(column):
+    if isinstance(column.type, (types.Date, types.DateTime)):
+        return lambda value: str(value) if value else ''
+    return lambda value: value
+
+
+class FieldMap:
+    """Request and response names of a model's columns, computed once from its __table__.
+
+    Each column is known by its name and its camelCase form (or the name
+    given in `names`). decode() turns a request body into column values
+    without touching the database; encode() renders the `response` columns
+    (all by default) of an instance under the camelCase names.
+    `parsers`/`formats` override the per-type conversions for single
+    columns. Keys in `ignored`, and the read-only id and row_updated_at
+    columns, are accepted in requests and dropped. Creates must carry every
+    NOT NULL column without a default, plus the columns named in `required`.
+    """
+
+    def __init__(self, model, names=None, parsers=None, formats=None, ignored=(), response=None, required=()):
+        self.model = model
+        columns = {column.key: column for column in model.__table__.columns}
+        read_only = {name for name in ('id', 'row_updated_at') if name in columns}
+        self.names = {name: (names or {}).get(name, camel_case(name)) for name in columns}
+        self.keys = {}
+        for name in columns:
+            if name not in read_only:
+                self.keys[name] = self.keys[camel_case(name)] = self.keys[self.names[name]] = name
+        self.ignored = set(ignored) | read_only | {self.names[name] for name in read_only}
+        self.parsers = {name: _parser(column) for name, column in columns.items()}
+        self.parsers.update(parsers or {})
+        formats = formats or {}
+        self.formatters = {name: formats.get(name) or _formatter(columns[name]) for name in response or columns}
+        self.required = [name for name, column in columns.items()
+                         if not column.nullable and name not in read_only
+                         and column.default is None and column.server_default is None]
+        self.required += [name for name in required if name not in self.required]
+        self.not_null = {name for name, column in columns.items() if not column.nullable}
+
+    def decode(self, data, partial=False):
+        """{column: value} from a request body; raises ValueError naming every bad field.
+
+        Empty strings become None. Unless partial (an update), the required
+        columns must be present.
+        """
+        if not isinstance(data, dict):
+            raise ValueError('Request body must be a JSON object')
+        values, unknown, errors = {}, [], []
+        for key, raw in data.items():
+            name = self.keys.get(key)
+            if name is None:
+                if key not in self.ignored:
+                    unknown.append(key)
+                continue
+            if raw is None or raw == '':
+                values[name] = None
+                continue
+            try:
+                values[name] = self.parsers[name](raw)
+            except (TypeError, ValueError):
+                errors.append(f'{key}: invalid value {raw!r}')
+        if not partial:
+            errors += [f'{self.names[name]} is required' for name in self.required if values.get(name) is None]
+        errors += [f'{self.names[name]} must not be empty' for name in self.not_null & values.keys()
+                   if values[name] is None and (partial or name not in self.required)]
+        if unknown:
+            errors.insert(0, f"Unknown fields: {', '.join(sorted(unknown))}")
+        if errors:
+            raise ValueError('; '.join(errors))
+        return values
+
+    def encode(self, instance):
+        """{camelCase name: formatted value} for the response columns of an instance."""
+        return {self.names[name]: format(getattr(instance, name)) for name, format in self.formatters.items()}
+
+
+def split_list(value):
+    return value.split(',') if value else []
+
+
+def json_or_split(value):
+    """Strings from text holding a JSON array, a JSON scalar or a comma separated list."""
+    if not value:
+        return []
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return [item.strip() for item in value.split(',') if item.strip()]
+    return [str(item) for item in parsed] if isinstance(parsed, list) else [str(parsed)]
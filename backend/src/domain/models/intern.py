@@ -1,4 +1,5 @@
 from ...presentation.extensions import db
+from .fields import FieldMap
 
 class Intern(db.Model):
     __tablename__ = 'interns'
@@ -55,3 +56,8 @@ class Intern(db.Model):
     location = db.Column(db.String)
     seniority_level = db.Column(db.String)
     is_intern = db.Column(db.Boolean)
+
+
+# Request keys and response fields of Intern; built once from its columns.
+# employee_id is nullable on interns but every created intern must carry one.
+INTERN_FIELD_MAP = FieldMap(Intern, required=('employee_id',))
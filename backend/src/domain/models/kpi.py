@@ -1,6 +1,8 @@
 from ...presentation.extensions import db
+from .base import RowTracked
+from sqlalchemy.orm import relationship
 
-class KPI(db.Model):
+class KPI(RowTracked, db.Model):
     __tablename__ = 'kpis'
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
@@ -22,3 +24,8 @@ class KPI(db.Model):
     kpi_actual = db.Column(db.Float)
     kpi_status = db.Column(db.String)
     # Add more fields as needed for analytics/reporting
+
+    project = relationship('Project', back_populates='kpi_records')
+
+    def to_dict(self):
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
@@ -1,6 +1,8 @@
 from src.presentation.extensions import db
+from src.domain.models.base import RowTracked
+from sqlalchemy.orm import relationship
 
-class Milestone(db.Model):
+class Milestone(RowTracked, db.Model):
     __tablename__ = 'milestones'
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
@@ -17,5 +19,7 @@ class Milestone(db.Model):
     risk_level = db.Column(db.String)
     # Add more fields as needed for analytics/reporting
 
+    project = relationship('Project', back_populates='milestones')
+
     def to_dict(self):
         return {c.name: getattr(self, c.name) for c in self.__table__.columns}
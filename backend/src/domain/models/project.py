@@ -1,8 +1,9 @@
 from src.presentation.extensions import db
+from src.domain.models.base import RowTracked, JSONDocument
 
 from sqlalchemy.orm import relationship
 
-class Project(db.Model):
+class Project(RowTracked, db.Model):
     __tablename__ = 'projects'
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String, nullable=False)
@@ -36,26 +37,37 @@ class Project(db.Model):
     department = db.Column(db.String)
     engineering_manager = db.Column(db.String)
     required_skills_list = db.Column(db.String)
-    kpis = db.Column(db.String)
+    kpis = db.Column(JSONDocument())
     financial_summary = db.Column(db.String)
     resource_allocation = db.Column(db.String)
     engagement_plan = db.Column(db.String)
     status_detail = db.Column(db.String)
     priority_level = db.Column(db.String)
-    velocity_trend = db.Column(db.String)
-    teams = db.Column(db.String)
-    engineering_metrics = db.Column(db.String)
+    velocity_trend = db.Column(JSONDocument())
+    teams = db.Column(JSONDocument())
+    engineering_metrics = db.Column(JSONDocument())
+    # Derived from sprints, risks, milestones and escalations by src.application.project_health
+    health_score = db.Column(db.Float, nullable=False, default=100.0, server_default='100')
+    health_rating = db.Column(db.String, nullable=False, default='Green', server_default='Green')
     sprints = relationship('Sprint', back_populates='project', cascade='all, delete-orphan')
+    milestones = relationship('Milestone', back_populates='project', order_by='Milestone.id')
+    risks = relationship('Risk', back_populates='project', order_by='Risk.id')
+    # `kpis` is the legacy serialized column; these are the rows of the kpis table
+    kpi_records = relationship('KPI', back_populates='project', order_by='KPI.id')
+    assignments = relationship('ProjectAssignment', back_populates='project', cascade='all, delete-orphan')
+    # Larger JSON documents, left out of project listings unless asked for
+    JSON_FIELDS = ("teams", "engineering_metrics")
+
+    __table_args__ = (
+        # Filter + keyset pagination on GET /projects: WHERE <column> = ? AND id > ? ORDER BY id
+        db.Index('ix_projects_status_id', 'status', 'id'),
+        db.Index('ix_projects_health_status_id', 'health_status', 'id'),
+        db.Index('ix_projects_client_id', 'client', 'id'),
+        db.Index('ix_projects_priority_id', 'priority', 'id'),
+        db.Index('ix_projects_health_rating_id', 'health_rating', 'id'),
+        # Keyset pagination ordered by health: ORDER BY health_score, id
+        db.Index('ix_projects_health_score_id', 'health_score', 'id'),
+    )
+
     def to_dict(self):
-        import json
-        result = {c.name: getattr(self, c.name) for c in self.__table__.columns}
-        for field in ["teams", "engineering_metrics"]:
-            val = getattr(self, field, None)
-            if val:
-                try:
-                    result[field] = json.loads(val)
-                except Exception:
-                    result[field] = val
-            else:
-                result[field] = None
-        return result
+        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
@@ -1,7 +1,10 @@
 from flask_sqlalchemy import SQLAlchemy
 from src.presentation.extensions import db
+from src.domain.models.base import RowTracked
+from src.domain.models.fields import FieldMap, json_or_split, split_list
+from sqlalchemy.orm import relationship
 
-class Resource(db.Model):
+class Resource(RowTracked, db.Model):
     __tablename__ = 'resources'
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.String, unique=True, nullable=False)
@@ -13,7 +16,7 @@ class Resource(db.Model):
     seniority_level = db.Column(db.String)
     experience = db.Column(db.Float)
     location = db.Column(db.String)
-    joining_date = db.Column(db.Date)
+    joining_date = db.Column(db.Date, index=True)
     employment_type = db.Column(db.String)
     reporting_manager = db.Column(db.String)
     primary_skill = db.Column(db.String)
@@ -28,7 +31,7 @@ class Resource(db.Model):
     current_bench_status = db.Column(db.Boolean)
     engagement_detail = db.Column(db.String)
     is_intern = db.Column(db.Boolean)
-    internship_start_date = db.Column(db.Date)
+    internship_start_date = db.Column(db.Date, index=True)
     internship_end_date = db.Column(db.Date)
     assigned_project = db.Column(db.String)
     mentor_name = db.Column(db.String)
@@ -60,7 +63,7 @@ class Resource(db.Model):
     last_project_end_date = db.Column(db.Date)
     primary_skills = db.Column(db.String)
     secondary_skills = db.Column(db.String)
-    bench_start_date = db.Column(db.Date)
+    bench_start_date = db.Column(db.Date, index=True)
     bench_aging_bucket = db.Column(db.String)
     bench_monthly_cost = db.Column(db.Float)
     bench_avg_daily_cost = db.Column(db.Float)
@@ -80,7 +83,7 @@ class Resource(db.Model):
     performance_trend = db.Column(db.String)
     engagement_options = db.Column(db.String)
     engagement_notes = db.Column(db.String)
-    release_date = db.Column(db.Date)
+    release_date = db.Column(db.Date, index=True)
     role = db.Column(db.String)
     project_success_rate = db.Column(db.Float)
     performance_feedback_reviewer = db.Column(db.String)
@@ -91,49 +94,50 @@ class Resource(db.Model):
     performance_feedback_improvements = db.Column(db.String)
     performance_feedback_goals = db.Column(db.String)
     last_working_day = db.Column(db.Date)  # Added for resignations tracking
+    assignments = relationship('ProjectAssignment', back_populates='resource', cascade='all, delete-orphan')
+    skill_links = relationship('ResourceSkill', back_populates='resource', cascade='all, delete-orphan')
+
+    __table_args__ = (
+        # /api/resources filters, each paged in id order
+        db.Index('ix_resources_department_id', 'department', 'id'),
+        db.Index('ix_resources_location_id', 'location', 'id'),
+        db.Index('ix_resources_seniority_level_id', 'seniority_level', 'id'),
+        db.Index('ix_resources_billable_status_id', 'billable_status', 'id'),
+        db.Index('ix_resources_is_intern_id', 'is_intern', 'id'),
+        db.Index('ix_resources_current_bench_status_id', 'current_bench_status', 'id'),
+        # /api/resources sort keys: ORDER BY <key>, id
+        db.Index('ix_resources_full_name_id', 'full_name', 'id'),
+        db.Index('ix_resources_joining_date_id', 'joining_date', 'id'),
+        db.Index('ix_resources_bench_days_id', 'bench_days', 'id'),
+        # Resignation and release windows: range scans over the few rows that have a date
+        db.Index('ix_resources_last_working_day_id', 'last_working_day', 'id',
+                 postgresql_where=db.text('last_working_day IS NOT NULL'),
+                 sqlite_where=db.text('last_working_day IS NOT NULL')),
+        db.Index('ix_resources_engagement_end_date_id', 'engagement_end_date', 'id',
+                 postgresql_where=db.text('engagement_end_date IS NOT NULL'),
+                 sqlite_where=db.text('engagement_end_date IS NOT NULL')),
+    )
 
     def to_dict(self):
         result = {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        result.update(RESOURCE_FIELD_MAP.encode(self))
         result['employeeId'] = self.employee_id or self.id
-        result['fullName'] = self.full_name
-        result['email'] = self.email
-        result['phone'] = self.phone
-        result['skills'] = self.skills.split(',') if self.skills else []
-        import json
-        # Fix for malformed JSON or stringified arrays
-        if self.primary_skills:
-            try:
-                # Try to parse as JSON array
-                parsed = json.loads(self.primary_skills)
-                if isinstance(parsed, list):
-                    result['primarySkills'] = parsed
-                else:
-                    result['primarySkills'] = [str(parsed)]
-            except Exception:
-                # Fallback: split by comma
-                result['primarySkills'] = [s.strip() for s in self.primary_skills.split(',') if s.strip()]
-        else:
-            result['primarySkills'] = []
-        result['secondarySkills'] = self.secondary_skills.split(',') if self.secondary_skills else []
-        result['seniorityLevel'] = self.seniority_level
-        result['experience'] = self.experience
-        result['joiningDate'] = str(self.joining_date) if self.joining_date else ''
-        result['employmentType'] = self.employment_type
-        result['reportingManager'] = self.reporting_manager
-        result['billableStatus'] = self.billable_status
-        result['currentEngagement'] = self.current_engagement
-        result['projectName'] = self.project_name
-        result['engagementDescription'] = self.engagement_description
-        result['engagementStartDate'] = str(self.engagement_start_date) if self.engagement_start_date else ''
-        result['engagementEndDate'] = str(self.engagement_end_date) if self.engagement_end_date else ''
-        result['monthlySalaryCost'] = self.monthly_salary_cost
-        result['billingRate'] = self.billing_rate
-        result['monthlyRevenueGenerated'] = self.monthly_revenue_generated
-        result['costCenter'] = self.cost_center
-        result['totalYTDCost'] = self.total_ytd_cost
-        result['totalYTDRevenue'] = self.total_ytd_revenue
-        result['benchDays'] = self.bench_days
-        result['benchStartDate'] = str(self.bench_start_date) if self.bench_start_date else ''
-        result['is_intern'] = self.is_intern
-        result['lastWorkingDay'] = str(self.last_working_day) if self.last_working_day else ''
         return result
+
+
+# Request keys and response fields of Resource; built once from its columns
+RESOURCE_FIELD_MAP = FieldMap(
+    Resource,
+    names={'total_ytd_cost': 'totalYTDCost', 'total_ytd_revenue': 'totalYTDRevenue'},
+    formats={'skills': split_list, 'primary_skills': json_or_split, 'secondary_skills': split_list},
+    # The add-resource form echoes the id it was given back as resourceId
+    ignored=('resourceId',),
+    # camelCase keys of to_dict(), besides the snake_case columns
+    response=(
+        'full_name', 'email', 'phone', 'skills', 'primary_skills', 'secondary_skills', 'seniority_level',
+        'experience', 'joining_date', 'employment_type', 'reporting_manager', 'billable_status',
+        'current_engagement', 'project_name', 'engagement_description', 'engagement_start_date',
+        'engagement_end_date', 'monthly_salary_cost', 'billing_rate', 'monthly_revenue_generated', 'cost_center',
+        'total_ytd_cost', 'total_ytd_revenue', 'bench_days', 'bench_start_date', 'last_working_day',
+    ),
+)
@@ -1,6 +1,8 @@
 from src.presentation.extensions import db
+from src.domain.models.base import RowTracked
+from sqlalchemy.orm import relationship
 
-class Risk(db.Model):
+class Risk(RowTracked, db.Model):
     __tablename__ = 'risks'
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String, nullable=False)
@@ -20,5 +22,7 @@ class Risk(db.Model):
     notes = db.Column(db.String)
     # Add more fields as needed for analytics/reporting
 
+    project = relationship('Project', back_populates='risks')
+
     def to_dict(self):
         return {c.name: getattr(self, c.name) for c in self.__table__.columns}
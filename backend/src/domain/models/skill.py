@@ -0,0 +1,124 @@
+from sqlalchemy import event, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import relationship
+from src.presentation.extensions import db
+from src.domain.models.base import RowTracked
+from src.domain.models.fields import json_or_split, split_list
+from src.domain.models.resource import Resource
+
+
+class Skill(RowTracked, db.Model):
+    """A distinct skill name; `key` is the case-insensitive identity."""
+    __tablename__ = 'skills'
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String, nullable=False)
+    key = db.Column(db.String, nullable=False, unique=True)
+
+    def to_dict(self):
+        return {'id': self.id, 'name': self.name}
+
+
+class ResourceSkill(RowTracked, db.Model):
+    """One skill listed in one of a resource's skill columns (`kind`)."""
+    __tablename__ = 'resource_skills'
+    id = db.Column(db.Integer, primary_key=True)
+    resource_id = db.Column(db.Integer, db.ForeignKey('resources.id', ondelete='CASCADE'), nullable=False)
+    skill_id = db.Column(db.Integer, db.ForeignKey('skills.id', ondelete='CASCADE'), nullable=False)
+    kind = db.Column(db.String, nullable=False)
+
+    skill = relationship('Skill')
+    resource = relationship('Resource', back_populates='skill_links')
+
+    __table_args__ = (
+        db.UniqueConstraint('resource_id', 'kind', 'skill_id', name='uq_resource_skills_resource_id_kind_skill_id'),
+        # "Who has skill X" and per-skill counts read this index only
+        db.Index('ix_resource_skills_skill_id_kind_resource_id', 'skill_id', 'kind', 'resource_id'),
+    )
+
+
+# Resource column indexed as a kind -> parser of its raw text
+SKILL_COLUMNS = {
+    'skills': split_list,
+    # primary_skills holds a JSON array, a JSON scalar or a comma separated list
+    'primary_skills': json_or_split,
+    'secondary_skills': split_list,
+    'skillset': split_list,
+}
+
+
+def skill_key(name):
+    return name.strip().lower()
+
+
+def skill_names(kind, value):
+    """Distinct skill names (stripped, first spelling kept) listed in a resource column."""
+    if not value:
+        return []
+    names = {}
+    for name in SKILL_COLUMNS[kind](value):
+        name = name.strip()
+        if name:
+            names.setdefault(skill_key(name), name)
+    return list(names.values())
+
+
+def _insert_missing_statement(dialect):
+    insert = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}.get(dialect.name)
+    if insert is None:
+        raise NotImplementedError(f'Skill index inserts are not supported on {dialect.name}')
+    return insert(Skill.__table__).on_conflict_do_nothing(index_elements=['key'])
+
+
+def skill_ids(connection, names):
+    """{key: skill id} for the names, creating the skills that do not exist yet.
+
+    Skills another transaction creates between the lookup and the insert are
+    skipped by ON CONFLICT DO NOTHING and picked up by the second lookup, so
+    concurrent saves introducing the same skill do not fail.
+    """
+    keys = {}
+    for name in names:
+        keys.setdefault(skill_key(name), name)
+    if not keys:
+        return {}
+    skills = Skill.__table__
+    found = dict(connection.execute(select(skills.c.key, skills.c.id).where(skills.c.key.in_(keys))).all())
+    missing = [{'name': name, 'key': key} for key, name in keys.items() if key not in found]
+    if missing:
+        connection.execute(_insert_missing_statement(connection.dialect), missing)
+        found.update(connection.execute(
+            select(skills.c.key, skills.c.id).where(skills.c.key.in_([row['key'] for row in missing]))
+        ).all())
+    return found
+
+
+def index_resource_skills(connection, values):
+    """Replace the skill rows of the given (resource id, kind) pairs.
+
+    `values` maps (resource id, kind) to the raw column text. The old rows are
+    deleted and the new ones inserted with a few statements per call.
+    """
+    if not values:
+        return
+    links = ResourceSkill.__table__
+    by_kind = {}
+    for resource_id, kind in values:
+        by_kind.setdefault(kind, []).append(resource_id)
+    for kind, resource_ids in by_kind.items():
+        connection.execute(links.delete().where(links.c.kind == kind, links.c.resource_id.in_(resource_ids)))
+    names = {pair: skill_names(pair[1], raw) for pair, raw in values.items()}
+    ids = skill_ids(connection, [name for listed in names.values() for name in listed])
+    rows = [{'resource_id': resource_id, 'kind': kind, 'skill_id': ids[skill_key(name)]}
+            for (resource_id, kind), listed in names.items() for name in listed]
+    if rows:
+        connection.execute(links.insert(), rows)
+
+
+@event.listens_for(Resource, 'after_insert')
+@event.listens_for(Resource, 'after_update')
+def _sync_skill_index(mapper, connection, resource):
+    """Re-index the skill columns changed through the ORM."""
+    state = inspect(resource)
+    changed = {(resource.id, kind): getattr(resource, kind) for kind in SKILL_COLUMNS
+               if state.attrs[kind].history.has_changes()}
+    index_resource_skills(connection, changed)
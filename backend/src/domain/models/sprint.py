@@ -1,8 +1,9 @@
 
 from src.presentation.extensions import db
+from src.domain.models.base import RowTracked
 from sqlalchemy.orm import relationship
 
-class Sprint(db.Model):
+class Sprint(RowTracked, db.Model):
     __tablename__ = 'sprints'
     id = db.Column(db.Integer, primary_key=True)
     project_id = db.Column(db.Integer, db.ForeignKey('projects.id'), nullable=False)
@@ -23,3 +24,28 @@ class Sprint(db.Model):
     # Add more fields as needed for metrics
 
     project = relationship('Project', back_populates='sprints')
+
+    __table_args__ = (
+        # One row per sprint of a project: bulk ingestion upserts on it, and the
+        # /projects/<id>/sprints/stats windows scan it in order
+        db.Index('uq_sprints_project_id_sprint_number', 'project_id', 'sprint_number', unique=True),
+    )
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'sprintNumber': self.sprint_number,
+            'name': self.name,
+            'velocity': self.velocity,
+            'predictability': self.predictability,
+            'defectLeakage': self.defect_leakage,
+            'onTimeDelivery': self.on_time_delivery,
+            'startDate': self.start_date.isoformat() if self.start_date else None,
+            'endDate': self.end_date.isoformat() if self.end_date else None,
+            'plannedStoryPoints': self.planned_story_points,
+            'completedStoryPoints': self.completed_story_points,
+            'testCasesExecuted': self.test_cases_executed,
+            'testCasesPassed': self.test_cases_passed,
+            'createdAt': self.created_at.isoformat() if self.created_at else None,
+            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
+        }
@@ -0,0 +1,137 @@
+import threading
+import time
+from collections import OrderedDict
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+
+class TableVersions:
+    """Process-wide version counter per table, bumped whenever a tracked table changes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+        self._listeners = []
+
+    def add_listener(self, listener):
+        """Call listener(tables) after every bump; it must return quickly."""
+        self._listeners.append(listener)
+
+    def bump(self, *tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+        for listener in self._listeners:
+            listener(tables)
+
+    def get(self, table):
+        return self._versions.get(table, 0)
+
+    def snapshot(self, tables):
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def as_dict(self):
+        with self._lock:
+            return dict(self._versions)
+
+
+table_versions = TableVersions()
+
+
+def mark_tables_changed(session, *tables):
+    """Bump the tables' versions when the session commits; for writes that bypass ORM events."""
+    # Bumped on commit so readers never cache uncommitted state under the new version
+    session.info.setdefault('changed_tables', set()).update(tables)
+
+
+def _mark_changed(mapper, connection, target):
+    table = mapper.local_table.name
+    session = object_session(target)
+    if session is None:
+        table_versions.bump(table)
+    else:
+        mark_tables_changed(session, table)
+
+
+@event.listens_for(Session, 'after_commit')
+def _bump_committed_tables(session):
+    tables = session.info.pop('changed_tables', None)
+    if tables:
+        table_versions.bump(*tables)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changed_tables(session):
+    session.info.pop('changed_tables', None)
+
+
+def track_table_versions(*models):
+    """Bump the version of each model's table on ORM insert, update and delete.
+
+    Bulk query.update()/delete() and raw SQL bypass these events; entries
+    cached under a stale version still expire through the cache TTL.
+    """
+    for model in models:
+        for name in ('after_insert', 'after_update', 'after_delete'):
+            if not event.contains(model, name, _mark_changed):
+                event.listen(model, name, _mark_changed)
+
+
+class LRUCache:
+    """Thread-safe LRU cache with per-entry TTL and hit/miss counters."""
+
+    def __init__(self, maxsize=128, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_set(self, key, compute):
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hitRate': round(self.hits / lookups, 3) if lookups else 0,
+            }
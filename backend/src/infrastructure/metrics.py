@@ -0,0 +1,103 @@
+import bisect
+import threading
+import time
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_query_stats = ContextVar('query_stats', default=None)
+
+
+class QueryStats:
+    """Statements executed and time spent in the database while active."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+class measure:
+    """Context manager timing a block: wall seconds, DB seconds and query count.
+
+    Queries are attributed through a context variable, so only statements run
+    by the current thread (or task) inside the block are counted. Nested
+    blocks also count towards the enclosing one.
+    """
+
+    def __enter__(self):
+        self.stats = QueryStats()
+        self._parent = _query_stats.get()
+        self._token = _query_stats.set(self.stats)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.wall = time.perf_counter() - self._started
+        _query_stats.reset(self._token)
+        if self._parent is not None:
+            self._parent.count += self.stats.count
+            self._parent.seconds += self.stats.seconds
+        return False
+
+    @property
+    def queries(self):
+        return self.stats.count
+
+    @property
+    def db(self):
+        return self.stats.seconds
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _start_query(conn, cursor, statement, parameters, context, executemany):
+    if _query_stats.get() is not None:
+        conn.info.setdefault('query_started', []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def _end_query(conn, cursor, statement, parameters, context, executemany):
+    stats = _query_stats.get()
+    started = conn.info.get('query_started')
+    if stats is not None and started:
+        stats.count += 1
+        stats.seconds += time.perf_counter() - started.pop()
+
+
+class Histogram:
+    """Thread-safe labelled histogram rendered in the Prometheus text format."""
+
+    def __init__(self, name, help, labels, buckets):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bisect.bisect_left(self.buckets, value)] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted(self._series.items())
+        for label_values, (counts, total, count) in series:
+            labels = ','.join(f'{k}="{v}"' for k, v in zip(self.labels, label_values))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{{{labels},le="{le}"}} {cumulative}')
+            lines.append(f'{self.name}_sum{{{labels}}} {total}')
+            lines.append(f'{self.name}_count{{{labels}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+
+def render_metrics(*histograms):
+    return ''.join(histogram.render() for histogram in histograms)
@@ -0,0 +1,51 @@
+import hashlib
+from datetime import date
+from functools import wraps
+from flask import request, make_response
+from src.infrastructure.db import SessionLocal
+from src.application.freshness import collection_state
+
+
+def conditional(sources):
+    """Answer a GET view with 304 Not Modified while the rows behind it are unchanged.
+
+    sources(**view_args) lists the (model, *criteria) the response is built
+    from. Their max(row_updated_at) and row counts, together with the request
+    path and query string and today's date, make the ETag, so revalidation
+    costs one aggregate query and the view is not run. The date is there for
+    the views that filter relative to today (resignations, upcoming releases,
+    matching), whose answer changes at midnight without any row changing. The state is read before the view, so a
+    concurrent write can only make the next request miss, never serve stale.
+
+    Last-Modified is sent for information but If-Modified-Since is not
+    honoured: deleting a row does not move the timestamp, only the count.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if request.method != 'GET':
+                return view(*args, **kwargs)
+            try:
+                selected = sources(**kwargs)
+            except ValueError:
+                # Bad arguments; let the view report them
+                return view(*args, **kwargs)
+            db = SessionLocal()
+            try:
+                last_modified, state = collection_state(db, selected)
+            finally:
+                db.close()
+            etag = hashlib.sha1(repr((request.full_path, date.today(), state)).encode()).hexdigest()
+            if request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            if last_modified:
+                response.last_modified = last_modified
+            return response
+        return wrapper
+    return decorator
@@ -16,12 +16,14 @@ from flask_cors import cross_origin
 import logging
 from src.infrastructure.db import SessionLocal
 from src.domain.models.escalation import Escalation
+from src.presentation.conditional import conditional
 
 escalation_bp = Blueprint('escalations', __name__)
 
 # --- Escalation CRUD Endpoints ---
 @escalation_bp.route('/escalations', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda: [(Escalation,)])
 def get_escalations():
     if request.method == 'OPTIONS':
         return '', 204
@@ -50,6 +52,7 @@ def create_escalation():
 
 @escalation_bp.route('/escalations/<int:escalation_id>', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda escalation_id: [(Escalation, Escalation.id == escalation_id)])
 def get_escalation_by_id(escalation_id):
     if request.method == 'OPTIONS':
         return '', 204
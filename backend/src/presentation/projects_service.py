@@ -1,8 +1,18 @@
 from flask import Blueprint, jsonify, request, make_response
 from flask_cors import cross_origin
+import io
 import logging
 from src.infrastructure.db import SessionLocal
-from src.domain.models import Project
+from src.domain.models import Project, Milestone, Risk
+from src.application.project_details import (
+    project_details, parse_project_ids, detail_sources, project_engineering_metrics,
+    project_teams, team_sources
+)
+from src.application.project_list import list_projects, parse_filters, parse_sort, PROJECT_FIELDS
+from src.application.pagination import parse_fields, parse_limit
+from src.application.sprint_stats import sprint_stats, portfolio_sprint_rollup, DEFAULT_WINDOW, MAX_WINDOW
+from src.application.sprint_ingest import ingest_sprints, read_csv, read_ndjson
+from src.presentation.conditional import conditional
 
 projects_bp = Blueprint('projects', __name__)
 
@@ -11,6 +21,7 @@ from src.domain.models.sprint import Sprint
 # --- Project Sprints Endpoints ---
 @projects_bp.route('/projects/<int:project_id>/sprints', methods=['GET', 'POST', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda project_id: [(Sprint, Sprint.project_id == project_id)])
 def project_sprints(project_id):
     if request.method == 'OPTIONS':
         return '', 204
@@ -21,23 +32,7 @@ def project_sprints(project_id):
             sprints_data = []
             for s in sprints:
                 try:
-                    sprints_data.append({
-                        'id': s.id,
-                        'sprintNumber': s.sprint_number,
-                        'name': s.name,
-                        'velocity': s.velocity,
-                        'predictability': s.predictability,
-                        'defectLeakage': s.defect_leakage,
-                        'onTimeDelivery': s.on_time_delivery,
-                        'startDate': s.start_date.isoformat() if s.start_date else None,
-                        'endDate': s.end_date.isoformat() if s.end_date else None,
-                        'plannedStoryPoints': s.planned_story_points,
-                        'completedStoryPoints': s.completed_story_points,
-                        'testCasesExecuted': s.test_cases_executed,
-                        'testCasesPassed': s.test_cases_passed,
-                        'createdAt': s.created_at.isoformat() if s.created_at else None,
-                        'updatedAt': s.updated_at.isoformat() if s.updated_at else None
-                    })
+                    sprints_data.append(s.to_dict())
                 except Exception as sprint_err:
                     logging.error(f"Sprint serialization error: {s.id} {s.name} {sprint_err}")
                     continue
@@ -61,6 +56,8 @@ def project_sprints(project_id):
                 created_at=data.get('createdAt'),
                 updated_at=data.get('updatedAt')
             )
+            if db.query(Sprint.id).filter_by(project_id=project_id, sprint_number=sprint.sprint_number).first():
+                return jsonify({'error': f"Sprint {sprint.sprint_number} already exists for project {project_id}"}), 409
             db.add(sprint)
             db.commit()
             db.refresh(sprint)
@@ -90,41 +87,119 @@ def project_sprints(project_id):
     finally:
         db.close()
 
+# --- Bulk Sprint Ingestion Endpoints ---
+# POST /projects/<id>/sprints/bulk    (rows for one project; projectId may be omitted)
+# POST /sprints/bulk                  (rows for any project; projectId required)
+# Body: text/csv with a header line, or application/x-ndjson with one object per line.
+# Fields as in POST /projects/<id>/sprints (camelCase) or the column names.
+#   -> {'received': int, 'upserted': int, 'errors': [{'row': n, 'errors': [...]}], 'ignoredFields': [...]}
+# Rows upsert on (project_id, sprint_number); invalid rows are reported and skipped.
+BULK_READERS = {
+    'text/csv': read_csv,
+    'application/x-ndjson': read_ndjson,
+    'application/ndjson': read_ndjson,
+    'application/jsonl': read_ndjson,
+}
+
+
+def _ingest_sprint_body(project_id=None):
+    reader = BULK_READERS.get(request.mimetype)
+    if reader is None:
+        return jsonify({'error': f"Content-Type must be one of: {', '.join(BULK_READERS)}"}), 415
+    db = SessionLocal()
+    try:
+        return jsonify(ingest_sprints(db, reader(io.BufferedReader(request.stream)), project_id))
+    except Exception as e:
+        import traceback
+        print("Error in sprint bulk ingestion:", e)
+        traceback.print_exc()
+        db.rollback()
+        return jsonify({'error': str(e)}), 500
+    finally:
+        db.close()
+
+
+@projects_bp.route('/projects/<int:project_id>/sprints/bulk', methods=['POST', 'OPTIONS'])
+@cross_origin()
+def bulk_project_sprints(project_id):
+    if request.method == 'OPTIONS':
+        return '', 204
+    return _ingest_sprint_body(project_id)
+
+
+@projects_bp.route('/sprints/bulk', methods=['POST', 'OPTIONS'])
+@cross_origin()
+def bulk_sprints():
+    if request.method == 'OPTIONS':
+        return '', 204
+    return _ingest_sprint_body()
+
+# --- Project Sprint Statistics Endpoint ---
+# GET /projects/<id>/sprints/stats?last=6&window=3
+#   -> {'projectId', 'window', 'sprints': [{sprintNumber, velocity, velocityRolling, ...,
+#       completionRatio, testPassRate}], 'trend': {'velocity', 'predictability', 'defectLeakage'}}
+# last= keeps the most recent sprints; window= is the rolling average length.
+@projects_bp.route('/projects/<int:project_id>/sprints/stats', methods=['GET', 'OPTIONS'])
+@cross_origin()
+@conditional(lambda project_id: [(Sprint, Sprint.project_id == project_id)])
+def get_project_sprint_stats(project_id):
+    if request.method == 'OPTIONS':
+        return '', 204
+    try:
+        last = parse_limit(request.args.get('last'), default=None, name='last')
+        window = parse_limit(request.args.get('window'), default=DEFAULT_WINDOW, name='window', maximum=MAX_WINDOW)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    db = SessionLocal()
+    try:
+        return jsonify(sprint_stats(db, project_id, last, window))
+    except Exception as e:
+        import traceback
+        print("Error in get_project_sprint_stats:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+    finally:
+        db.close()
+
+# --- Portfolio Sprint Rollup Endpoint ---
+# GET /projects/sprint-rollup?window=3&status=Active
+#   -> {'window': 3, 'projects': [{projectId, name, status, sprintCount, latestSprintNumber,
+#       latestVelocity, avgVelocity, avgPredictability, avgDefectLeakage, avgOnTimeDelivery}]}
+# Averages cover each project's last `window` sprints; project filters as on GET /projects.
+@projects_bp.route('/projects/sprint-rollup', methods=['GET', 'OPTIONS'])
+@cross_origin()
+@conditional(lambda: [(Project, *parse_filters(request.args)), (Sprint,)])
+def get_portfolio_sprint_rollup():
+    if request.method == 'OPTIONS':
+        return '', 204
+    try:
+        window = parse_limit(request.args.get('window'), default=DEFAULT_WINDOW, name='window', maximum=MAX_WINDOW)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    db = SessionLocal()
+    try:
+        return jsonify(portfolio_sprint_rollup(db, window, parse_filters(request.args)))
+    except Exception as e:
+        import traceback
+        print("Error in get_portfolio_sprint_rollup:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+    finally:
+        db.close()
+
 # --- Project Details Endpoint ---
 @projects_bp.route('/projects/<int:project_id>/details', methods=['GET', 'OPTIONS'])
 @cross_origin(origins="*", allow_headers=["Content-Type", "Authorization"], methods=["GET", "OPTIONS"])
+@conditional(lambda project_id: detail_sources([project_id]))
 def get_project_details(project_id):
     if request.method == 'OPTIONS':
         return '', 204
     db = SessionLocal()
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
-        if not project:
+        # Project, milestones, risks, sprints and team members in a fixed number of queries
+        data = project_details(db, [project_id]).get(project_id)
+        if data is None:
             return jsonify({'error': 'Project not found'}), 404
-        data = project.to_dict()
-        # Fetch analytics and team members
-        from src.domain.models import Milestone, Risk
-        from src.domain.models.resource import Resource
-        # Milestones
-        milestones = db.query(Milestone).filter(Milestone.project_id == project_id).all()
-        data['milestones'] = [m.to_dict() for m in milestones]
-        # Risks
-        risks = db.query(Risk).filter(Risk.project_id == project_id).all()
-        data['risks'] = [r.to_dict() for r in risks]
-        # Team Members
-        team_members = db.query(Resource).filter(Resource.project_name == str(project_id)).all()
-        data['teamMembers'] = [r.to_dict() for r in team_members]
-        # Engineering Metrics
-        import json
-        metrics = {'development': {}, 'qa': {}}
-        if hasattr(project, 'engineering_metrics') and project.engineering_metrics:
-            try:
-                parsed = json.loads(project.engineering_metrics)
-                metrics['development'] = parsed.get('development', {})
-                metrics['qa'] = parsed.get('qa', {})
-            except Exception:
-                pass
-        data['engineeringMetrics'] = metrics
         return jsonify({'project': data})
     except Exception as e:
         import traceback
@@ -134,21 +209,60 @@ def get_project_details(project_id):
     finally:
         db.close()
 
+# --- Batch Project Details Endpoint ---
+# GET /projects/details?ids=1,2,3
+#   -> {'projects': {'1': {...}, '2': {...}}, 'missing': [3]}
+# Each document has the same shape as /projects/<id>/details.
+@projects_bp.route('/projects/details', methods=['GET', 'OPTIONS'])
+@cross_origin(origins="*", allow_headers=["Content-Type", "Authorization"], methods=["GET", "OPTIONS"])
+@conditional(lambda: detail_sources(parse_project_ids(request.args.get('ids'))))
+def get_projects_details():
+    if request.method == 'OPTIONS':
+        return '', 204
+    try:
+        project_ids = parse_project_ids(request.args.get('ids'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    db = SessionLocal()
+    try:
+        details = project_details(db, project_ids)
+        return jsonify({
+            'projects': {str(project_id): data for project_id, data in details.items()},
+            'missing': [project_id for project_id in project_ids if project_id not in details]
+        })
+    except Exception as e:
+        import traceback
+        print("Error in get_projects_details:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+    finally:
+        db.close()
+
 # --- Project CRUD Endpoints ---
 @projects_bp.route('/projects', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda: [(Project, *parse_filters(request.args))])
 def get_projects():
+    # GET /projects?status=Active,At Risk&client=Acme&sort=-health_score&limit=50&cursor=...&fields=id,name,status
+    #   -> {'projects': [...], 'nextCursor': str|null, 'total': int}
+    # Filters: status, health_status, client, priority, health_rating. sort= is id
+    # (default), health_score (worst first) or -health_score (healthiest first). Without fields= every column
+    # except the teams/engineering_metrics JSON documents is returned.
     if request.method == 'OPTIONS':
         return '', 204
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        fields = parse_fields(request.args.get('fields'), PROJECT_FIELDS)
+        sort = parse_sort(request.args.get('sort'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     db = SessionLocal()
     try:
-        projects = db.query(Project).all()
-        data = [p.to_dict() for p in projects]
-        response = make_response(jsonify({'projects': data}))
-        response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-        response.headers['Pragma'] = 'no-cache'
-        response.headers['Expires'] = '0'
-        return response
+        try:
+            page = list_projects(db, request.args.get('cursor'), limit, fields, parse_filters(request.args), sort)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify(page)
     except Exception as e:
         import traceback
         print("Error in get_projects:", e)
@@ -181,6 +295,7 @@ def create_project():
 
 @projects_bp.route('/projects/<int:project_id>', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda project_id: [(Project, Project.id == project_id)])
 def get_project_by_id(project_id):
     if request.method == 'OPTIONS':
         return '', 204
@@ -248,6 +363,7 @@ def delete_project(project_id):
 # --- Project Milestones Endpoint ---
 @projects_bp.route('/projects/<int:project_id>/milestones', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda project_id: [(Milestone, Milestone.project_id == project_id)])
 def get_project_milestones(project_id):
     if request.method == 'OPTIONS':
         return '', 204
@@ -269,6 +385,7 @@ def get_project_milestones(project_id):
 # --- Project Risks Endpoint ---
 @projects_bp.route('/projects/<int:project_id>/risks', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda project_id: [(Risk, Risk.project_id == project_id)])
 def get_project_risks(project_id):
     if request.method == 'OPTIONS':
         return '', 204
@@ -290,15 +407,14 @@ def get_project_risks(project_id):
 # --- Project Team Members Endpoint ---
 @projects_bp.route('/projects/<int:project_id>/team-members', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda project_id: team_sources([project_id]))
 def get_project_team_members(project_id):
     if request.method == 'OPTIONS':
         return '', 204
     db = SessionLocal()
     try:
-        from src.domain.models.resource import Resource
-        # Query resources assigned to this project
-        team_members = db.query(Resource).filter(Resource.project_name == str(project_id)).all()
-        team_members_data = [r.to_dict() for r in team_members]
+        # Resources assigned to this project, through the project_assignments index
+        team_members_data = project_teams(db, [project_id]).get(project_id, [])
         return jsonify({'teamMembers': team_members_data})
     except Exception as e:
         import traceback
@@ -308,24 +424,41 @@ def get_project_team_members(project_id):
     finally:
         db.close()
 
+# --- Batch Team Members Endpoint ---
+# GET /projects/team-members?ids=1,2,3
+#   -> {'teams': {'1': [...], '2': [...], '3': []}}
+@projects_bp.route('/projects/team-members', methods=['GET', 'OPTIONS'])
+@cross_origin()
+@conditional(lambda: team_sources(parse_project_ids(request.args.get('ids'))))
+def get_projects_team_members():
+    if request.method == 'OPTIONS':
+        return '', 204
+    try:
+        project_ids = parse_project_ids(request.args.get('ids'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    db = SessionLocal()
+    try:
+        teams = project_teams(db, project_ids)
+        return jsonify({'teams': {str(project_id): teams.get(project_id, []) for project_id in project_ids}})
+    except Exception as e:
+        import traceback
+        print("Error in get_projects_team_members:", e)
+        traceback.print_exc()
+        return jsonify({'error': str(e)}), 500
+    finally:
+        db.close()
+
 # --- Project Engineering Metrics Endpoint ---
 @projects_bp.route('/projects/<int:project_id>/engineering-metrics', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda project_id: [(Project, Project.id == project_id)])
 def get_project_engineering_metrics(project_id):
     if request.method == 'OPTIONS':
         return '', 204
     db = SessionLocal()
     try:
-        project = db.query(Project).filter(Project.id == project_id).first()
-        import json
-        metrics = {'development': {}, 'qa': {}}
-        if project and hasattr(project, 'engineering_metrics') and project.engineering_metrics:
-            try:
-                parsed = json.loads(project.engineering_metrics)
-                metrics['development'] = parsed.get('development', {})
-                metrics['qa'] = parsed.get('qa', {})
-            except Exception:
-                pass
+        metrics = project_engineering_metrics(db, project_id)
         return jsonify({'engineeringMetrics': metrics})
     except Exception as e:
         import traceback
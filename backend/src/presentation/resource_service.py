@@ -1,7 +1,22 @@
 from flask import Blueprint, jsonify, request
 from flask_cors import cross_origin
-from src.domain.models import Resource
+from src.domain.models import Resource, Intern, ResourceSkill, ProjectAssignment
+from src.domain.models.resource import RESOURCE_FIELD_MAP
+from src.domain.models.intern import INTERN_FIELD_MAP
 from src.presentation.extensions import db
+from src.presentation.conditional import conditional
+from src.application.pagination import parse_fields, parse_limit
+from src.application.resource_lists import (
+    RESOURCE_FIELDS, search_resources, parse_resource_filters, parse_resource_sort, resource_totals
+)
+from src.application.skill_index import parse_kinds, skill_counts
+from src.application.date_range import parse_days, upcoming
+from src.application.resource_windows import (
+    RELEASE_DAYS, RESIGNATION_DAYS, engagement_releases, resignations as resignations_in
+)
+from src.application.resource_matching import (
+    DEFAULT_TOP, MAX_TOP, allocate_resources, match_resources, parse_skill_list, resolve_resources
+)
 
 resource_bp = Blueprint('resources', __name__)
 
@@ -17,34 +32,28 @@ def delete_intern(id):
     return jsonify({'message': 'Intern deleted'})
 
 # Resignations endpoint for resource management
+# GET /api/resignations?days=60 -> {'resignations': [resource dict, ...]}
+# Resources whose last working day is within the next `days` days (default 60), soonest first.
 @resource_bp.route('/resignations', methods=['GET'])
 @cross_origin()
+@conditional(lambda: [(Resource,)])
 def get_resignations():
-    from datetime import datetime, timedelta
-    today = datetime.today().date()
-    two_months_later = today + timedelta(days=60)
-    # Query resources whose last working day is within the next 2 months
-    resources = Resource.query.filter(Resource.last_working_day != None).all()
+    try:
+        days = parse_days(request.args.get('days'), default=RESIGNATION_DAYS)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     resignations = []
-    for r in resources:
-        try:
-            lwd = r.last_working_day
-            if isinstance(lwd, str):
-                lwd_date = datetime.strptime(lwd, "%Y-%m-%d").date()
-            else:
-                lwd_date = lwd
-            if today <= lwd_date <= two_months_later:
-                resource_dict = r.to_dict()
-                resource_dict["last_working_day"] = lwd_date.strftime("%Y-%m-%d")
-                # Ensure employeeId is present and resourceId is not used in its place
-                resource_dict["employeeId"] = r.employee_id or r.id
-                resignations.append(resource_dict)
-        except Exception as e:
-            continue
+    for r in resignations_in(db.session, upcoming(days)):
+        resource_dict = r.to_dict()
+        resource_dict["last_working_day"] = r.last_working_day.strftime("%Y-%m-%d")
+        # Ensure employeeId is present and resourceId is not used in its place
+        resource_dict["employeeId"] = r.employee_id or r.id
+        resignations.append(resource_dict)
     return jsonify({"resignations": resignations})
 
 @resource_bp.route('/resources/<string:employeeId>', methods=['GET'])
 @cross_origin()
+@conditional(lambda employeeId: [(Resource, Resource.employee_id == employeeId)])
 def get_resource_by_employee_id(employeeId):
     print(f"DEBUG: Received employeeId param: {employeeId}")
     resource = Resource.query.filter_by(employee_id=employeeId).first()
@@ -59,30 +68,37 @@ def get_resource_by_employee_id(employeeId):
 
 
 
+# GET /api/resources?department=Eng,QA&billable=false&sort=-benchDays&limit=50&cursor=...&fields=id,fullName
+#   -> {'resources': [...], 'nextCursor': str|null, 'total_resources': int,
+#       'non_billable_resources': int, 'intern_resources': int}
+# Filters: department, location, seniority (one value or a comma-separated list),
+# billable, intern, bench (true/false), skill (any of a comma-separated list, in any
+# skill column). sort= is id (default), fullName,
+# joiningDate or benchDays, '-' for descending. Totals count every matching
+# resource, not just the page.
 @resource_bp.route('/resources', methods=['GET'])
 @cross_origin()
+@conditional(lambda: [(Resource, *parse_resource_filters(request.args))])
 def list_resources():
     try:
-        seniority = request.args.get('seniority')
-        billable = request.args.get('billable')
-        query = Resource.query
-        if seniority:
-            query = query.filter(Resource.seniorityLevel.ilike(seniority))
-        if billable == 'true':
-            query = query.filter(Resource.billableStatus == True)
-        all_resources = query.all()
-        print('DEBUG: All resources from DB:', [(getattr(r, 'employee_id', None), getattr(r, 'resource_id', None), getattr(r, 'monthlySalaryCost', None)) for r in all_resources])
-        resources = [r for r in all_resources if hasattr(r, 'employee_id') and r.employee_id]
-        mapped_resources = [dict(r.to_dict(), employeeId=r.employee_id) for r in resources]
-        for r in mapped_resources:
-            print(f"DEBUG: Resource in API response: employeeId={r.get('employeeId')}, monthlySalaryCost={r.get('monthlySalaryCost')}")
-            if 'status' in r:
-                del r['status']
+        limit = parse_limit(request.args.get('limit'))
+        fields = parse_fields(request.args.get('fields'), RESOURCE_FIELDS)
+        sort = parse_resource_sort(request.args.get('sort'))
+        criteria = parse_resource_filters(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    try:
+        try:
+            page = search_resources(db.session, request.args.get('cursor'), limit, fields, criteria, sort)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        totals = resource_totals(db.session, criteria)
         return jsonify({
-            'resources': mapped_resources,
-            'total_resources': len(mapped_resources),
-            'non_billable_resources': len([r for r in mapped_resources if not r['billableStatus']]),
-            'intern_resources': len([r for r in mapped_resources if r['is_intern']])
+            'resources': page['items'],
+            'nextCursor': page['nextCursor'],
+            'total_resources': totals['total'],
+            'non_billable_resources': totals['non_billable'],
+            'intern_resources': totals['interns'],
         })
     except Exception as e:
         print('ERROR in list_resources:', str(e))
@@ -91,27 +107,17 @@ def list_resources():
 @resource_bp.route('/resources', methods=['POST'])
 @cross_origin()
 def add_resource():
-    data = request.json
-    # Convert all camelCase keys to snake_case for SQLAlchemy compatibility
-    import re
-    def camel_to_snake(name):
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-
-    mapped_data = {}
-    for k, v in data.items():
-        snake_key = camel_to_snake(k)
-        mapped_data[snake_key] = None if v == "" else v
-
-    # Validate required fields for Resource
-    if not mapped_data.get('employee_id'):
-        return jsonify({'error': 'employeeId is required to create a resource.'}), 400
-
-    # Check if this is an intern (by is_intern flag or intern-specific fields)
-    is_intern = mapped_data.get('is_intern') or 'education' in mapped_data or 'conversion_potential' in mapped_data
+    data = request.json or {}
+    # Interns are recognised by the is_intern flag or the intern-only fields
+    is_intern = (data.get('is_intern') or data.get('isIntern') or 'education' in data
+                 or 'conversionPotential' in data or 'conversion_potential' in data)
+    # Unknown fields and bad values are rejected before the session is touched
+    try:
+        values = (INTERN_FIELD_MAP if is_intern else RESOURCE_FIELD_MAP).decode(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     if is_intern:
-        from src.domain.models.intern import Intern
-        intern = Intern(**mapped_data)
+        intern = Intern(**values)
         db.session.add(intern)
         try:
             db.session.commit()
@@ -120,13 +126,13 @@ def add_resource():
             if hasattr(e, 'orig') and 'duplicate key value violates unique constraint' in str(e.orig):
                 return jsonify({'error': 'An intern with this employeeId already exists.'}), 409
             return jsonify({'error': 'Failed to add intern', 'details': str(e)}), 500
-        intern_dict = intern.__dict__.copy()
-        intern_dict.pop('_sa_instance_state', None)
+        # The create response keeps its snake_case column keys
+        intern_dict = {column.key: getattr(intern, column.key) for column in Intern.__table__.columns}
         intern_dict['employeeId'] = intern.employee_id
         intern_dict['internId'] = intern.id
         return jsonify({'message': 'Intern added', 'intern': intern_dict}), 201
     else:
-        resource = Resource(**mapped_data)
+        resource = Resource(**values)
         db.session.add(resource)
         try:
             db.session.commit()
@@ -136,35 +142,24 @@ def add_resource():
                 return jsonify({'error': 'A resource with this employeeId already exists.'}), 409
             return jsonify({'error': 'Failed to add resource', 'details': str(e)}), 500
         resource_dict = resource.to_dict()
-        resource_dict['employeeId'] = resource.employee_id
-        resource_dict['resourceId'] = getattr(resource, 'resource_id', None)
+        resource_dict['resourceId'] = resource.id
         return jsonify({'message': 'Resource added', 'resource': resource_dict}), 201
 
 @resource_bp.route('/resources/<int:id>', methods=['PUT'])
 @cross_origin()
 def edit_resource(id):
-    data = request.json
-    # Convert camelCase keys to snake_case for SQLAlchemy compatibility
-    import re
-    def camel_to_snake(name):
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-    mapped_data = {}
-    for k, v in data.items():
-        snake_key = camel_to_snake(k)
-        # Convert empty strings to None for DB compatibility
-        mapped_data[snake_key] = None if v == "" else v
+    try:
+        values = RESOURCE_FIELD_MAP.decode(request.json or {}, partial=True)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     resource = Resource.query.filter_by(id=id).first()
     if not resource:
         return jsonify({'error': 'Resource not found'}), 404
-    for key, value in mapped_data.items():
+    for key, value in values.items():
         setattr(resource, key, value)
     db.session.commit()
     resource_dict = resource.to_dict()
-    resource_dict['employeeId'] = resource.employee_id
-    resource_dict['resourceId'] = getattr(resource, 'resource_id', None) or getattr(resource, 'id', None)
-    print(f"DEBUG: Resource updated, DB value monthly_salary_cost={getattr(resource, 'monthlySalaryCost', None)}")
-    print(f"DEBUG: Resource dict returned after update: {resource_dict}")
+    resource_dict['resourceId'] = resource.id
     return jsonify({'message': 'Resource updated', 'resource': resource_dict})
 
 @resource_bp.route('/resources/<int:id>', methods=['DELETE'])
@@ -179,21 +174,19 @@ def delete_resource(id):
 
 @resource_bp.route('/resources/analytics/kpi-counts', methods=['GET'])
 @cross_origin()
+@conditional(lambda: [(Resource,)])
 def kpi_counts():
-    resources = Resource.query.all()
-    total = len(resources)
-    billable = len([r for r in resources if r.billableStatus])
-    non_billable = len([r for r in resources if not r.billableStatus and not r.is_intern])
-    intern = len([r for r in resources if r.is_intern])
+    totals = resource_totals(db.session)
     return jsonify({'resourceCounts': {
-        'total': total,
-        'billable': billable,
-        'nonBillable': non_billable,
-        'intern': intern
+        'total': totals['total'],
+        'billable': totals['billable'],
+        'nonBillable': totals['bench'],
+        'intern': totals['interns']
     }})
 
 @resource_bp.route('/resources/analytics/seniority', methods=['GET'])
 @cross_origin()
+@conditional(lambda: [(Resource,)])
 def seniority_analytics():
     from collections import Counter
     resources = Resource.query.all()
@@ -201,40 +194,32 @@ def seniority_analytics():
     data = [{'seniority': k, 'count': v} for k, v in counts.items()]
     return jsonify({'data': data})
 
+# GET /api/resources/analytics/skills?kind=skills,primary_skills
+#   -> {'data': [{'skill', 'count'}]}, most common first
+# kind= picks the skill columns counted (default skills); read from the skill index.
 @resource_bp.route('/resources/analytics/skills', methods=['GET'])
 @cross_origin()
+@conditional(lambda: [(ResourceSkill,)])
 def skill_analytics():
-    from collections import Counter
-    resources = Resource.query.all()
-    skills = []
-    for r in resources:
-        skills.extend(r.skills if isinstance(r.skills, list) else (r.skills.split(',') if r.skills else []))
-    counts = Counter(skills)
-    data = [{'skill': k, 'count': v} for k, v in counts.items()]
-    return jsonify({'data': data})
+    try:
+        kinds = parse_kinds(request.args.get('kind'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'data': skill_counts(db.session, kinds)})
 
 
+# GET /api/resources/upcoming-releases?days=62
+#   -> {'releases': [{'resourceId', 'name', 'releaseDate', 'currentProject', 'skills'}]}
+# Engagements ending within the next `days` days (default 62), soonest first.
 @resource_bp.route('/resources/upcoming-releases', methods=['GET'])
 @cross_origin()
+@conditional(lambda: [(Resource,), (ResourceSkill,)])
 def upcoming_releases():
-    from datetime import datetime, timedelta
-    today = datetime.today().date()
-    two_months_later = today + timedelta(days=62)
-    resources = Resource.query.all()
-    releases = []
-    for r in resources:
-        release_date = None
-        if hasattr(r, 'engagementEndDate') and r.engagementEndDate:
-            release_date = r.engagementEndDate
-        if release_date and today <= release_date <= two_months_later:
-            releases.append({
-                'resourceId': r.resource_id,
-                'name': r.fullName,
-                'releaseDate': release_date.isoformat(),
-                'currentProject': r.currentEngagement,
-                'skills': r.skills if isinstance(r.skills, list) else (r.skills.split(',') if r.skills else []),
-            })
-    return jsonify({'releases': releases})
+    try:
+        days = parse_days(request.args.get('days'), default=RELEASE_DAYS)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'releases': engagement_releases(db.session, upcoming(days))})
 
 @resource_bp.route('/resources/interns', methods=['GET'])
 @cross_origin()
@@ -262,43 +247,77 @@ def intern_management():
         }
     return jsonify({'interns': [intern_to_dict(r) for r in interns]})
 
+# GET /api/resources/matches?skills=Python,SQL&seniority=Senior&project_id=3&top=10
+#   -> {'candidates': [{'id', 'employeeId', 'fullName', 'designation', 'seniorityLevel',
+#                       'score', 'components': {...}, 'matchedSkills': [...]}]}
+# Ranked best first; resources already on project_id are left out. Read-only: pick
+# candidates here, then POST the chosen ones to /api/resources/allocate-project.
+@resource_bp.route('/resources/matches', methods=['GET'])
+@cross_origin()
+@conditional(lambda: [(Resource,), (ResourceSkill,), (ProjectAssignment,)])
+def resource_matches():
+    try:
+        skills = parse_skill_list(request.args.get('skills', ''))
+        top = parse_limit(request.args.get('top'), default=DEFAULT_TOP, name='top', maximum=MAX_TOP)
+        project_id = request.args.get('project_id', type=int)
+        candidates = match_resources(db.session, skills, request.args.get('seniority'), project_id, top)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'candidates': candidates})
+
+# POST /api/resources/allocate-project
+#   {'project_id': 3, 'resource_ids': ['E00012', 57], 'start_date': '2025-07-01', 'allocation_percentage': 50}
+#   -> {'allocated_resources': [...]}
+# Allocates only the listed resources (employee ids or resource ids; 'resource_id'
+# is accepted for a single one).
 @resource_bp.route('/resources/allocate-project', methods=['POST'])
 @cross_origin()
 def allocate_project():
-    data = request.json
-    project_id = data.get('project_id')
-    skills = data.get('skills', [])
-    seniority = data.get('seniority')
-    resources = Resource.query.all()
-    matches = [r for r in resources if set(skills).intersection(r.skills if isinstance(r.skills, list) else (r.skills.split(',') if r.skills else [])) and r.seniorityLevel == seniority]
-    # Simulate allocation: update currentEngagement
-    for r in matches:
-        r.currentEngagement = project_id
-    db.session.commit()
-    return jsonify({'allocated_resources': [r.to_dict() for r in matches]})
+    from datetime import date
+    data = request.get_json(silent=True) or {}
+    try:
+        if data.get('project_id') in (None, ''):
+            raise ValueError('project_id is required')
+        project_id = int(data['project_id'])
+        references = data.get('resource_ids')
+        if references is None:
+            references = [data['resource_id']] if data.get('resource_id') not in (None, '') else []
+        if not isinstance(references, list) or not references:
+            raise ValueError('resource_ids is required; pick candidates with /api/resources/matches')
+        start_date = date.fromisoformat(data['start_date']) if data.get('start_date') else None
+        allocation_percentage = float(data.get('allocation_percentage', 100))
+        if not 0 < allocation_percentage <= 100:
+            raise ValueError('allocation_percentage must be between 0 and 100')
+        resource_ids = resolve_resources(db.session, references)
+        allocate_resources(db.session, project_id, resource_ids, start_date, allocation_percentage)
+    except (TypeError, ValueError) as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    allocated = Resource.query.filter(Resource.id.in_(resource_ids)).order_by(Resource.id).all()
+    return jsonify({'allocated_resources': [r.to_dict() for r in allocated]})
 
 
+# GET /api/resources/resignations?days=30
+#   -> {'resignations': [{'resourceId', 'name', 'lastWorkingDay', 'status'}]}
+# Every upcoming last working day, or only those within `days` days when given.
 @resource_bp.route('/resources/resignations', methods=['GET'])
 @cross_origin()
+@conditional(lambda: [(Resource,)])
 def resignations():
-    from datetime import datetime
-    today = datetime.today().date()
-    resources = Resource.query.all()
-    resignations = []
-    for r in resources:
-        if hasattr(r, 'lastWorkingDay') and r.lastWorkingDay:
-            last_day = r.lastWorkingDay
-            if last_day >= today:
-                resignations.append({
-                    'resourceId': r.resource_id,
-                    'name': r.fullName,
-                    'lastWorkingDay': last_day.isoformat(),
-                    'status': 'Resigned',
-                })
-    return jsonify({'resignations': resignations})
+    try:
+        days = parse_days(request.args.get('days'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'resignations': [{
+        'resourceId': r.id,
+        'name': r.full_name,
+        'lastWorkingDay': r.last_working_day.isoformat(),
+        'status': 'Resigned',
+    } for r in resignations_in(db.session, upcoming(days))]})
 
 @resource_bp.route('/resources/<int:id>', methods=['GET'])
 @cross_origin()
+@conditional(lambda id: [(Resource, Resource.id == id)])
 def get_resource_by_id(id):
     try:
         resource = Resource.query.filter_by(id=id).first()
@@ -316,46 +335,17 @@ def get_resource_by_id(id):
 
 @resource_bp.route('/resources/financial-overview', methods=['GET', 'OPTIONS'])
 @cross_origin()
+@conditional(lambda: [(Resource,)])
 def get_financial_overview():
     from src.infrastructure.db import SessionLocal
+    from src.application.financials import financial_rollup
+    from src.application.date_range import parse_date_range
+    try:
+        date_range = parse_date_range(request.args)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     session = SessionLocal()
-    resources = session.query(Resource).all()
-    # Monthly financials
-    monthlyFinancials = []
-    month_map = {}
-    for r in resources:
-        if r.joining_date and r.monthly_cost:
-            month = r.joining_date.strftime('%b %Y')
-            if month not in month_map:
-                month_map[month] = {'total': 0, 'billable': 0, 'nonBillable': 0, 'intern': 0}
-            month_map[month]['total'] += r.monthly_cost or 0
-            if getattr(r, 'billable_status', False):
-                month_map[month]['billable'] += r.monthly_cost or 0
-            elif getattr(r, 'is_intern', False):
-                month_map[month]['intern'] += r.monthly_cost or 0
-            else:
-                month_map[month]['nonBillable'] += r.monthly_cost or 0
-    for month, data in sorted(month_map.items()):
-        monthlyFinancials.append({
-            'month': month,
-            'total': data['total'],
-            'billable': data['billable'],
-            'nonBillable': data['nonBillable'],
-            'intern': data['intern']
-        })
-    # YTD totals
-    ytdTotals = {'total': 0, 'billable': 0, 'nonBillable': 0, 'intern': 0}
-    for r in resources:
-        ytdTotals['total'] += r.monthly_cost or 0
-        if getattr(r, 'billable_status', False):
-            ytdTotals['billable'] += r.monthly_cost or 0
-        elif getattr(r, 'is_intern', False):
-            ytdTotals['intern'] += r.monthly_cost or 0
-        else:
-            ytdTotals['nonBillable'] += r.monthly_cost or 0
-    return jsonify({
-        'monthlyFinancials': monthlyFinancials,
-        'ytdTotals': ytdTotals
-    })
-
-
+    try:
+        return jsonify(financial_rollup(session, date_range))
+    finally:
+        session.close()
@@ -0,0 +1,29 @@
+# Run from backend/:  python -m pytest -q
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Modules that open SessionLocal must not reach for the development database
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from src.presentation.extensions import db
+import src.domain.models  # noqa: F401  registers the tables on db.metadata
+import src.domain.models.sprint  # noqa: F401  not exported by the package; Project relates to it
+
+
+@pytest.fixture
+def session():
+    """Session on a fresh in-memory SQLite database holding every table."""
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+    db.metadata.create_all(engine)
+    session = Session(engine)
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
@@ -0,0 +1,49 @@
+from datetime import date
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy.orm import sessionmaker
+
+from src.domain.models.escalation import Escalation
+from src.presentation import conditional as conditional_module
+from src.presentation.conditional import conditional
+
+
+class FixedDate(date):
+    current = date(2026, 3, 14)
+
+    @classmethod
+    def today(cls):
+        return cls.current
+
+
+@pytest.fixture
+def client(session, monkeypatch):
+    monkeypatch.setattr(conditional_module, 'SessionLocal', sessionmaker(bind=session.get_bind()))
+    monkeypatch.setattr(conditional_module, 'date', FixedDate)
+    app = Flask(__name__)
+
+    @app.route('/escalations')
+    @conditional(lambda: [(Escalation,)])
+    def escalations():
+        return jsonify({'escalations': []})
+
+    return app.test_client()
+
+
+def test_unchanged_rows_revalidate_with_304(client):
+    etag = client.get('/escalations').headers['ETag']
+
+    response = client.get('/escalations', headers={'If-None-Match': etag})
+
+    assert response.status_code == 304
+
+
+def test_etag_changes_when_the_date_rolls_over(client, monkeypatch):
+    etag = client.get('/escalations').headers['ETag']
+    monkeypatch.setattr(FixedDate, 'current', date(2026, 3, 15))
+
+    response = client.get('/escalations', headers={'If-None-Match': etag})
+
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
@@ -0,0 +1,37 @@
+from src.application.dashboard_sections import build_sections
+from src.domain.models import Project
+from src.domain.models.kpi import KPI
+from src.infrastructure.metrics import measure
+
+
+def add_projects(session, count):
+    for i in range(count):
+        project = Project(name=f'Project {i}', status='Active', progress=50, team_size=4)
+        session.add(project)
+        session.flush()
+        for name in ('velocity', 'quality'):
+            session.add(KPI(name=name, title=name.title(), value=float(i), project_id=project.id))
+    session.commit()
+
+
+def project_cards_queries(session):
+    with measure() as m:
+        cards = build_sections(session, ['projects'], cache=None)['projects']['projectCards']
+    return len(cards), m.queries
+
+
+def test_project_cards_query_count_does_not_grow_with_projects(session):
+    add_projects(session, 3)
+    few = project_cards_queries(session)
+    add_projects(session, 27)
+    many = project_cards_queries(session)
+
+    assert (few[0], many[0]) == (3, 30)
+    assert many[1] == few[1]
+
+
+def test_project_cards_carry_their_kpis(session):
+    add_projects(session, 3)
+    cards = build_sections(session, ['projects'], cache=None)['projects']['projectCards']
+
+    assert [len(card['kpis']) for card in cards] == [2, 2, 2]
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from src.application.dashboard_stream import DashboardStream
+from src.domain.models import Project
+
+SECTIONS = ['projects']
+
+
+@pytest.fixture
+def stream(session):
+    stream = DashboardStream(sessionmaker(bind=session.get_bind()), history=2, heartbeat=0.01)
+    # Tests publish by hand instead of through the publisher thread
+    stream._ensure_started = lambda: None
+    return stream
+
+
+def add_project(session, stream, name):
+    session.add(Project(name=name, status='Active'))
+    session.commit()
+    stream._publish({'projects'})
+
+
+def next_event(events):
+    """(id, event, data) of the next event frame, skipping the retry line and heartbeats."""
+    while True:
+        frame = next(events)
+        if frame.startswith('id: '):
+            lines = dict(line.split(': ', 1) for line in frame.strip().split('\n'))
+            return lines['id'], lines['event'], json.loads(lines['data'])
+
+
+def project_names(data):
+    return [card['name'] for card in data['data']['projectCards']]
+
+
+def test_resume_within_the_history_replays_the_missed_sections(session, stream):
+    first = stream.events(SECTIONS)
+    last_id, event, _ = next_event(first)
+    assert event == 'snapshot'
+    add_project(session, stream, 'Apollo')
+    first.close()
+
+    resumed = stream.events(SECTIONS, last_event_id=last_id)
+    event_id, event, data = next_event(resumed)
+
+    assert event == 'sections'
+    assert event_id.endswith('-1')
+    assert project_names(data) == ['Apollo']
+
+
+def test_resume_from_before_the_history_sends_a_snapshot(session, stream):
+    first = stream.events(SECTIONS)
+    last_id, _, _ = next_event(first)
+    for name in ('Apollo', 'Gemini', 'Mercury'):
+        add_project(session, stream, name)
+    first.close()
+
+    event_id, event, data = next_event(stream.events(SECTIONS, last_event_id=last_id))
+
+    assert event == 'snapshot'
+    assert event_id.endswith('-3')
+    assert project_names(data) == ['Apollo', 'Gemini', 'Mercury']
+
+
+def test_connected_client_gets_each_change_while_it_keeps_up(session, stream):
+    events = stream.events(SECTIONS)
+    next_event(events)
+
+    add_project(session, stream, 'Apollo')
+    assert next_event(events)[1] == 'sections'
+    add_project(session, stream, 'Gemini')
+    _, event, data = next_event(events)
+
+    assert event == 'sections'
+    assert project_names(data) == ['Apollo', 'Gemini']
+
+
+def test_connected_client_that_falls_behind_the_history_gets_a_snapshot(session, stream):
+    events = stream.events(SECTIONS)
+    next_event(events)
+    for name in ('Apollo', 'Gemini', 'Mercury'):
+        add_project(session, stream, name)
+
+    event_id, event, data = next_event(events)
+
+    assert event == 'snapshot'
+    assert event_id.endswith('-3')
+    assert project_names(data) == ['Apollo', 'Gemini', 'Mercury']
+    add_project(session, stream, 'Vostok')
+    assert next_event(events)[1] == 'sections'
@@ -0,0 +1,14 @@
+import pytest
+
+from src.domain.models.intern import INTERN_FIELD_MAP
+
+
+def test_intern_create_requires_employee_id():
+    with pytest.raises(ValueError, match='employeeId is required'):
+        INTERN_FIELD_MAP.decode({'name': 'Ann', 'isIntern': True})
+
+    assert INTERN_FIELD_MAP.decode({'name': 'Ann', 'employeeId': 'INT-1'})['employee_id'] == 'INT-1'
+
+
+def test_intern_update_may_omit_employee_id():
+    assert INTERN_FIELD_MAP.decode({'mentorName': 'Lisa'}, partial=True) == {'mentor_name': 'Lisa'}
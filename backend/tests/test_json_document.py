@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Session
+
+from src.domain.models import Project
+
+
+def test_rows_with_the_same_document_do_not_share_it(session):
+    metrics = {'qa': {'testCases': 10}, 'risks': ['scope']}
+    session.add_all([Project(name='A', engineering_metrics=metrics), Project(name='B', engineering_metrics=metrics)])
+    session.commit()
+    session.expunge_all()
+
+    first, second = session.query(Project).order_by(Project.id).all()
+    first.engineering_metrics['risks'].append('budget')
+
+    assert second.engineering_metrics == metrics
+    with Session(session.get_bind()) as other:
+        assert [project.engineering_metrics for project in other.query(Project)] == [metrics, metrics]
+
+
+def test_legacy_json_strings_are_stored_decoded(session):
+    session.add(Project(name='A', teams='["web", "qa"]'))
+    session.commit()
+    session.expunge_all()
+
+    assert session.query(Project.teams).scalar() == ['web', 'qa']
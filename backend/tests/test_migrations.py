@@ -0,0 +1,60 @@
+import importlib.util
+import os
+
+import pytest
+import sqlalchemy as sa
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+
+VERSIONS = os.path.join(os.path.dirname(__file__), '..', 'migrations', 'versions')
+
+
+def load_migration(filename):
+    spec = importlib.util.spec_from_file_location(filename[:-3], os.path.join(VERSIONS, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def sprints_connection():
+    """Connection holding a sprints table as it was before unique sprint numbers."""
+    engine = sa.create_engine('sqlite://')
+    metadata = sa.MetaData()
+    sa.Table(
+        'sprints', metadata,
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('project_id', sa.Integer, nullable=False),
+        sa.Column('sprint_number', sa.Integer, nullable=False),
+        sa.Index('ix_sprints_project_id_sprint_number', 'project_id', 'sprint_number'),
+    )
+    with engine.begin() as connection:
+        metadata.create_all(connection)
+        yield connection
+
+
+def upgrade(connection, module):
+    with Operations.context(MigrationContext.configure(connection)):
+        module.upgrade()
+
+
+def test_unique_sprint_numbers_refuses_duplicates(sprints_connection):
+    migration = load_migration('9a3c6f2e8b17_unique_sprint_numbers.py')
+    sprints_connection.execute(sa.text(
+        'INSERT INTO sprints (project_id, sprint_number) VALUES (1, 1), (1, 2), (1, 2), (2, 5), (2, 5), (2, 5)'
+    ))
+
+    with pytest.raises(RuntimeError, match=r'project 1 sprint 2 \(2 rows\), project 2 sprint 5 \(3 rows\)'):
+        upgrade(sprints_connection, migration)
+
+    assert sprints_connection.execute(sa.text('SELECT count(*) FROM sprints')).scalar() == 6
+
+
+def test_unique_sprint_numbers_adds_the_unique_index(sprints_connection):
+    migration = load_migration('9a3c6f2e8b17_unique_sprint_numbers.py')
+    sprints_connection.execute(sa.text('INSERT INTO sprints (project_id, sprint_number) VALUES (1, 1), (1, 2)'))
+
+    upgrade(sprints_connection, migration)
+
+    indexes = {index['name']: index['unique'] for index in sa.inspect(sprints_connection).get_indexes('sprints')}
+    assert indexes == {'uq_sprints_project_id_sprint_number': 1}
@@ -0,0 +1,101 @@
+from datetime import date
+
+import pytest
+
+from src.application.pagination import encode_cursor
+from src.application.resource_lists import parse_resource_filters, parse_resource_sort, search_resources
+from src.domain.models import Resource
+
+# (full_name, joining_date, bench_days, department, billable, intern): ties and NULLs on every sort key
+PEOPLE = [
+    ('Asha', date(2024, 1, 10), 30, 'QA', True, None),
+    ('Bilal', None, None, 'Dev', False, None),
+    ('Asha', date(2024, 1, 10), 30, 'Dev', True, None),
+    ('Chen', date(2023, 6, 1), None, 'QA', None, True),
+    (None, date(2023, 6, 1), 5, 'Dev', False, None),
+    ('Dara', None, 5, 'Ops', True, None),
+    (None, date(2025, 2, 3), 60, 'QA', None, True),
+]
+SORTS = {'fullName': 0, 'joiningDate': 1, 'benchDays': 2}
+
+
+@pytest.fixture
+def ids(session):
+    resources = [
+        Resource(employee_id=f'E{i:03}', full_name=name, joining_date=joined, bench_days=days,
+                 department=department, billable_status=billable, is_intern=intern)
+        for i, (name, joined, days, department, billable, intern) in enumerate(PEOPLE)
+    ]
+    session.add_all(resources)
+    session.commit()
+    return [resource.id for resource in resources]
+
+
+def expected_order(ids, sort, descending):
+    """Ids ordered by the sort value with id breaking ties; NULLs last ascending, first descending."""
+    position = SORTS[sort]
+
+    def key(row):
+        resource_id, person = row
+        value = person[position]
+        # NULLs only compare among themselves, so any placeholder will do
+        return (value is None, 0 if value is None else value, resource_id)
+
+    ordered = [resource_id for resource_id, _ in sorted(zip(ids, PEOPLE), key=key)]
+    return ordered[::-1] if descending else ordered
+
+
+def walk(session, limit, **kwargs):
+    """Ids of every page, following nextCursor."""
+    seen, cursor = [], None
+    while True:
+        page = search_resources(session, cursor=cursor, limit=limit, fields=['id', 'full_name'], **kwargs)
+        assert len(page['items']) <= limit
+        seen += [item['id'] for item in page['items']]
+        cursor = page['nextCursor']
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.parametrize('limit', [1, 2, 3, 7, 50])
+def test_id_order_pages_round_trip(session, ids, limit):
+    assert walk(session, limit) == ids
+
+
+@pytest.mark.parametrize('limit', [1, 2, 3])
+@pytest.mark.parametrize('raw', ['fullName', '-fullName', 'joiningDate', '-joiningDate', 'benchDays', '-benchDays'])
+def test_sorted_pages_cover_ties_and_nulls_in_order(session, ids, raw, limit):
+    sort = parse_resource_sort(raw)
+
+    assert walk(session, limit, sort=sort) == expected_order(ids, *sort)
+
+
+def test_cursor_can_point_into_the_nulls(session, ids):
+    sort = parse_resource_sort('benchDays')
+    nulls = [ids[1], ids[3]]
+
+    page = search_resources(session, cursor=encode_cursor([None, nulls[0]]), fields=['id'], sort=sort)
+
+    assert [item['id'] for item in page['items']] == nulls[1:]
+
+
+@pytest.mark.parametrize('cursor', ['not base64!', encode_cursor([1]), encode_cursor(['x', 1]), encode_cursor({'id': 1})])
+def test_malformed_cursors_are_rejected(session, ids, cursor):
+    with pytest.raises(ValueError, match='Invalid cursor'):
+        search_resources(session, cursor=cursor, sort=parse_resource_sort('benchDays'))
+
+
+def test_sort_names_are_checked():
+    assert parse_resource_sort(None) is None
+    assert parse_resource_sort('id') is None
+    assert parse_resource_sort('-joiningDate') == ('joiningDate', True)
+    with pytest.raises(ValueError, match='Unknown sort: salary'):
+        parse_resource_sort('-salary')
+
+
+def test_filters_combine_lists_and_flags(session, ids):
+    criteria = parse_resource_filters({'department': 'QA, Dev', 'billable': 'false', 'intern': 'no'})
+
+    assert walk(session, 2, criteria=criteria) == [ids[1], ids[4]]
+    with pytest.raises(ValueError, match='bench must be true or false'):
+        parse_resource_filters({'bench': 'maybe'})
@@ -0,0 +1,94 @@
+from datetime import date, timedelta
+
+import pytest
+
+from src.application.resource_matching import (
+    allocate_resources, match_resources, resolve_resources, seniority_rank
+)
+from src.domain.models import Project, ProjectAssignment, Resource
+
+TODAY = date(2026, 3, 1)
+
+
+@pytest.fixture
+def people(session):
+    resources = {
+        'asha': Resource(employee_id='E1', full_name='Asha', primary_skills='["React"]', skills='Go',
+                         seniority_level='Senior Engineer', billable_status=False, bench_days=45),
+        'bilal': Resource(employee_id='E2', full_name='Bilal', skills='react, React', secondary_skills='Go',
+                          seniority_level='Lead', billable_status=True,
+                          engagement_end_date=TODAY + timedelta(days=10)),
+        'chen': Resource(employee_id='E3', full_name='Chen', skillset='go', seniority_level='Junior',
+                         billable_status=True, engagement_end_date=TODAY + timedelta(days=200)),
+        'dara': Resource(employee_id='E4', full_name='Dara', skills='React', last_working_day=TODAY - timedelta(days=1)),
+        'emeka': Resource(employee_id='E5', full_name='Emeka', skills='Rust'),
+        'farah': Resource(employee_id='E6', full_name='Farah', skills='React', seniority_level='Mid-Senior Developer',
+                          aging_in_non_billable=200),
+    }
+    session.add_all(resources.values())
+    session.add(Project(name='Apollo'))
+    session.commit()
+    return {name: resource.id for name, resource in resources.items()}
+
+
+def rounded(value):
+    # Scores and components are reported to 4 decimal places
+    return pytest.approx(value, abs=1e-4)
+
+
+def scored(matches):
+    return [(match['fullName'], match['score']) for match in matches]
+
+
+def test_seniority_rank_prefers_the_most_specific_word():
+    assert seniority_rank('Mid-Senior Developer') == 2.5
+    assert seniority_rank('Senior Engineer') == 3
+    assert seniority_rank('Tech Lead') == 4
+    assert seniority_rank('Consultant') is None
+
+
+def test_scores_weigh_skill_columns_seniority_availability_and_bench(session, people):
+    matches = match_resources(session, skills=['React', 'go'], seniority='senior', today=TODAY)
+
+    # score = 0.55 skills + 0.2 seniority + 0.15 availability + 0.1 bench aging
+    assert scored(matches) == [
+        ('Asha', rounded(0.55 * 0.9 + 0.2 + 0.15 + 0.1 * 0.5)),
+        ('Farah', rounded(0.55 * 0.4 + 0.2 * (1 - 0.5 / 3) + 0.15 + 0.1)),
+        ('Bilal', rounded(0.55 * 0.65 + 0.2 * (1 - 1 / 3) + 0.15 * 0.5)),
+        ('Chen', rounded(0.55 * 0.15 + 0.2 * (1 - 2 / 3))),
+    ]
+    assert matches[0]['components'] == {'skills': 0.9, 'seniority': 1.0, 'availability': 1.0, 'benchAging': 0.5}
+    assert matches[0]['matchedSkills'] == ['Go', 'React']
+
+
+def test_candidates_exclude_leavers_and_the_projects_own_people(session, people):
+    project_id = session.query(Project.id).scalar()
+    allocate_resources(session, project_id, [people['asha']])
+
+    matches = match_resources(session, skills=['react'], project_id=project_id, top=2, today=TODAY)
+
+    assert [match['fullName'] for match in matches] == ['Farah', 'Bilal']
+
+
+def test_without_skills_every_current_resource_is_a_candidate(session, people):
+    matches = match_resources(session, today=TODAY)
+
+    assert {match['fullName'] for match in matches} == {'Asha', 'Bilal', 'Chen', 'Emeka', 'Farah'}
+    assert all(match['components']['skills'] == 0 for match in matches)
+    with pytest.raises(ValueError, match='Unknown seniority: wizard'):
+        match_resources(session, seniority='wizard', today=TODAY)
+
+
+def test_allocation_updates_existing_assignments_and_adds_new_ones(session, people):
+    project_id = session.query(Project.id).scalar()
+    allocate_resources(session, project_id, [people['asha']], allocation_percentage=50.0)
+
+    ids = resolve_resources(session, ['E1', str(people['bilal']), 'E1'])
+    count = allocate_resources(session, project_id, ids, start_date=TODAY)
+
+    assert count == 2
+    assignments = session.query(ProjectAssignment.resource_id, ProjectAssignment.allocation_percentage,
+                                ProjectAssignment.start_date).order_by(ProjectAssignment.resource_id).all()
+    assert assignments == [(people['asha'], 100.0, TODAY), (people['bilal'], 100.0, TODAY)]
+    with pytest.raises(ValueError, match='Unknown resources: E99'):
+        resolve_resources(session, ['E1', 'E99'])
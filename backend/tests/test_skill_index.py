@@ -0,0 +1,39 @@
+from src.domain.models.skill import Skill, skill_ids
+
+
+class RacingConnection:
+    """Connection on which another writer creates `rows` right after the first lookup."""
+
+    def __init__(self, connection, rows):
+        self.connection = connection
+        self.rows = rows
+        self.dialect = connection.dialect
+
+    def execute(self, statement, *args):
+        result = self.connection.execute(statement, *args)
+        if self.rows:
+            self.connection.execute(Skill.__table__.insert(), self.rows)
+            self.rows = None
+        return result
+
+
+def test_skill_ids_creates_missing_skills_once(session):
+    connection = session.connection()
+
+    first = skill_ids(connection, ['React', ' react ', 'Go'])
+    second = skill_ids(connection, ['REACT', 'Rust'])
+
+    assert set(first) == {'react', 'go'}
+    assert second['react'] == first['react']
+    assert session.query(Skill).count() == 3
+
+
+def test_skill_ids_tolerates_a_concurrent_insert(session):
+    connection = session.connection()
+    racing = RacingConnection(connection, [{'name': 'Kotlin', 'key': 'kotlin'}])
+
+    ids = skill_ids(racing, ['kotlin', 'Swift'])
+
+    stored = dict(session.query(Skill.key, Skill.id).all())
+    assert ids == stored
+    assert session.query(Skill.name).filter_by(key='kotlin').scalar() == 'Kotlin'
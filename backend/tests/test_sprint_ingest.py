@@ -0,0 +1,97 @@
+import io
+from datetime import date
+
+from src.application.sprint_ingest import ingest_sprints, read_csv, read_ndjson, validate_row
+from src.domain.models import Project
+from src.domain.models.sprint import Sprint
+
+
+def add_project(session, name='Apollo'):
+    project = Project(name=name)
+    session.add(project)
+    session.commit()
+    return project.id
+
+
+def test_validate_row_parses_both_spellings():
+    values, errors, ignored = validate_row(
+        {'projectId': '3', 'sprint_number': 2.0, 'startDate': '2026-01-05', 'velocity': ' 31.5 ', 'team': 'x'}
+    )
+
+    assert errors == []
+    assert values == {'project_id': 3, 'sprint_number': 2, 'start_date': date(2026, 1, 5), 'velocity': 31.5}
+    assert ignored == {'team'}
+
+
+def test_validate_row_reports_every_problem():
+    _, errors, _ = validate_row({
+        'sprintNumber': 'two', 'velocity': True, 'startDate': '2026-02-01', 'endDate': '2026-01-01',
+        'testCasesExecuted': 5, 'testCasesPassed': 6, 'plannedStoryPoints': -1,
+    })
+
+    assert errors == [
+        "sprintNumber: invalid value 'two'",
+        'velocity: invalid value True',
+        'projectId: required',
+        'planned_story_points: must not be negative',
+        'endDate: before startDate',
+        'testCasesPassed: more than testCasesExecuted',
+    ]
+
+
+def test_validate_row_checks_the_url_project():
+    assert validate_row({'sprintNumber': 1}, project_id=4)[0]['project_id'] == 4
+    assert validate_row({'projectId': 5, 'sprintNumber': 1}, project_id=4)[1] == [
+        'projectId: does not match project 4'
+    ]
+
+
+def test_ingest_upserts_on_project_and_sprint_number(session):
+    project_id = add_project(session)
+    ingest_sprints(session, [{'projectId': project_id, 'sprintNumber': 1, 'velocity': 20, 'name': 'S1'}])
+
+    report = ingest_sprints(session, [
+        {'projectId': project_id, 'sprintNumber': 1, 'velocity': 25},
+        {'projectId': project_id, 'sprintNumber': 2, 'velocity': 30},
+        {'projectId': project_id, 'sprintNumber': 2, 'velocity': 35},
+    ])
+
+    assert report == {'received': 3, 'upserted': 2, 'errors': [], 'ignoredFields': []}
+    sprints = session.query(Sprint.sprint_number, Sprint.velocity, Sprint.name).order_by(Sprint.sprint_number).all()
+    # The upsert replaces every field, and the last row of a sprint wins
+    assert sprints == [(1, 25.0, None), (2, 35.0, None)]
+
+
+def test_ingest_reports_rows_by_number_across_chunks(session):
+    project_id = add_project(session)
+    records = read_ndjson(io.BytesIO(
+        b'{"projectId": %d, "sprintNumber": 1}\n'
+        b'not json\n'
+        b'\n'
+        b'[1, 2]\n'
+        b'{"projectId": 999, "sprintNumber": 1}\n'
+        b'{"projectId": %d, "sprintNumber": 0}\n'
+        b'{"projectId": %d, "sprintNumber": 2}\n' % (project_id, project_id, project_id)
+    ))
+
+    report = ingest_sprints(session, records, chunk_size=2)
+
+    assert report['received'] == 6
+    assert report['upserted'] == 2
+    assert report['errors'] == [
+        {'row': 2, 'errors': ['Invalid JSON']},
+        {'row': 3, 'errors': ['Each line must be a JSON object']},
+        {'row': 4, 'errors': ['projectId: unknown project 999']},
+        {'row': 5, 'errors': ['sprintNumber: must be positive']},
+    ]
+    assert session.query(Sprint).count() == 2
+
+
+def test_ingest_reads_csv_with_the_url_project(session):
+    project_id = add_project(session)
+    body = io.BytesIO(b'\xef\xbb\xbfsprintNumber,velocity,notes\n1,18,a\n2,,b\n')
+
+    report = ingest_sprints(session, read_csv(body), project_id=project_id)
+
+    assert report == {'received': 2, 'upserted': 2, 'errors': [], 'ignoredFields': ['notes']}
+    assert session.query(Sprint.velocity).order_by(Sprint.sprint_number).all() == [(18.0,), (None,)]
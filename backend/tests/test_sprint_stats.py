@@ -0,0 +1,106 @@
+import pytest
+
+from src.application.sprint_stats import portfolio_sprint_rollup, sprint_stats
+from src.domain.models import Project
+from src.domain.models.sprint import Sprint
+
+VELOCITIES = [10.0, 20.0, None, 40.0, 35.0, 60.0]
+
+
+@pytest.fixture
+def project_id(session):
+    project = Project(name='Apollo')
+    session.add(project)
+    session.flush()
+    for number, velocity in enumerate(VELOCITIES, start=1):
+        session.add(Sprint(project_id=project.id, sprint_number=number, velocity=velocity,
+                           planned_story_points=0 if number == 1 else 40, completed_story_points=30,
+                           test_cases_executed=20, test_cases_passed=15))
+    session.commit()
+    return project.id
+
+
+def rolling(values, window):
+    """Trailing averages of the non-NULL values among each value and its window - 1 predecessors."""
+    averages = []
+    for end in range(len(values)):
+        present = [value for value in values[max(0, end - window + 1):end + 1] if value is not None]
+        averages.append(sum(present) / len(present) if present else None)
+    return averages
+
+
+def slope(points):
+    """Least-squares slope of y against x over the points whose y is not None."""
+    points = [(x, y) for x, y in points if y is not None]
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / sum((x - mean_x) ** 2 for x, _ in points)
+
+
+@pytest.mark.parametrize('window', [1, 2, 3, 4])
+def test_rolling_averages_skip_nulls_in_the_window(session, project_id, window):
+    stats = sprint_stats(session, project_id, window=window)
+
+    assert [sprint['velocityRolling'] for sprint in stats['sprints']] == pytest.approx(rolling(VELOCITIES, window))
+
+
+def test_last_keeps_recent_sprints_smoothed_with_their_predecessors(session, project_id):
+    stats = sprint_stats(session, project_id, last=2, window=3)
+
+    assert [sprint['sprintNumber'] for sprint in stats['sprints']] == [5, 6]
+    assert [sprint['velocityRolling'] for sprint in stats['sprints']] == pytest.approx(rolling(VELOCITIES, 3)[4:])
+
+
+def test_trend_slope_covers_the_returned_sprints(session, project_id):
+    everything = sprint_stats(session, project_id)
+    recent = sprint_stats(session, project_id, last=3)
+
+    assert everything['trend']['velocity'] == pytest.approx(slope(enumerate(VELOCITIES, start=1)))
+    assert recent['trend']['velocity'] == pytest.approx(slope([(4, 40.0), (5, 35.0), (6, 60.0)]))
+    # Too few points for a line
+    assert sprint_stats(session, project_id, last=1)['trend']['velocity'] is None
+    assert everything['trend']['predictability'] is None
+
+
+def test_ratios_guard_against_zero(session, project_id):
+    first, second = sprint_stats(session, project_id)['sprints'][:2]
+
+    assert first['completionRatio'] is None
+    assert second['completionRatio'] == pytest.approx(0.75)
+    assert second['testPassRate'] == pytest.approx(0.75)
+
+
+def test_unknown_project_has_no_sprints(session):
+    assert sprint_stats(session, 999) == {
+        'projectId': 999, 'window': 3, 'sprints': [],
+        'trend': {'velocity': None, 'predictability': None, 'defectLeakage': None},
+    }
+
+
+def test_rollup_averages_each_projects_latest_sprints(session, project_id):
+    quiet = Project(name='Gemini', status='On Hold')
+    session.add(quiet)
+    session.commit()
+
+    rollup = portfolio_sprint_rollup(session, window=2)
+
+    apollo, gemini = rollup['projects']
+    assert apollo['sprintCount'] == 2
+    assert (apollo['latestSprintNumber'], apollo['latestVelocity']) == (6, 60.0)
+    assert apollo['avgVelocity'] == pytest.approx((35.0 + 60.0) / 2)
+    assert gemini == {
+        'projectId': quiet.id, 'name': 'Gemini', 'status': 'On Hold', 'sprintCount': 0,
+        'latestSprintNumber': None, 'latestVelocity': None, 'avgVelocity': None,
+        'avgPredictability': None, 'avgDefectLeakage': None, 'avgOnTimeDelivery': None,
+    }
+
+
+def test_rollup_window_skips_null_metrics_and_filters_projects(session, project_id):
+    rollup = portfolio_sprint_rollup(session, window=4, criteria=[Project.name == 'Apollo'])
+
+    (apollo,) = rollup['projects']
+    assert apollo['sprintCount'] == 4
+    # Sprint 3 has no velocity; the average covers the other three of the last four
+    assert apollo['avgVelocity'] == pytest.approx((40.0 + 35.0 + 60.0) / 3)
+    assert portfolio_sprint_rollup(session, criteria=[Project.name == 'Mercury'])['projects'] == []
@@ -3,23 +3,17 @@ import { EnhancedKPICard } from "@/components/dashboard/EnhancedKPICard";
 import { Users, CheckCircle, AlertTriangle, AlertCircle } from "lucide-react";
 import { useNavigate } from "react-router-dom";
 import { useEffect, useState } from "react";
-import { getDashboard, getEscalations } from "@/lib/api";
+import { getEscalations } from "@/lib/api";
+import { useDashboardSections } from "@/hooks/useDashboardSections";
+
+const KPI_SECTIONS = ['dashboard_kpis'];
 
 export const DashboardKPIs = () => {
   const navigate = useNavigate();
-  const [dashboard, setDashboard] = useState<any>(null);
+  const { data: dashboard } = useDashboardSections(KPI_SECTIONS);
   const [escalationsCount, setEscalationsCount] = useState<number>(0);
 
   useEffect(() => {
-    const fetchDashboard = async () => {
-      try {
-        const token = localStorage.getItem('token') || '';
-        const data = await getDashboard(token);
-        setDashboard(data);
-      } catch (err) {
-        setDashboard(null);
-      }
-    };
     const fetchEscalations = async () => {
       try {
         const token = localStorage.getItem('token') || '';
@@ -35,7 +29,6 @@ export const DashboardKPIs = () => {
         setEscalationsCount(0);
       }
     };
-    fetchDashboard();
     fetchEscalations();
   }, []);
 
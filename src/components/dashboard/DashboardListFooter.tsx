@@ -0,0 +1,28 @@
+import { Button } from "@/components/ui/button";
+
+interface DashboardListFooterProps {
+  shown: number;
+  total: number;
+  hasMore: boolean;
+  loadingMore: boolean;
+  error?: string | null;
+  onLoadMore: () => void;
+}
+
+// "Showing X of Y" under a list paged through useDashboardList, with a Load more control
+export const DashboardListFooter = ({ shown, total, hasMore, loadingMore, error, onLoadMore }: DashboardListFooterProps) => {
+  if (total === 0 && !error) return null;
+  return (
+    <div className="flex items-center justify-between pt-3 text-sm text-muted-foreground">
+      <span>
+        Showing {shown} of {total}
+        {error && <span className="ml-2 text-red-600">{error}</span>}
+      </span>
+      {hasMore && (
+        <Button size="sm" variant="outline" onClick={onLoadMore} disabled={loadingMore}>
+          {loadingMore ? 'Loading...' : 'Load more'}
+        </Button>
+      )}
+    </div>
+  );
+};
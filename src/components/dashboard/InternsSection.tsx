@@ -3,24 +3,18 @@ import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
 import { GraduationCap, Calendar, User, DollarSign } from "lucide-react";
-import { useEffect, useState } from "react";
+import { useDashboardSections } from "@/hooks/useDashboardSections";
+import { useDashboardList } from "@/hooks/useDashboardList";
+import { DashboardListFooter } from "@/components/dashboard/DashboardListFooter";
+
+// intern counts come from resources, the intern list and hours from interns
+const INTERN_SECTIONS = ['resources', 'interns'];
 
 export const InternsSection = () => {
-  const [dashboard, setDashboard] = useState<any>(null);
-  useEffect(() => {
-    const fetchDashboard = async () => {
-      try {
-        const token = localStorage.getItem('token') || '';
-        const data = await import('@/lib/api').then(m => m.getDashboard(token));
-        setDashboard(data);
-      } catch {
-        setDashboard(null);
-      }
-    };
-    fetchDashboard();
-  }, []);
+  const { data: dashboard } = useDashboardSections(INTERN_SECTIONS);
 
-  const interns = dashboard?.intern_details_list || [];
+  const internList = useDashboardList('intern_details_list', dashboard?.intern_details_list, dashboard?.intern_details_listPage);
+  const interns = internList.items;
   const totalStipendCost = interns.reduce((sum: number, intern: any) => sum + (intern.stipend || 0), 0);
   const totalInterns = dashboard?.total_interns ?? interns.length;
   const assignedInterns = dashboard?.interns_assigned ?? interns.filter((intern: any) => intern.status === 'assigned').length;
@@ -172,6 +166,14 @@ export const InternsSection = () => {
               );
             })}
           </div>
+          <DashboardListFooter
+            shown={interns.length}
+            total={internList.total}
+            hasMore={internList.hasMore}
+            loadingMore={internList.loadingMore}
+            error={internList.error}
+            onLoadMore={internList.loadMore}
+          />
         </CardContent>
       </Card>
     </div>
@@ -1,11 +1,14 @@
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { FinancialSummaryCard } from "@/components/dashboard/FinancialSummaryCard";
 import { useEffect, useState } from "react";
+import { getFinancialDashboard } from "@/lib/api";
+import { useGlobalDate } from "@/contexts/GlobalDateContext";
 
 export const FinancialsTab = () => {
   const [finance, setFinance] = useState<any>(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const { selectedDateRange } = useGlobalDate();
 
   useEffect(() => {
     const fetchFinancials = async () => {
@@ -13,11 +16,7 @@ export const FinancialsTab = () => {
       setError(null);
       try {
         const token = localStorage.getItem('token') || '';
-        const res = await fetch("/api/resources/financial-overview", {
-          method: "GET",
-          headers: { "Authorization": `Bearer ${token}` }
-        });
-        const result = await res.json();
+        const result = await getFinancialDashboard(token, selectedDateRange);
         setFinance(result || {});
       } catch (err: any) {
         setError(err?.message || 'Failed to fetch financials');
@@ -26,7 +25,7 @@ export const FinancialsTab = () => {
       }
     };
     fetchFinancials();
-  }, []);
+  }, [selectedDateRange]);
 
   // Adapt backend data to FinancialSummaryCard props
   const monthlyFinancialData = (finance?.monthlyFinancials || []).map((item: any) => ({
@@ -5,7 +5,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
 import { Target, User } from 'lucide-react';
-import { getProjects, getResources, allocateProject } from '@/lib/api';
+import { getAllProjects, getAllResources, allocateProject } from '@/lib/api';
 import { MultiSelect } from '@/components/ui/multi-select';
 
 // If any components are missing, add placeholders below:
@@ -29,6 +29,9 @@ interface Project {
   primarySkills?: string[];
 }
 
+// Only the columns the allocation form reads
+const PROJECT_FIELDS = { fields: 'id,name,status,priority,priority_level' };
+
 interface Resource {
   employeeId?: string;
   id?: string;
@@ -74,8 +77,8 @@ export const ProjectAllocationModal = ({ isOpen, onClose }: ProjectAllocationMod
     setLoading(true);
     const token = localStorage.getItem('token') || '';
     Promise.all([
-      getProjects(token),
-      getResources(token)
+      getAllProjects(token, PROJECT_FIELDS),
+      getAllResources(token)
     ]).then(([projData, resData]) => {
       // Type assertions to fix 'unknown' errors
       const projectsList = Array.isArray(projData)
@@ -157,10 +160,10 @@ export const ProjectAllocationModal = ({ isOpen, onClose }: ProjectAllocationMod
       }));
 
       // Optionally, refresh project team members and resource details
-      // (Assume getProjects and getResources will fetch updated data)
+      // (Assume getAllProjects and getAllResources will fetch updated data)
       const [updatedProjects, updatedResources] = await Promise.all([
-        getProjects(token),
-        getResources(token)
+        getAllProjects(token, PROJECT_FIELDS),
+        getAllResources(token)
       ]);
       const projectsList = Array.isArray(updatedProjects)
         ? updatedProjects as Project[]
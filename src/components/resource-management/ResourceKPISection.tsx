@@ -2,23 +2,13 @@
 import { EnhancedKPICard } from "@/components/dashboard/EnhancedKPICard";
 import { Users, UserCheck, UserX, GraduationCap } from "lucide-react";
 import { useNavigate } from "react-router-dom";
-import { useState, useEffect } from "react";
-import { getDashboard } from "@/lib/api";
+import { useDashboardSections } from "@/hooks/useDashboardSections";
+
+const RESOURCE_KPI_SECTIONS = ['resources'];
+
 export const ResourceKPISection = () => {
   const navigate = useNavigate();
-  const [dashboard, setDashboard] = useState<any>(null);
-  useEffect(() => {
-    const fetchDashboard = async () => {
-      try {
-        const token = localStorage.getItem('token') || '';
-        const data = await getDashboard(token);
-        setDashboard(data);
-      } catch (err) {
-        // Optionally handle error
-      }
-    };
-    fetchDashboard();
-  }, []);
+  const { data: dashboard } = useDashboardSections(RESOURCE_KPI_SECTIONS);
 
   const kpiData = dashboard ? [
     {
@@ -71,7 +71,7 @@ export const ResourceTabs = ({
     const fetchResources = async () => {
       try {
         const token = localStorage.getItem('token') || '';
-        const result = await import('@/lib/api').then(api => api.getResources(token));
+        const result = await import('@/lib/api').then(api => api.getAllResources(token));
         setResources(Array.isArray(result) ? result : []);
       } catch (err) {
         setResources([]);
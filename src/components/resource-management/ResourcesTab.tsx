@@ -28,7 +28,7 @@ import {
 } from "lucide-react";
 import { useState, useEffect } from "react";
 // Removed AddEditResourceModal usage
-import { createResource, getResources } from "@/lib/api";
+import { createResource, getAllResources } from "@/lib/api";
 import { useNavigate, useLocation } from "react-router-dom";
 export const ResourcesTab = () => {
   const navigate = useNavigate();
@@ -54,11 +54,12 @@ export const ResourcesTab = () => {
           search: searchTerm,
           department: filterDepartment !== "all" ? filterDepartment : undefined,
           status: filterStatus !== "all" ? filterStatus : undefined,
+          intern: "false",
           page: currentPage,
           pageSize: itemsPerPage,
         };
-        const result = await getResources(token, params);
-        // Exclude interns from the main resource list
+        const result = await getAllResources(token, params);
+        // Interns are excluded server-side; keep the check for older responses
         const allResources = (result as any).resources || [];
         setResources(allResources.filter((r: any) => !r.is_intern));
       } catch (err: any) {
@@ -349,7 +350,7 @@ export const ResourcesTab = () => {
                                     page: currentPage,
                                     pageSize: itemsPerPage,
                                   };
-                                  const result = await getResources(
+                                  const result = await getAllResources(
                                     token,
                                     params
                                   );
@@ -1,5 +1,5 @@
 
-import React, { createContext, useContext, useState, useEffect } from 'react';
+import React, { createContext, useContext, useState } from 'react';
 import { format, subMonths, startOfMonth, endOfMonth } from 'date-fns';
 
 export interface DatePeriod {
@@ -66,14 +66,7 @@ export const GlobalDateProvider: React.FC<{ children: React.ReactNode }> = ({ ch
     setLastUpdated(new Date());
   };
 
-  // Simulate real-time updates every 30 seconds
-  useEffect(() => {
-    const interval = setInterval(() => {
-      updateLastUpdated();
-    }, 30000);
-
-    return () => clearInterval(interval);
-  }, []);
+  // lastUpdated is bumped by useDashboardSections when the dashboard stream pushes a change
 
   const value = {
     selectedPeriod,
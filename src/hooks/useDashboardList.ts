@@ -0,0 +1,53 @@
+import { useEffect, useRef, useState } from 'react';
+import { getDashboardList, DashboardListRef } from '@/lib/api';
+
+/**
+ * Page through a list that /dashboard only embeds the first page of. Starts from
+ * the embedded rows and their `<name>Page` entry, and loadMore() appends the next
+ * page from /dashboard/lists/<name>. Resets whenever the embedded page changes.
+ * @param range The window the dashboard was loaded with
+ */
+export const useDashboardList = <T = any>(
+  name: string,
+  firstItems: T[] | undefined,
+  page: DashboardListRef | undefined,
+  range?: { start: Date; end: Date }
+) => {
+  const [items, setItems] = useState<T[]>(firstItems || []);
+  const [cursor, setCursor] = useState<string | null>(page?.nextCursor ?? null);
+  const [total, setTotal] = useState<number>(page?.total ?? (firstItems || []).length);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [error, setError] = useState<string | null>(null);
+  // Pages requested before the embedded page changed are dropped
+  const generation = useRef(0);
+
+  useEffect(() => {
+    generation.current += 1;
+    setItems(firstItems || []);
+    setCursor(page?.nextCursor ?? null);
+    setTotal(page?.total ?? (firstItems || []).length);
+    setError(null);
+  }, [firstItems, page]);
+
+  const loadMore = async () => {
+    if (!cursor || loadingMore) return;
+    const requested = generation.current;
+    setLoadingMore(true);
+    try {
+      const token = localStorage.getItem('token') || '';
+      const next = await getDashboardList<T>(token, name, { cursor, range });
+      if (requested !== generation.current) return;
+      setItems(prev => [...prev, ...next.items]);
+      setCursor(next.nextCursor);
+      setTotal(next.total);
+      setError(null);
+    } catch (err: any) {
+      if (requested !== generation.current) return;
+      setError(err?.message || `Failed to load ${name}`);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  return { items, total, hasMore: cursor !== null, loadMore, loadingMore, error };
+};
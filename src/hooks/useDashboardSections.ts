@@ -0,0 +1,65 @@
+import { useEffect, useState } from 'react';
+import { useGlobalDate } from '@/contexts/GlobalDateContext';
+import { getDashboard, DashboardData } from '@/lib/api';
+import { subscribeToDashboardStream } from '@/hooks/useRealtimeData';
+
+/**
+ * Load the given /dashboard sections once and keep them current from the dashboard
+ * stream: each `sections` event carries only the changed sections, which are merged
+ * into the state without another request. Polling every `pollInterval` ms is only
+ * the fallback when EventSource is unavailable.
+ * @param sections The sections the caller renders
+ * @param range Optional window, as for getDashboard
+ */
+export const useDashboardSections = (
+  sections: string[],
+  range?: { start: Date; end: Date },
+  pollInterval = 60000
+) => {
+  const [data, setData] = useState<(DashboardData & Record<string, any>) | null>(null);
+  const [loading, setLoading] = useState(true);
+  const [error, setError] = useState<string | null>(null);
+  const { updateLastUpdated } = useGlobalDate();
+  const sectionsKey = sections.join(',');
+  const rangeKey = range ? `${range.start.toISOString()}/${range.end.toISOString()}` : '';
+
+  useEffect(() => {
+    let cancelled = false;
+    const fetchSections = async () => {
+      try {
+        const token = localStorage.getItem('token') || '';
+        const dashboard = await getDashboard(token, sections, range);
+        if (!cancelled) {
+          setData(dashboard);
+          setError(null);
+        }
+      } catch (err: any) {
+        if (!cancelled) setError(err?.message || 'Failed to load dashboard');
+      } finally {
+        if (!cancelled) setLoading(false);
+      }
+    };
+    setLoading(true);
+    fetchSections();
+
+    if (typeof EventSource === 'undefined') {
+      const interval = setInterval(fetchSections, pollInterval);
+      return () => {
+        cancelled = true;
+        clearInterval(interval);
+      };
+    }
+    const unsubscribe = subscribeToDashboardStream(sections, range, update => {
+      setData(prev => ({ ...(prev || {}), ...update.data }) as DashboardData & Record<string, any>);
+      updateLastUpdated();
+    });
+    return () => {
+      cancelled = true;
+      unsubscribe();
+    };
+    // sections and range are tracked through their keys
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [sectionsKey, rangeKey, pollInterval]);
+
+  return { data, loading, error };
+};
@@ -2,16 +2,85 @@
 import { useEffect, useCallback } from 'react';
 import { useGlobalDate } from '@/contexts/GlobalDateContext';
 import { useToast } from '@/hooks/use-toast';
+import { openDashboardStream, DashboardStreamUpdate } from '@/lib/api';
 
 interface UseRealtimeDataOptions {
   onDataUpdate?: (dateRange: any) => void;
-  updateInterval?: number;
   enableCRUDRefresh?: boolean;
 }
 
+type DateWindow = { start: Date; end: Date };
+
+interface StreamListener {
+  sections: string[];
+  onUpdate: (update: DashboardStreamUpdate) => void;
+}
+
+interface SharedStream {
+  source: EventSource | null;
+  sections: string;
+  range?: DateWindow;
+  listeners: Set<StreamListener>;
+}
+
+// One dashboard stream per date window is shared by every subscriber on the page.
+// It is opened with the union of the sections its subscribers render.
+const sharedStreams = new Map<string, SharedStream>();
+
+const windowKey = (range?: DateWindow) =>
+  range ? `${range.start.toISOString()}/${range.end.toISOString()}` : '';
+
+const openSharedStream = (stream: SharedStream) => {
+  const sections = new Set<string>();
+  stream.listeners.forEach(listener => listener.sections.forEach(name => sections.add(name)));
+  const wanted = Array.from(sections).sort().join(',');
+  if (stream.source && stream.sections === wanted) return;
+  stream.source?.close();
+  stream.sections = wanted;
+  stream.source = openDashboardStream(wanted.split(','), stream.range);
+  const dispatch = (event: MessageEvent) => {
+    const update: DashboardStreamUpdate = JSON.parse(event.data);
+    stream.listeners.forEach(listener => {
+      if (listener.sections.some(name => update.sections.includes(name))) {
+        listener.onUpdate(update);
+      }
+    });
+  };
+  // A snapshot arrives on connect and when a reconnect has missed too much to replay
+  stream.source.addEventListener('snapshot', dispatch as EventListener);
+  stream.source.addEventListener('sections', dispatch as EventListener);
+};
+
+/**
+ * Receive the dashboard sections pushed by the server for `sections` over `range`.
+ * `onUpdate` gets the changed sections' data, ready to merge into the page state.
+ * Returns the unsubscribe function.
+ */
+export const subscribeToDashboardStream = (
+  sections: string[],
+  range: DateWindow | undefined,
+  onUpdate: (update: DashboardStreamUpdate) => void
+) => {
+  const key = windowKey(range);
+  let stream = sharedStreams.get(key);
+  if (!stream) {
+    stream = { source: null, sections: '', range, listeners: new Set() };
+    sharedStreams.set(key, stream);
+  }
+  const listener = { sections, onUpdate };
+  stream.listeners.add(listener);
+  openSharedStream(stream);
+  return () => {
+    stream!.listeners.delete(listener);
+    if (stream!.listeners.size === 0) {
+      stream!.source?.close();
+      sharedStreams.delete(key);
+    }
+  };
+};
+
 export const useRealtimeData = ({ 
   onDataUpdate, 
-  updateInterval = 60000, // 1 minute default
   enableCRUDRefresh = true
 }: UseRealtimeDataOptions = {}) => {
   const { selectedDateRange, updateLastUpdated } = useGlobalDate();
@@ -86,15 +155,6 @@ export const useRealtimeData = ({
     };
   }, [handleDataRefresh, toast, enableCRUDRefresh]);
 
-  // Periodic data updates
-  useEffect(() => {
-    const interval = setInterval(() => {
-      handleDataRefresh();
-    }, updateInterval);
-
-    return () => clearInterval(interval);
-  }, [handleDataRefresh, updateInterval]);
-
   // Trigger CRUD event helper
   const triggerCRUDEvent = useCallback((operation: string, entity: string, data?: any) => {
     const eventName = `${entity}${operation.charAt(0).toUpperCase() + operation.slice(1)}`;
@@ -1,31 +1,14 @@
-import { useEffect, useState } from "react";
-import { getDashboard } from "@/lib/api";
-import { apiFetch } from "@/lib/api";
+import { useGlobalDate } from "@/contexts/GlobalDateContext";
+import { useDashboardSections } from "@/hooks/useDashboardSections";
 
-export const useResourceData = () => {
-  const [data, setData] = useState<any>(null);
-  const [loading, setLoading] = useState(false);
-  const [error, setError] = useState<string | null>(null);
-
-  useEffect(() => {
-    const fetchData = async () => {
-      setLoading(true);
-      setError(null);
-      try {
-        const token = localStorage.getItem('token') || '';
-        console.log('[useResourceData] Fetching /dashboard endpoint...');
-        const dashboard = await getDashboard(token);
-        console.log('[useResourceData] /dashboard response:', dashboard);
-        setData(dashboard);
-      } catch (err: any) {
-        console.error('[useResourceData] Error fetching /dashboard:', err);
-        setError(err?.message || 'Failed to fetch resource analytics');
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchData();
-  }, []);
+/**
+ * Resource analytics from /dashboard for the selected date range, kept current by
+ * the dashboard stream.
+ * @param sections The /dashboard sections the page renders
+ */
+export const useResourceData = (sections: string[]) => {
+  const { selectedDateRange } = useGlobalDate();
+  const { data, loading, error } = useDashboardSections(sections, selectedDateRange);
 
   // Fallback static data for local dev or if backend is unavailable
   const staticData = {
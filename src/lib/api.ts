@@ -1,4 +1,30 @@
+import { format } from "date-fns";
+
 // Allocate resources to a project
+export interface ResourceMatch {
+  id: number;
+  employeeId: string;
+  fullName: string | null;
+  designation: string | null;
+  seniorityLevel: string | null;
+  score: number;
+  components: { skills: number; seniority: number; availability: number; benchAging: number };
+  matchedSkills: string[];
+}
+
+/**
+ * Top-ranked candidates for a role: { candidates }, best first.
+ * params: skills (comma-separated), seniority, project_id (leaves out its current team), top (default 10, max 100).
+ */
+export async function getResourceMatches(token: string, params: Record<string, any> = {}) {
+  const query = new URLSearchParams(params).toString();
+  return apiFetch<{ candidates: ResourceMatch[] }>(`/api/resources/matches?${query}`, {}, token);
+}
+
+/**
+ * Allocates only the listed resources to a project:
+ * { project_id, resource_ids (employee or resource ids) | resource_id, start_date?, allocation_percentage? }.
+ */
 export async function allocateProject(token: string, allocationData: any) {
   return apiFetch('/api/resources/allocate-project', {
     method: 'POST',
@@ -47,6 +73,15 @@ export async function getProjectOverview(token: string, projectId: string | numb
 export async function getProjectDetails(token: string, projectId: string | number) {
   return apiFetch(`/projects/${projectId}/details`, {}, token);
 }
+/**
+ * Details documents for several projects in one request, keyed by project id.
+ * Ids that do not exist are listed in `missing`.
+ */
+export async function getProjectsDetails(token: string, projectIds: Array<string | number>) {
+  return apiFetch<{ projects: Record<string, any>; missing: number[] }>(
+    `/projects/details?ids=${encodeURIComponent(projectIds.join(','))}`, {}, token
+  );
+}
 // Escalation CRUD operations
 export async function createEscalation(token: string, escalationData: any) {
   return apiFetch('/escalations', {
@@ -67,8 +102,9 @@ export async function deleteEscalation(token: string, escalationId: string) {
     method: 'DELETE',
   }, token);
 }
-export async function getResignations(token: string) {
-  return apiFetch('/api/resignations', {}, token);
+/** Resources leaving within the next `days` days (server default 60). */
+export async function getResignations(token: string, days?: number) {
+  return apiFetch(`/api/resignations${days !== undefined ? `?days=${days}` : ''}`, {}, token);
 }
 
 export async function getInterns(token: string, params = {}) {
@@ -132,6 +168,8 @@ export interface DashboardData {
     customer: string;
     category: string;
     healthStatus: string;
+    healthScore: number;
+    healthRating: 'Green' | 'Amber' | 'Red';
     onTimePercentage: number;
     description: string;
     progress: number;
@@ -240,18 +278,74 @@ export async function deleteResource(token: string, resourceId: string) {
   }, token);
 }
 
+function definedParams(params: Record<string, any>): Record<string, string> {
+  return Object.fromEntries(
+    Object.entries(params).filter(([, value]) => value !== undefined && value !== null && value !== '')
+      .map(([key, value]) => [key, String(value)])
+  );
+}
+
+/**
+ * One keyset page of resources: { resources, nextCursor, total_resources, non_billable_resources, intern_resources }.
+ * params: department, location, seniority (comma-separated for several values), billable, intern, bench
+ * (true/false), skill (any of a comma-separated list), sort (id, fullName, joiningDate, benchDays; '-' for descending),
+ * limit, cursor and fields.
+ */
 export async function getResources(token: string, params: Record<string, any> = {}) {
-  const query = new URLSearchParams(params).toString();
+  const query = new URLSearchParams(definedParams(params)).toString();
   return apiFetch(`/api/resources?${query}`, {}, token);
 }
 
+/** Every resource matching params, following nextCursor across pages. */
+export async function getAllResources(token: string, params: Record<string, any> = {}) {
+  const resources: any[] = [];
+  let cursor: string | null = null;
+  let totals: Record<string, number> = {};
+  do {
+    const page = await apiFetch<{ resources: any[]; nextCursor: string | null; [total: string]: any }>(
+      `/api/resources?${new URLSearchParams({ limit: '500', ...definedParams(params), ...(cursor ? { cursor } : {}) }).toString()}`,
+      {},
+      token
+    );
+    resources.push(...(page.resources || []));
+    cursor = page.nextCursor;
+    totals = {
+      total_resources: page.total_resources,
+      non_billable_resources: page.non_billable_resources,
+      intern_resources: page.intern_resources,
+    };
+  } while (cursor);
+  return { resources, ...totals };
+}
+
 
 
+/**
+ * One keyset page of projects: { projects, nextCursor, total }.
+ * params: status, health_status, health_rating, client, priority (comma-separated for several values),
+ * sort (id, health_score or -health_score), limit, cursor and fields (comma-separated; teams/engineering_metrics only when listed).
+ */
 export async function getProjects(token: string, params = {}) {
   const query = new URLSearchParams(params as any).toString();
   return apiFetch(`/projects?${query}`, {}, token);
 }
 
+/** Every project matching params, following nextCursor across pages. */
+export async function getAllProjects(token: string, params: Record<string, string> = {}) {
+  const projects: any[] = [];
+  let cursor: string | null = null;
+  do {
+    const page = await apiFetch<{ projects: any[]; nextCursor: string | null }>(
+      `/projects?${new URLSearchParams({ limit: '500', ...params, ...(cursor ? { cursor } : {}) }).toString()}`,
+      {},
+      token
+    );
+    projects.push(...(page.projects || []));
+    cursor = page.nextCursor;
+  } while (cursor);
+  return { projects };
+}
+
 export async function getEscalations(token: string, params = {}) {
   const query = new URLSearchParams(params as any).toString();
   return apiFetch(`/escalations?${query}`, {}, token);
@@ -262,13 +356,167 @@ export async function getProjectSprints(token: string, projectId: string | numbe
   return apiFetch(`/projects/${projectId}/sprints`, {}, token);
 }
 
+export interface ProjectSprintRollup {
+  projectId: number;
+  name: string;
+  status: string | null;
+  sprintCount: number;
+  latestSprintNumber: number | null;
+  latestVelocity: number | null;
+  avgVelocity: number | null;
+  avgPredictability: number | null;
+  avgDefectLeakage: number | null;
+  avgOnTimeDelivery: number | null;
+}
+
+/**
+ * Latest velocity and averages over each project's last `window` sprints, for every project in one call.
+ * @param params window (default 3) plus the GET /projects filters (status, health_status, client, priority)
+ */
+export async function getPortfolioSprintRollup(token: string, params: Record<string, string | number> = {}) {
+  const query = new URLSearchParams(
+    Object.entries(params).map(([key, value]) => [key, String(value)])
+  ).toString();
+  return apiFetch<{ window: number; projects: ProjectSprintRollup[] }>(
+    `/projects/sprint-rollup${query ? `?${query}` : ''}`, {}, token
+  );
+}
+
+export interface SprintIngestReport {
+  received: number;
+  upserted: number;
+  errors: { row: number; errors: string[] }[];
+  ignoredFields: string[];
+}
+
+/**
+ * Bulk upsert sprints on (project, sprint number) from a CSV (with header) or NDJSON body.
+ * Invalid rows are skipped and listed in the report; rows are numbered from 1.
+ */
+export async function uploadProjectSprints(
+  token: string,
+  projectId: string | number,
+  body: Blob | string,
+  format: 'csv' | 'ndjson' = 'csv'
+) {
+  return apiFetch<SprintIngestReport>(`/projects/${projectId}/sprints/bulk`, {
+    method: 'POST',
+    headers: { 'Content-Type': format === 'csv' ? 'text/csv' : 'application/x-ndjson' },
+    body,
+  }, token);
+}
+
+export interface SprintStats {
+  sprintNumber: number;
+  name: string | null;
+  startDate: string | null;
+  endDate: string | null;
+  velocity: number | null;
+  velocityRolling: number | null;
+  predictability: number | null;
+  predictabilityRolling: number | null;
+  defectLeakage: number | null;
+  defectLeakageRolling: number | null;
+  completionRatio: number | null;
+  testPassRate: number | null;
+}
+
+/**
+ * Rolling averages, completion ratio, test pass rate and trend slopes per sprint, computed server-side.
+ * @param options last: keep only the most recent N sprints; window: rolling average length (default 3)
+ */
+export async function getProjectSprintStats(
+  token: string,
+  projectId: string | number,
+  options: { last?: number; window?: number } = {}
+) {
+  const params = new URLSearchParams();
+  if (options.last) params.set('last', String(options.last));
+  if (options.window) params.set('window', String(options.window));
+  const query = params.toString();
+  return apiFetch<{
+    projectId: number;
+    window: number;
+    sprints: SprintStats[];
+    trend: { velocity: number | null; predictability: number | null; defectLeakage: number | null };
+  }>(`/projects/${projectId}/sprints/stats${query ? `?${query}` : ''}`, {}, token);
+}
+
+/** start/end query parameters (YYYY-MM-DD) for an optional date range */
+function dateRangeParams(params: URLSearchParams, range?: { start: Date; end: Date }) {
+  if (range) {
+    params.set('start', format(range.start, 'yyyy-MM-dd'));
+    params.set('end', format(range.end, 'yyyy-MM-dd'));
+  }
+  return params;
+}
+
 /**
  * Fetch dashboard data. This endpoint only supports GET requests.
  * @param token Auth token
+ * @param sections Optional dashboard sections to compute (e.g. ['projects', 'dashboard_kpis']); all when omitted
+ * @param range Optional window applied to the dated series (joining, bench start,
+ *              internship start and release dates)
  */
-export async function getDashboard(token: string) {
+export async function getDashboard(token: string, sections?: string[], range?: { start: Date; end: Date }) {
+  const params = new URLSearchParams();
+  if (sections && sections.length) params.set('sections', sections.join(','));
+  const query = dateRangeParams(params, range).toString();
   // Always use GET for /dashboard
-  return apiFetch<DashboardData>('/dashboard', { method: 'GET' }, token);
+  return apiFetch<DashboardData>(`/dashboard${query ? `?${query}` : ''}`, { method: 'GET' }, token);
+}
+
+/** Payload of the dashboard stream's `snapshot` and `sections` events */
+export interface DashboardStreamUpdate {
+  sections: string[];
+  data: Partial<DashboardData> & Record<string, any>;
+}
+
+/**
+ * Open the dashboard Server-Sent Events stream. The server sends a `snapshot` event
+ * on connect and a `sections` event with only the changed sections after each write.
+ * EventSource reconnects on its own and resumes from the last received event id.
+ * @param sections Optional dashboard sections to subscribe to; all when omitted
+ * @param range Optional window, as for getDashboard
+ */
+export function openDashboardStream(sections?: string[], range?: { start: Date; end: Date }) {
+  const params = new URLSearchParams();
+  if (sections && sections.length) params.set('sections', sections.join(','));
+  const query = dateRangeParams(params, range).toString();
+  return new EventSource(`${API_BASE}/dashboard/stream${query ? `?${query}` : ''}`);
+}
+
+export interface DashboardListPage<T = any> {
+  items: T[];
+  nextCursor: string | null;
+  total: number;
+}
+
+/** The `<name>Page` entry /dashboard embeds next to the first page of a list */
+export interface DashboardListRef {
+  total: number;
+  nextCursor: string | null;
+  href: string;
+}
+
+/**
+ * Fetch one page of a list that /dashboard only embeds the first page of
+ * (internsData, upcomingReleases, billable_resources, non_billable_resources_list,
+ * intern_details_list). Pass the returned nextCursor to get the following page.
+ * @param fields Optional projection; the list's default summary fields when omitted
+ * @param range Optional window; pass the one /dashboard was loaded with
+ */
+export async function getDashboardList<T = any>(
+  token: string,
+  name: string,
+  options: { cursor?: string | null; limit?: number; fields?: string[]; range?: { start: Date; end: Date } } = {}
+) {
+  const params = new URLSearchParams();
+  if (options.cursor) params.set('cursor', options.cursor);
+  if (options.limit) params.set('limit', String(options.limit));
+  if (options.fields && options.fields.length) params.set('fields', options.fields.join(','));
+  const query = dateRangeParams(params, options.range).toString();
+  return apiFetch<DashboardListPage<T>>(`/dashboard/lists/${name}${query ? `?${query}` : ''}`, {}, token);
 }
 
 export async function getFinance(token: string) {
@@ -294,8 +542,9 @@ export async function createEmployee(token: string, employeeData: any) {
 }
 
 // Upcoming Releases
-export async function getUpcomingReleases(token: string) {
-  return apiFetch('/api/resources/upcoming-releases', {}, token);
+/** Engagements ending within the next `days` days (server default 62). */
+export async function getUpcomingReleases(token: string, days?: number) {
+  return apiFetch(`/api/resources/upcoming-releases${days !== undefined ? `?days=${days}` : ''}`, {}, token);
 }
 
 // Interns
@@ -304,8 +553,9 @@ export async function getInternResources(token: string) {
 }
 
 // Financial Dashboard
-export async function getFinancialDashboard(token: string) {
-  return apiFetch('/api/resources/financial-overview', {}, token);
+export async function getFinancialDashboard(token: string, range?: { start: Date; end: Date }) {
+  const query = dateRangeParams(new URLSearchParams(), range).toString();
+  return apiFetch(`/api/resources/financial-overview${query ? `?${query}` : ''}`, {}, token);
 }
 
 // Resource Details
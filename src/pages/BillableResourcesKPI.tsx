@@ -1,4 +1,7 @@
 import { useResourceData } from "@/hooks/useResourceData";
+import { useDashboardList } from "@/hooks/useDashboardList";
+import { useGlobalDate } from "@/contexts/GlobalDateContext";
+import { DashboardListFooter } from "@/components/dashboard/DashboardListFooter";
 import { Breadcrumb } from "@/components/layout/Breadcrumb";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
@@ -15,12 +18,16 @@ import { Filter, DollarSign, TrendingUp, Users, Clock } from "lucide-react";
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, LineChart, Line, Area, AreaChart } from 'recharts';
 
 
+// /dashboard sections this page renders
+const PAGE_SECTIONS = ['resources', 'billable', 'interns'];
+
 const BillableResourcesKPI = () => {
   // All analytics and KPIs are sourced only from dashboard API
   const {
     loading,
     error,
-    billable_resources = [],
+    billable_resources: firstBillableResources,
+    billable_resourcesPage,
     billable_resources_count,
     utilization_trend = [],
     client_allocation = [],
@@ -28,7 +35,11 @@ const BillableResourcesKPI = () => {
     total_resources,
     non_billable_resources_count,
     internsData = [],
-  } = useResourceData() || {};
+  } = useResourceData(PAGE_SECTIONS) || {};
+  const { selectedDateRange } = useGlobalDate();
+  // /dashboard embeds the first page only; the rest comes from /dashboard/lists
+  const billableList = useDashboardList('billable_resources', firstBillableResources, billable_resourcesPage, selectedDateRange);
+  const billable_resources = billableList.items;
   if (loading) return <div className="p-8 text-center">Loading...</div>;
   if (error) return <div className="p-8 text-center text-red-500">{error}</div>;
 
@@ -173,6 +184,14 @@ const BillableResourcesKPI = () => {
               <div className="text-center text-gray-500 py-8">No billable resources data available.</div>
             )}
           </div>
+          <DashboardListFooter
+            shown={billableList.items.length}
+            total={billableList.total}
+            hasMore={billableList.hasMore}
+            loadingMore={billableList.loadingMore}
+            error={billableList.error}
+            onLoadMore={billableList.loadMore}
+          />
         </CardContent>
       </Card>
     </div>
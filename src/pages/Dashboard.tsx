@@ -1,8 +1,7 @@
-import { useState, useEffect } from "react";
 import { DashboardKPIs } from "@/components/dashboard/DashboardKPIs";
 import { BreadcrumbNavigation } from "@/components/layout/BreadcrumbNavigation";
 import { useToast } from "@/hooks/use-toast";
-import { useRealtimeData } from "@/hooks/useRealtimeData";
+import { useDashboardSections } from "@/hooks/useDashboardSections";
 import { useGlobalDate } from "@/contexts/GlobalDateContext";
 import { useSidebar } from "@/components/ui/sidebar";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
@@ -12,15 +11,14 @@ import { Button } from "@/components/ui/button";
 import { ExternalLink, Users } from "lucide-react";
 import { useNavigate } from "react-router-dom";
 import { useIsMobile } from "@/hooks/use-mobile";
-import { getDashboard, DashboardData } from "@/lib/api";
+
+// /dashboard sections this page renders; DashboardKPIs subscribes to dashboard_kpis itself
+const DASHBOARD_SECTIONS = ['projects'];
 
 const Dashboard = () => {
-  const [data, setData] = useState<DashboardData | null>(null);
-  const [activeProjects, setActiveProjects] = useState<any[]>([]);
-  const [projectCards, setProjectCards] = useState<any[]>([]);
-  const [dashboardKPIs, setDashboardKPIs] = useState<any>({});
-  const [loading, setLoading] = useState(true);
-  const [error, setError] = useState<string | null>(null);
+  // Kept current by the dashboard stream, which pushes only the sections that changed
+  const { data, loading, error } = useDashboardSections(DASHBOARD_SECTIONS);
+  const projectCards: any[] = data?.projectCards || [];
   const { toast } = useToast();
   const { selectedDateRange } = useGlobalDate();
   const { state } = useSidebar();
@@ -28,26 +26,6 @@ const Dashboard = () => {
   const isMobile = useIsMobile();
   const sidebarCollapsed = state === "collapsed";
 
-  useEffect(() => {
-    const fetchData = async () => {
-      setLoading(true);
-      setError(null);
-      try {
-        const token = localStorage.getItem('token') || '';
-        const dashboard = await getDashboard(token);
-        setData(dashboard);
-        setProjectCards(dashboard.projectCards || []);
-        setActiveProjects(dashboard.active_projects || []);
-        setDashboardKPIs(dashboard.dashboard_kpis || {});
-      } catch (err: any) {
-        setError(err?.message || 'Failed to load dashboard');
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchData();
-  }, [selectedDateRange]);
-
   const getHealthStatusColor = (status: string) => {
     switch (status) {
       case "Green": return "bg-emerald-100 text-emerald-800";
@@ -1,5 +1,8 @@
 import { useEffect, useState } from "react";
 import { useResourceData } from "@/hooks/useResourceData";
+import { useDashboardList } from "@/hooks/useDashboardList";
+import { useGlobalDate } from "@/contexts/GlobalDateContext";
+import { DashboardListFooter } from "@/components/dashboard/DashboardListFooter";
 // import { getDashboard, DashboardData } from "@/lib/api";
 // Custom hook to fetch KPI counts from backend
 const useResourceKPIs = () => {
@@ -28,12 +31,16 @@ import {
 import { Filter, GraduationCap, TrendingUp, Users, Heart } from "lucide-react";
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, LineChart, Line, FunnelChart, Funnel, Cell } from 'recharts';
 
+// /dashboard sections this page renders
+const PAGE_SECTIONS = ['resources', 'interns'];
+
 const InternsKPI = () => {
   // All analytics and KPIs are sourced only from dashboard API
   const {
     loading,
     error,
-    internsData = [],
+    intern_details_list,
+    intern_details_listPage,
     intern_conversion_funnel = [],
     intern_monthly_conversion = [],
     intern_learning_vs_productive = [],
@@ -41,7 +48,11 @@ const InternsKPI = () => {
     billable_resources_count = 0,
     non_billable_resources_count = 0,
     total_resources = 0,
-  } = useResourceData() || {};
+  } = useResourceData(PAGE_SECTIONS) || {};
+  const { selectedDateRange } = useGlobalDate();
+  // /dashboard embeds the first page only; the rest comes from /dashboard/lists
+  const internList = useDashboardList('intern_details_list', intern_details_list, intern_details_listPage, selectedDateRange);
+  const internsData = internList.items;
 
   // Helper functions for status and potential colors
   const getStatusColor = (status: string) => {
@@ -213,6 +224,14 @@ const InternsKPI = () => {
           ) : (
             <div className="text-center text-gray-500 py-8">No intern details data available.</div>
           )}
+          <DashboardListFooter
+            shown={internList.items.length}
+            total={internList.total}
+            hasMore={internList.hasMore}
+            loadingMore={internList.loadingMore}
+            error={internList.error}
+            onLoadMore={internList.loadMore}
+          />
         </CardContent>
       </Card>
     </div>
@@ -1,4 +1,7 @@
 import { useResourceData } from "@/hooks/useResourceData";
+import { useDashboardList } from "@/hooks/useDashboardList";
+import { useGlobalDate } from "@/contexts/GlobalDateContext";
+import { DashboardListFooter } from "@/components/dashboard/DashboardListFooter";
 import { Breadcrumb } from "@/components/layout/Breadcrumb";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
@@ -15,6 +18,9 @@ import { Filter, AlertTriangle, TrendingDown, DollarSign, Users, Clock } from "l
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, PieChart, Pie, Cell, LineChart, Line } from 'recharts';
 
 
+// /dashboard sections this page renders
+const PAGE_SECTIONS = ['resources', 'bench'];
+
 const NonBillableResourcesKPI = () => {
   // All analytics and KPIs are sourced only from dashboard API
   const {
@@ -28,8 +34,15 @@ const NonBillableResourcesKPI = () => {
     bench_aging_data = [],
     weekly_movement_data = [],
     non_billable_location_distribution = [],
-    non_billable_resources_list = [],
-  } = useResourceData() || {};
+    non_billable_resources_list: firstNonBillableResources,
+    non_billable_resources_listPage,
+  } = useResourceData(PAGE_SECTIONS) || {};
+  const { selectedDateRange } = useGlobalDate();
+  // /dashboard embeds the first page only; the rest comes from /dashboard/lists
+  const nonBillableList = useDashboardList(
+    'non_billable_resources_list', firstNonBillableResources, non_billable_resources_listPage, selectedDateRange
+  );
+  const non_billable_resources_list = nonBillableList.items;
 
   if (loading) return <div className="p-8 text-center">Loading...</div>;
   if (error) return <div className="p-8 text-center text-red-500">{error}</div>;
@@ -303,6 +316,14 @@ const NonBillableResourcesKPI = () => {
           ) : (
             <div className="text-center text-gray-500 py-8">No non-billable resources data available.</div>
           )}
+          <DashboardListFooter
+            shown={nonBillableList.items.length}
+            total={nonBillableList.total}
+            hasMore={nonBillableList.hasMore}
+            loadingMore={nonBillableList.loadingMore}
+            error={nonBillableList.error}
+            onLoadMore={nonBillableList.loadMore}
+          />
         </CardContent>
       </Card>
     </div>
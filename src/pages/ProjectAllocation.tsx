@@ -9,7 +9,7 @@ import { useToast } from "@/hooks/use-toast";
 import { X, Users } from "lucide-react";
 import { Link } from "react-router-dom";
 import { Breadcrumb } from "@/components/layout/Breadcrumb";
-import { getProjects, getResources } from "@/lib/api";
+import { getAllProjects, getAllResources } from "@/lib/api";
 
 const ProjectAllocation = () => {
   const { toast } = useToast();
@@ -50,9 +50,9 @@ const ProjectAllocation = () => {
       setError(null);
       try {
         const token = localStorage.getItem('token') || '';
-        const projectsData = await getProjects(token) as { projects?: any[] } | any[];
+        const projectsData = await getAllProjects(token) as { projects?: any[] } | any[];
         setProjects(Array.isArray(projectsData) ? projectsData : (projectsData.projects || []));
-        const resourcesData = await getResources(token) as { resources?: any[] } | any[];
+        const resourcesData = await getAllResources(token) as { resources?: any[] } | any[];
         setResources(Array.isArray(resourcesData) ? resourcesData : (resourcesData.resources || []));
       } catch (err: any) {
         setError(err?.message || 'Failed to fetch allocation data');
@@ -32,13 +32,7 @@ import { AddSprintDataModal } from "@/components/dashboard/AddSprintDataModal";
 import { EditProjectModal } from "@/components/dashboard/EditProjectModal";
 import { DeliveryMetricsFilter } from "@/components/dashboard/DeliveryMetricsFilter";
 import { TeamMemberCard } from "@/components/dashboard/TeamMemberCard";
-import {
-  getProjectDetails,
-  getProjectMilestones,
-  getProjectRisks,
-  getProjectTeamMembers,
-  getProjectEngineeringMetrics,
-} from "@/lib/api";
+import { getProjectDetails } from "@/lib/api";
 
 const ProjectDetails = () => {
   const { projectId } = useParams();
@@ -63,34 +57,18 @@ const ProjectDetails = () => {
     setError(null);
     try {
       const token = localStorage.getItem("token") || "";
-      const [
-        projectData,
-        milestonesData,
-        risksData,
-        teamMembersData,
-        engineeringMetricsData,
-        sprintsData,
-      ] = await Promise.all([
-        getProjectDetails(token, projectId),
-        getProjectMilestones(token, projectId),
-        getProjectRisks(token, projectId),
-        getProjectTeamMembers(token, projectId),
-        getProjectEngineeringMetrics(token, projectId),
-        // Always fetch sprints from backend
-        projectId
-          ? (await import("@/lib/api")).getProjectSprints(token, projectId)
-          : { sprints: [] },
-      ]);
-      // Merge all related data into the project object
+      // The details document already embeds milestones, risks, team members,
+      // engineering metrics and sprints
+      const projectData = await getProjectDetails(token, projectId);
+      const details = (projectData as any)?.project || {};
       const mergedProject = {
-        ...((projectData as any)?.project || {}),
-        milestones: (milestonesData as any)?.milestones || [],
-        risks: (risksData as any)?.risks || [],
-        teamMembers: (teamMembersData as any)?.teamMembers || [],
-        engineeringMetrics:
-          (engineeringMetricsData as any)?.engineeringMetrics || {},
-        riskCount: ((risksData as any)?.risks || []).length,
-        sprints: (sprintsData as any)?.sprints || [],
+        ...details,
+        milestones: details.milestones || [],
+        risks: details.risks || [],
+        teamMembers: details.teamMembers || [],
+        engineeringMetrics: details.engineeringMetrics || {},
+        riskCount: (details.risks || []).length,
+        sprints: details.sprints || [],
       };
       setProject(mergedProject);
       setMilestones(mergedProject.milestones);
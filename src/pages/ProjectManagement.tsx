@@ -6,7 +6,7 @@ import { ResourceOverviewCard } from "@/components/dashboard/ResourceOverviewCar
 import { BreadcrumbNavigation } from "@/components/layout/BreadcrumbNavigation";
 import { Link } from "react-router-dom";
 import { Plus, FolderPlus } from "lucide-react";
-import { getProjects } from "@/lib/api";
+import { getAllProjects } from "@/lib/api";
 
 const ProjectManagement = () => {
   const [projects, setProjects] = useState<any[]>([]);
@@ -41,7 +41,7 @@ const ProjectManagement = () => {
       setError(null);
       try {
         const token = localStorage.getItem('token') || '';
-        const data = await getProjects(token) as { projects?: any[] } | any[];
+        const data = await getAllProjects(token) as { projects?: any[] } | any[];
         setProjects(Array.isArray(data) ? data : (data.projects || []));
       } catch (err: any) {
         setError(err?.message || 'Failed to fetch projects');
@@ -121,9 +121,9 @@ const Projects = () => {
     try {
       // TODO: Replace with real auth token logic
       const token = localStorage.getItem('token') || '';
-      console.log('Calling getProjects API with token:', token);
-      const data = await import("@/lib/api").then(m => m.getProjects(token));
-      console.log('getProjects API response:', data);
+      console.log('Calling getAllProjects API with token:', token);
+      const data = await import("@/lib/api").then(m => m.getAllProjects(token));
+      console.log('getAllProjects API response:', data);
       // If backend returns { projects: [...] }, use data.projects
       const projectArray = Array.isArray(data) ? data : (data && typeof data === 'object' && 'projects' in data ? data.projects : []);
       setProjects(normalizeProjects(Array.isArray(projectArray) ? projectArray : []));
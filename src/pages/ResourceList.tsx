@@ -10,7 +10,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@
 import { Eye, Search, MapPin, Mail } from "lucide-react";
 import { useIsMobile } from "@/hooks/use-mobile";
 import { ResourceData } from "@/types/resource";
-import { getResources } from "@/lib/api";
+import { getAllResources } from "@/lib/api";
 
 const ResourceList = () => {
   const { filterType, filterValue } = useParams();
@@ -33,7 +33,7 @@ const ResourceList = () => {
       setError(null);
       try {
         const token = localStorage.getItem('token') || '';
-        const data = await getResources(token) as { resources?: ResourceData[] } | ResourceData[];
+        const data = await getAllResources(token) as { resources?: ResourceData[] } | ResourceData[];
         const resourcesList = Array.isArray(data) ? data : (data.resources || []);
         setResources(resourcesList);
       } catch (err: any) {
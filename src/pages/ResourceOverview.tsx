@@ -5,6 +5,9 @@ import { Link } from "react-router-dom";
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
 import { useResourceData } from "@/hooks/useResourceData";
 
+// /dashboard sections this page renders
+const PAGE_SECTIONS = ['resources', 'breakdowns', 'bench', 'releases', 'interns'];
+
 const ResourceOverview = () => {
   // All analytics and KPIs are sourced only from dashboard API
   const {
@@ -23,7 +26,7 @@ const ResourceOverview = () => {
     engagementData = [],
     upcomingReleases = [],
     internsData = []
-  } = useResourceData() || {};
+  } = useResourceData(PAGE_SECTIONS) || {};
 
   // Debug: log all received data to help diagnose empty UI
   console.log('ResourceOverview data:', {
@@ -23,7 +23,7 @@ import {
   Award,
   DollarSign
 } from "lucide-react";
-import { getResource, getProjects, getUpcomingReleases } from "@/lib/api";
+import { getResource, getAllProjects, getUpcomingReleases } from "@/lib/api";
 const ResourceView = () => {
   // Helper to calculate years at company from joiningDate
   const getYearsAtCompany = (joiningDate?: string) => {
@@ -108,7 +108,7 @@ const { id: employeeId } = useParams();
       setProjectsError(null);
       try {
         const token = localStorage.getItem('token') || '';
-        const result = await getProjects(token, { employeeId }) as { projects?: any[] } | any[];
+        const result = await getAllProjects(token) as { projects?: any[] } | any[];
         if (Array.isArray(result)) {
           setProjects(result);
         } else if (result && Array.isArray(result.projects)) {
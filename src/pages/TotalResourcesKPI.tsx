@@ -18,6 +18,9 @@ import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContaine
 
 
 
+// /dashboard sections this page renders
+const PAGE_SECTIONS = ['resources', 'breakdowns'];
+
 const TotalResourcesKPI = () => {
   // Use dashboard API for all analytics and KPIs
   const {
@@ -30,7 +33,7 @@ const TotalResourcesKPI = () => {
     departmentData = [],
     designationData = [],
     locationData = [],
-  } = useResourceData() || {};
+  } = useResourceData(PAGE_SECTIONS) || {};
 
   const COLORS = ['#0088FE', '#00C49F', '#FFBB28', '#FF8042', '#8884D8', '#82CA9D', '#FFC658'];
 